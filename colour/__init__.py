@@ -70,28 +70,6 @@ from .colorimetry import (
     sd_constant, sd_gaussian, sd_mesopic_luminous_efficiency_function,
     sd_multi_led, sd_ones, sd_single_led, sd_zeros, sd_to_XYZ,
     wavelength_to_XYZ, whiteness, yellowness)
-from .blindness import (
-    CVD_MATRICES_MACHADO2010, anomalous_trichromacy_cmfs_Machado2009,
-    anomalous_trichromacy_matrix_Machado2009, cvd_matrix_Machado2009)
-from .appearance import (
-    ATD95_Specification, CAM16_Specification, CAM16_VIEWING_CONDITIONS,
-    CAM16_to_XYZ, CIECAM02_Specification, CIECAM02_VIEWING_CONDITIONS,
-    CIECAM02_to_XYZ, HUNT_VIEWING_CONDITIONS, Hunt_Specification,
-    LLAB_Specification, LLAB_VIEWING_CONDITIONS, Nayatani95_Specification,
-    RLAB_D_FACTOR, RLAB_Specification, RLAB_VIEWING_CONDITIONS, XYZ_to_ATD95,
-    XYZ_to_CAM16, XYZ_to_CIECAM02, XYZ_to_Hunt, XYZ_to_LLAB, XYZ_to_Nayatani95,
-    XYZ_to_RLAB)
-from .difference import DELTA_E_METHODS, delta_E
-from .characterisation import (
-    CAMERAS_RGB_SPECTRAL_SENSITIVITIES, COLOURCHECKERS, COLOURCHECKERS_SDS,
-    DISPLAYS_RGB_PRIMARIES, POLYNOMIAL_EXPANSION_METHODS, polynomial_expansion,
-    COLOUR_CORRECTION_MATRIX_METHODS, colour_correction_matrix,
-    COLOUR_CORRECTION_METHODS, colour_correction)
-from .io import (LUT1D, LUT2D, LUT3D, LUTSequence,
-                 SpectralDistribution_IESTM2714, read_image, read_LUT,
-                 read_sds_from_csv_file, read_sds_from_xrite_file,
-                 read_spectral_data_from_csv_file, write_image, write_LUT,
-                 write_sds_to_csv_file)
 from .models import (
     CAM02LCD_to_JMh_CIECAM02, CAM02SCD_to_JMh_CIECAM02,
     CAM02UCS_to_JMh_CIECAM02, CAM16LCD_to_JMh_CAM16, CAM16SCD_to_JMh_CAM16,
@@ -122,27 +100,73 @@ from .models import (
     ootf_reverse, primaries_whitepoint, sd_to_aces_relative_exposure_values,
     sRGB_to_XYZ, xyY_to_XYZ, xyY_to_xy, xy_to_Luv_uv, xy_to_UCS_uv, xy_to_XYZ,
     xy_to_xyY)
-from .corresponding import (BRENEMAN_EXPERIMENTS,
-                            BRENEMAN_EXPERIMENTS_PRIMARIES_CHROMATICITIES,
-                            CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS,
-                            corresponding_chromaticities_prediction)
-from .phenomena import (rayleigh_scattering, scattering_cross_section,
-                        sd_rayleigh_scattering)
-from .notation import (MUNSELL_COLOURS, MUNSELL_VALUE_METHODS,
-                       munsell_colour_to_xyY, munsell_value,
-                       xyY_to_munsell_colour)
-from .quality import colour_quality_scale, colour_rendering_index
-from .recovery import XYZ_TO_SD_METHODS, XYZ_to_sd
 from .temperature import (CCT_TO_UV_METHODS, CCT_TO_XY_METHODS, CCT_to_uv,
                           CCT_to_xy, UV_TO_CCT_METHODS, XY_TO_CCT_METHODS,
                           uv_to_CCT, xy_to_CCT)
-from .volume import (
-    ILLUMINANTS_OPTIMAL_COLOUR_STIMULI, RGB_colourspace_limits,
-    RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
-    RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
-    RGB_colourspace_volume_MonteCarlo,
-    RGB_colourspace_volume_coverage_MonteCarlo, is_within_macadam_limits,
-    is_within_mesh_volume, is_within_pointer_gamut, is_within_visible_spectrum)
+
+# Sub-packages whose public objects are imported on first access, see the
+# "colour" class below.
+_LAZY_IMPORTS = {
+    'colour.blindness': [
+        'CVD_MATRICES_MACHADO2010',
+        'anomalous_trichromacy_cmfs_Machado2009',
+        'anomalous_trichromacy_matrix_Machado2009',
+        'cvd_matrix_Machado2009'
+    ],
+    'colour.appearance': [
+        'ATD95_Specification', 'CAM16_Specification',
+        'CAM16_VIEWING_CONDITIONS', 'CAM16_to_XYZ',
+        'CIECAM02_Specification', 'CIECAM02_VIEWING_CONDITIONS',
+        'CIECAM02_to_XYZ', 'HUNT_VIEWING_CONDITIONS',
+        'Hunt_Specification', 'LLAB_Specification',
+        'LLAB_VIEWING_CONDITIONS', 'Nayatani95_Specification',
+        'RLAB_D_FACTOR', 'RLAB_Specification',
+        'RLAB_VIEWING_CONDITIONS', 'XYZ_to_ATD95', 'XYZ_to_CAM16',
+        'XYZ_to_CIECAM02', 'XYZ_to_Hunt', 'XYZ_to_LLAB',
+        'XYZ_to_Nayatani95', 'XYZ_to_RLAB'
+    ],
+    'colour.difference': ['DELTA_E_METHODS', 'delta_E'],
+    'colour.characterisation': [
+        'CAMERAS_RGB_SPECTRAL_SENSITIVITIES', 'COLOURCHECKERS',
+        'COLOURCHECKERS_SDS', 'DISPLAYS_RGB_PRIMARIES',
+        'POLYNOMIAL_EXPANSION_METHODS', 'polynomial_expansion',
+        'COLOUR_CORRECTION_MATRIX_METHODS', 'colour_correction_matrix',
+        'COLOUR_CORRECTION_METHODS', 'colour_correction'
+    ],
+    'colour.io': [
+        'LUT1D', 'LUT2D', 'LUT3D', 'LUTSequence',
+        'SpectralDistribution_IESTM2714', 'read_image', 'read_LUT',
+        'read_sds_from_csv_file', 'read_sds_from_xrite_file',
+        'read_spectral_data_from_csv_file', 'write_image', 'write_LUT',
+        'write_sds_to_csv_file'
+    ],
+    'colour.corresponding': [
+        'BRENEMAN_EXPERIMENTS',
+        'BRENEMAN_EXPERIMENTS_PRIMARIES_CHROMATICITIES',
+        'CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS',
+        'corresponding_chromaticities_prediction'
+    ],
+    'colour.phenomena': [
+        'rayleigh_scattering', 'scattering_cross_section',
+        'sd_rayleigh_scattering'
+    ],
+    'colour.notation': [
+        'MUNSELL_COLOURS', 'MUNSELL_VALUE_METHODS',
+        'munsell_colour_to_xyY', 'munsell_value',
+        'xyY_to_munsell_colour'
+    ],
+    'colour.quality': ['colour_quality_scale', 'colour_rendering_index'],
+    'colour.recovery': ['XYZ_TO_SD_METHODS', 'XYZ_to_sd'],
+    'colour.volume': [
+        'ILLUMINANTS_OPTIMAL_COLOUR_STIMULI', 'RGB_colourspace_limits',
+        'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
+        'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
+        'RGB_colourspace_volume_MonteCarlo',
+        'RGB_colourspace_volume_coverage_MonteCarlo',
+        'is_within_macadam_limits', 'is_within_mesh_volume',
+        'is_within_pointer_gamut', 'is_within_visible_spectrum'
+    ],
+}
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -184,34 +208,11 @@ __all__ += [
     'sd_zeros', 'sd_single_led', 'sd_to_XYZ', 'wavelength_to_XYZ', 'whiteness',
     'yellowness'
 ]
-__all__ += [
-    'CVD_MATRICES_MACHADO2010', 'anomalous_trichromacy_cmfs_Machado2009',
-    'anomalous_trichromacy_matrix_Machado2009', 'cvd_matrix_Machado2009'
-]
-__all__ += [
-    'ATD95_Specification', 'CAM16_Specification', 'CAM16_VIEWING_CONDITIONS',
-    'CAM16_to_XYZ', 'CIECAM02_Specification', 'CIECAM02_VIEWING_CONDITIONS',
-    'CIECAM02_to_XYZ', 'HUNT_VIEWING_CONDITIONS', 'Hunt_Specification',
-    'LLAB_Specification', 'LLAB_VIEWING_CONDITIONS',
-    'Nayatani95_Specification', 'RLAB_D_FACTOR', 'RLAB_Specification',
-    'RLAB_VIEWING_CONDITIONS', 'XYZ_to_ATD95', 'XYZ_to_CAM16',
-    'XYZ_to_CIECAM02', 'XYZ_to_Hunt', 'XYZ_to_LLAB', 'XYZ_to_Nayatani95',
-    'XYZ_to_RLAB'
-]
-__all__ += ['DELTA_E_METHODS', 'delta_E']
-__all__ += [
-    'CAMERAS_RGB_SPECTRAL_SENSITIVITIES', 'COLOURCHECKERS',
-    'COLOURCHECKERS_SDS', 'DISPLAYS_RGB_PRIMARIES',
-    'POLYNOMIAL_EXPANSION_METHODS', 'polynomial_expansion',
-    'COLOUR_CORRECTION_MATRIX_METHODS', 'colour_correction_matrix',
-    'COLOUR_CORRECTION_METHODS', 'colour_correction'
-]
-__all__ += [
-    'LUT1D', 'LUT2D', 'LUT3D', 'LUTSequence', 'SpectralDistribution_IESTM2714',
-    'read_image', 'read_LUT', 'read_sds_from_csv_file',
-    'read_sds_from_xrite_file', 'read_spectral_data_from_csv_file',
-    'write_image', 'write_LUT', 'write_sds_to_csv_file'
-]
+__all__ += _LAZY_IMPORTS['colour.blindness']
+__all__ += _LAZY_IMPORTS['colour.appearance']
+__all__ += _LAZY_IMPORTS['colour.difference']
+__all__ += _LAZY_IMPORTS['colour.characterisation']
+__all__ += _LAZY_IMPORTS['colour.io']
 __all__ += [
     'CAM02LCD_to_JMh_CIECAM02', 'CAM02SCD_to_JMh_CIECAM02',
     'CAM02UCS_to_JMh_CIECAM02', 'CAM16LCD_to_JMh_CAM16',
@@ -246,33 +247,16 @@ __all__ += [
     'sd_to_aces_relative_exposure_values', 'sRGB_to_XYZ', 'xyY_to_XYZ',
     'xyY_to_xy', 'xy_to_Luv_uv', 'xy_to_UCS_uv', 'xy_to_XYZ', 'xy_to_xyY'
 ]
-__all__ += [
-    'BRENEMAN_EXPERIMENTS', 'BRENEMAN_EXPERIMENTS_PRIMARIES_CHROMATICITIES',
-    'CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS',
-    'corresponding_chromaticities_prediction'
-]
-__all__ += [
-    'rayleigh_scattering', 'scattering_cross_section', 'sd_rayleigh_scattering'
-]
-__all__ += [
-    'MUNSELL_COLOURS', 'MUNSELL_VALUE_METHODS', 'munsell_colour_to_xyY',
-    'munsell_value', 'xyY_to_munsell_colour'
-]
-__all__ += ['colour_quality_scale', 'colour_rendering_index']
-__all__ += ['XYZ_TO_SD_METHODS', 'XYZ_to_sd']
+__all__ += _LAZY_IMPORTS['colour.corresponding']
+__all__ += _LAZY_IMPORTS['colour.phenomena']
+__all__ += _LAZY_IMPORTS['colour.notation']
+__all__ += _LAZY_IMPORTS['colour.quality']
+__all__ += _LAZY_IMPORTS['colour.recovery']
 __all__ += [
     'CCT_TO_UV_METHODS', 'CCT_TO_XY_METHODS', 'CCT_to_uv', 'CCT_to_xy',
     'UV_TO_CCT_METHODS', 'XY_TO_CCT_METHODS', 'uv_to_CCT', 'xy_to_CCT'
 ]
-__all__ += [
-    'ILLUMINANTS_OPTIMAL_COLOUR_STIMULI', 'RGB_colourspace_limits',
-    'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
-    'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
-    'RGB_colourspace_volume_MonteCarlo',
-    'RGB_colourspace_volume_coverage_MonteCarlo', 'is_within_macadam_limits',
-    'is_within_mesh_volume', 'is_within_pointer_gamut',
-    'is_within_visible_spectrum'
-]
+__all__ += _LAZY_IMPORTS['colour.volume']
 __application_name__ = 'Colour'
 
 __major_version__ = '0'
@@ -1722,6 +1706,21 @@ def _setup_api_changes():
     API_CHANGES.pop('Renamed')
 
 
+def _setup_lazy_imports():
+    """
+    Returns the mapping of the lazily imported attribute names to the
+    sub-packages they are imported from.
+    """
+
+    lazy_imports = {}
+    for subpackage, attributes in _LAZY_IMPORTS.items():
+        lazy_imports[subpackage.split('.')[-1]] = subpackage
+        for attribute in attributes:
+            lazy_imports[attribute] = subpackage
+
+    return lazy_imports
+
+
 if not is_documentation_building():
     _setup_api_changes()
 
@@ -1733,6 +1732,17 @@ if not is_documentation_building():
     del is_documentation_building
     del _setup_api_changes
 
-    sys.modules['colour'] = colour(sys.modules['colour'], API_CHANGES)
+    sys.modules['colour'] = colour(sys.modules['colour'], API_CHANGES,
+                                   _setup_lazy_imports())
 
     del sys
+    del _setup_lazy_imports
+else:
+    from importlib import import_module
+
+    for _subpackage, _attributes in _LAZY_IMPORTS.items():
+        _module = import_module(_subpackage)
+        for _attribute in _attributes:
+            globals()[_attribute] = getattr(_module, _attribute)
+
+    del import_module, _subpackage, _attributes, _module, _attribute
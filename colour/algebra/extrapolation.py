@@ -73,6 +73,8 @@ class Extrapolator(object):
     Notes
     -----
     -   The interpolator must define *x* and *y* attributes.
+    -   An interpolator with a 2-D *y* attribute of shape (n, m) is
+        extrapolated column-wise.
 
     References
     ----------
@@ -297,13 +299,17 @@ class Extrapolator(object):
         xi = self._interpolator.x
         yi = self._interpolator.y
 
-        y = np.empty_like(x)
+        y = np.empty(x.shape + yi.shape[1:], dtype=x.dtype)
 
         if self._method == 'linear':
-            y[x < xi[0]] = (yi[0] + (x[x < xi[0]] - xi[0]) * (yi[1] - yi[0]) /
+            x_l, x_r = x[x < xi[0]], x[x > xi[-1]]
+            if yi.ndim > 1:
+                x_l, x_r = x_l[..., np.newaxis], x_r[..., np.newaxis]
+
+            y[x < xi[0]] = (yi[0] + (x_l - xi[0]) * (yi[1] - yi[0]) /
                             (xi[1] - xi[0]))
-            y[x > xi[-1]] = (yi[-1] + (x[x > xi[-1]] - xi[-1]) *
-                             (yi[-1] - yi[-2]) / (xi[-1] - xi[-2]))
+            y[x > xi[-1]] = (yi[-1] + (x_r - xi[-1]) * (yi[-1] - yi[-2]) /
+                             (xi[-1] - xi[-2]))
         elif self._method == 'constant':
             y[x < xi[0]] = yi[0]
             y[x > xi[-1]] = yi[-1]
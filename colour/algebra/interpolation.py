@@ -60,13 +60,14 @@ from __future__ import division, unicode_literals
 import itertools
 import numpy as np
 import scipy.interpolate
+import scipy.sparse
 from collections import OrderedDict, Mapping
 from six.moves import reduce
 
 from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
 from colour.utilities import (CaseInsensitiveMapping, as_float_array, as_float,
                               closest_indexes, interval, is_integer,
-                              is_numeric, runtime_warning, tsplit)
+                              is_numeric, runtime_warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -307,6 +308,12 @@ class KernelInterpolator(object):
     -------
     __call__
 
+    Notes
+    -----
+    -   The kernel weights of the last evaluated points are stored as a sparse
+        banded matrix and reused when evaluating the same points again, e.g.
+        when resampling successive :math:`y` variables to the same grid.
+
     References
     ----------
     :cite:`Burger2009b`, :cite:`Wikipedia2005b`
@@ -353,6 +360,8 @@ class KernelInterpolator(object):
                  kernel_args=None,
                  padding_args=None,
                  dtype=DEFAULT_FLOAT_DTYPE):
+        self._weights = None
+
         self._x_p = None
         self._y_p = None
 
@@ -406,6 +415,8 @@ class KernelInterpolator(object):
 
             value_interval = interval(value)
 
+            self._weights = None
+
             if value_interval.size != 1:
                 runtime_warning(('"x" independent variable is not uniform, '
                                  'unpredictable results may occur!'))
@@ -527,6 +538,7 @@ class KernelInterpolator(object):
                     'kernel', value))
 
             self._kernel = value
+            self._weights = None
 
     @property
     def kernel_args(self):
@@ -558,6 +570,7 @@ class KernelInterpolator(object):
             ).format('kernel_args', value)
 
             self._kernel_args = value
+            self._weights = None
 
     @property
     def padding_args(self):
@@ -633,6 +646,28 @@ class KernelInterpolator(object):
         self._validate_dimensions()
         self._validate_interpolation_range(x)
 
+        return self._kernel_weights(x).dot(self._y_p)
+
+    def _kernel_weights(self, x):
+        """
+        Returns the sparse banded matrix of kernel weights mapping the padded
+        dependent :math:`y` variable to the interpolated values at given
+        points.
+
+        Parameters
+        ----------
+        x : ndarray
+            Points to evaluate the interpolant at.
+
+        Returns
+        -------
+        csr_matrix
+            Kernel weights matrix.
+        """
+
+        if self._weights is not None and np.array_equal(self._weights[0], x):
+            return self._weights[1]
+
         x_interval = interval(self._x)[0]
         x_f = np.floor(x / x_interval)
 
@@ -643,11 +678,19 @@ class KernelInterpolator(object):
         windows = np.clip(windows, clip_l, clip_h) - clip_l
         windows = np.around(windows).astype(DEFAULT_INT_DTYPE)
 
-        return np.sum(
-            self._y_p[windows] *
-            self._kernel(x[:, np.newaxis] / x_interval - windows -
-                         min(self._x_p) / x_interval, **self._kernel_args),
-            axis=-1)
+        kernel = self._kernel(x[:, np.newaxis] / x_interval - windows -
+                              min(self._x_p) / x_interval, **self._kernel_args)
+
+        # Duplicate indexes produced by the clipping are summed.
+        weights = scipy.sparse.csr_matrix(
+            (np.ravel(kernel),
+             (np.repeat(np.arange(len(x)), windows.shape[-1]),
+              np.ravel(windows))),
+            shape=(len(x), len(self._x_p)))
+
+        self._weights = (np.copy(x), weights)
+
+        return weights
 
     def _validate_dimensions(self):
         """
@@ -731,6 +774,12 @@ class LinearInterpolator(object):
     Notes
     -----
     -   This class is a wrapper around *numpy.interp* definition.
+    -   A 2-D :math:`y` variable of shape (n, m) is interpolated column-wise,
+        i.e. as :math:`m` functions sharing the same :math:`x` variable.
+    -   When the :math:`x` variable is uniformly spaced and increasing, the
+        interval index of each point is computed directly instead of being
+        searched for and the evaluation happens in the interpolator data type,
+        e.g. *np.float32*.
 
     Examples
     --------
@@ -752,6 +801,7 @@ class LinearInterpolator(object):
 
     def __init__(self, x, y, dtype=DEFAULT_FLOAT_DTYPE):
         self._x = None
+        self._x_interval = None
         self._y = None
         self._dtype = dtype
 
@@ -784,12 +834,22 @@ class LinearInterpolator(object):
         Setter for the **self.x** property.
         """
 
+        self._x_interval = None
+
         if value is not None:
             value = np.atleast_1d(value).astype(self._dtype)
 
             assert value.ndim == 1, (
                 '"x" independent variable must have exactly one dimension!')
 
+            # The independent variable is commonly generated with
+            # :func:`np.linspace` and its spacings are only equal within
+            # floating point precision.
+            if len(value) > 1 and value[-1] > value[0]:
+                x_interval = (value[-1] - value[0]) / (len(value) - 1)
+                if np.allclose(np.diff(value), x_interval, rtol=1e-7, atol=0):
+                    self._x_interval = x_interval
+
         self._x = value
 
     @property
@@ -821,8 +881,8 @@ class LinearInterpolator(object):
         if value is not None:
             value = np.atleast_1d(value).astype(self._dtype)
 
-            assert value.ndim == 1, (
-                '"y" dependent variable must have exactly one dimension!')
+            assert value.ndim in (1, 2), (
+                '"y" dependent variable must have one or two dimensions!')
 
         self._y = value
 
@@ -866,7 +926,22 @@ class LinearInterpolator(object):
         self._validate_dimensions()
         self._validate_interpolation_range(x)
 
-        return np.interp(x, self._x, self._y)
+        if self._x_interval is not None:
+            X = (x - self._x[0]) / self._x_interval
+            i = np.clip(
+                np.nan_to_num(np.floor(X)).astype(DEFAULT_INT_DTYPE), 0,
+                len(self._x) - 2)
+            X = X - i.astype(self._dtype)
+        elif self._y.ndim == 1:
+            return np.interp(x, self._x, self._y)
+        else:
+            i = np.clip(np.searchsorted(self._x, x) - 1, 0, len(self._x) - 2)
+            X = (x - self._x[i]) / (self._x[i + 1] - self._x[i])
+
+        if self._y.ndim > 1:
+            X = X[..., np.newaxis]
+
+        return self._y[i] + X * (self._y[i + 1] - self._y[i])
 
     def _validate_dimensions(self):
         """
@@ -926,6 +1001,8 @@ class SpragueInterpolator(object):
     -----
     -   The minimum number :math:`k` of data points required along the
         interpolation axis is :math:`k=6`.
+    -   A 2-D :math:`y` variable of shape (n, m) is interpolated column-wise,
+        i.e. as :math:`m` functions sharing the same :math:`x` variable.
 
     References
     ----------
@@ -968,6 +1045,7 @@ class SpragueInterpolator(object):
     def __init__(self, x, y, dtype=DEFAULT_FLOAT_DTYPE):
         self._xp = None
         self._yp = None
+        self._coefficients = None
 
         self._x = None
         self._y = None
@@ -1048,27 +1126,20 @@ class SpragueInterpolator(object):
         if value is not None:
             value = np.atleast_1d(value).astype(self._dtype)
 
-            assert value.ndim == 1, (
-                '"y" dependent variable must have exactly one dimension!')
+            assert value.ndim in (1, 2), (
+                '"y" dependent variable must have one or two dimensions!')
 
             assert len(value) >= 6, (
                 '"y" dependent variable values count must be normalised to'
                 'domain [6:]!')
 
-            yp1 = np.ravel((np.dot(self.SPRAGUE_C_COEFFICIENTS[0],
-                                   np.array(value[0:6]).reshape(
-                                       (6, 1)))) / 209)[0]
-            yp2 = np.ravel((np.dot(self.SPRAGUE_C_COEFFICIENTS[1],
-                                   np.array(value[0:6]).reshape(
-                                       (6, 1)))) / 209)[0]
-            yp3 = np.ravel((np.dot(self.SPRAGUE_C_COEFFICIENTS[2],
-                                   np.array(value[-6:]).reshape(
-                                       (6, 1)))) / 209)[0]
-            yp4 = np.ravel((np.dot(self.SPRAGUE_C_COEFFICIENTS[3],
-                                   np.array(value[-6:]).reshape(
-                                       (6, 1)))) / 209)[0]
-
-            self._yp = np.concatenate(((yp1, yp2), value, (yp3, yp4)))
+            yp_1_2 = np.dot(self.SPRAGUE_C_COEFFICIENTS[0:2],
+                            value[0:6]) / 209
+            yp_3_4 = np.dot(self.SPRAGUE_C_COEFFICIENTS[2:4],
+                            value[-6:]) / 209
+
+            self._yp = np.concatenate((yp_1_2, value, yp_3_4))
+            self._coefficients = self._polynomial_coefficients(self._yp)
 
         self._y = value
 
@@ -1112,25 +1183,60 @@ class SpragueInterpolator(object):
         i = np.searchsorted(self._xp, x) - 1
         X = (x - self._xp[i]) / (self._xp[i + 1] - self._xp[i])
 
-        r = self._yp
+        if self._yp.ndim > 1:
+            X = X[..., np.newaxis]
 
-        a0p = r[i]
-        a1p = ((2 * r[i - 2] - 16 * r[i - 1] + 16 * r[i + 1] -
-                2 * r[i + 2]) / 24)  # yapf: disable
-        a2p = ((-r[i - 2] + 16 * r[i - 1] - 30 * r[i] + 16 * r[i + 1] -
-                r[i + 2]) / 24)  # yapf: disable
-        a3p = ((-9 * r[i - 2] + 39 * r[i - 1] - 70 * r[i] + 66 * r[i + 1] -
-                33 * r[i + 2] + 7 * r[i + 3]) / 24)
-        a4p = ((13 * r[i - 2] - 64 * r[i - 1] + 126 * r[i] - 124 * r[i + 1] +
-                61 * r[i + 2] - 12 * r[i + 3]) / 24)
-        a5p = ((-5 * r[i - 2] + 25 * r[i - 1] - 50 * r[i] + 50 * r[i + 1] -
-                25 * r[i + 2] + 5 * r[i + 3]) / 24)
+        a0p, a1p, a2p, a3p, a4p, a5p = self._coefficients[:, i]
 
         y = (a0p + a1p * X + a2p * X ** 2 + a3p * X ** 3 + a4p * X ** 4 +
              a5p * X ** 5)
 
         return y
 
+    @staticmethod
+    def _polynomial_coefficients(r):
+        """
+        Computes the fifth-order polynomial coefficients of every interval of
+        given padded dependent :math:`y` variable.
+
+        Parameters
+        ----------
+        r : ndarray
+            Dependent :math:`y` variable padded with the boundaries extra
+            points.
+
+        Returns
+        -------
+        ndarray
+            Polynomial coefficients :math:`a_0` to :math:`a_5` stacked along
+            the first axis, the interval at index :math:`i` starts at
+            :math:`r_i`.
+
+        Notes
+        -----
+        -   The coefficients are computed once per :math:`y` variable and
+            reused by every evaluation, the neighbours of the first and last
+            intervals wrap around as with negative indexing.
+        """
+
+        r_m2, r_m1 = np.roll(r, 2, axis=0), np.roll(r, 1, axis=0)
+        r_p1, r_p2, r_p3 = (np.roll(r, -1, axis=0), np.roll(r, -2, axis=0),
+                            np.roll(r, -3, axis=0))
+
+        a0p = r
+        a1p = ((2 * r_m2 - 16 * r_m1 + 16 * r_p1 -
+                2 * r_p2) / 24)  # yapf: disable
+        a2p = ((-r_m2 + 16 * r_m1 - 30 * r + 16 * r_p1 -
+                r_p2) / 24)  # yapf: disable
+        a3p = ((-9 * r_m2 + 39 * r_m1 - 70 * r + 66 * r_p1 - 33 * r_p2 +
+                7 * r_p3) / 24)
+        a4p = ((13 * r_m2 - 64 * r_m1 + 126 * r - 124 * r_p1 + 61 * r_p2 -
+                12 * r_p3) / 24)
+        a5p = ((-5 * r_m2 + 25 * r_m1 - 50 * r + 50 * r_p1 - 25 * r_p2 +
+                5 * r_p3) / 24)
+
+        return np.array([a0p, a1p, a2p, a3p, a4p, a5p])
+
     def _validate_dimensions(self):
         """
         Validates variables dimensions to be the same.
@@ -1164,9 +1270,13 @@ class CubicSplineInterpolator(scipy.interpolate.interp1d):
     Notes
     -----
     -   This class is a wrapper around *scipy.interpolate.interp1d* class.
+    -   The interpolation axis defaults to the first one, i.e. a 2-D :math:`y`
+        variable of shape (n, m) is interpolated column-wise.
     """
 
     def __init__(self, *args, **kwargs):
+        kwargs.setdefault('axis', 0)
+
         super(CubicSplineInterpolator, self).__init__(
             kind='cubic', *args, **kwargs)
 
@@ -1653,7 +1763,123 @@ def vertices_and_relative_coordinates(V_xyz, table):
     return vertices, V_xyzr
 
 
-def table_interpolation_trilinear(V_xyz, table):
+def _table_interpolation_indexes(V_xyz, table, dtype):
+    """
+    Computes the flattened interpolation table, the flattened table indexes of
+    the floor vertices, the per axis flattened table index offsets to the
+    ceiling vertices and the indexes relative :math:`V_{xyzr}` coordinates
+    from given :math:`V_{xyz}` values and interpolation table.
+
+    Parameters
+    ----------
+    V_xyz : array_like
+        :math:`V_{xyz}` values to transform to indexes relative
+        :math:`V_{xyzr}` values.
+    table : array_like
+        4-Dimensional (NxNxNx3) interpolation table.
+    dtype : type
+        Working data type.
+
+    Returns
+    -------
+    tuple
+        Flattened interpolation table, floor vertices indexes, ceiling
+        vertices offsets and indexes relative :math:`V_{xyzr}` coordinates.
+
+    Notes
+    -----
+    -   Contrary to :func:`colour.algebra.vertices_and_relative_coordinates`
+        definition, the 8 encompassing vertices are not gathered, the kernels
+        only gather the vertices they need.
+    """
+
+    table = np.asarray(table, dtype=dtype)
+
+    # Indexes computations where ``i_m`` is the maximum index value on a given
+    # table axis and ``i_f`` the floor indexes encompassing a given V_xyz
+    # value, the ``V_xyz`` values being positive, truncation is flooring.
+    i_m = np.array(table.shape[0:-1]) - 1
+    V_xyzr = np.clip(np.reshape(V_xyz, (-1, 3)), 0, 1) * i_m.astype(dtype)
+    i_f = V_xyzr.astype(DEFAULT_INT_DTYPE)
+    V_xyzr -= i_f
+
+    # Flattened table indexes of the floor vertices and offsets to the ceiling
+    # vertices, the latter being null on the table upper boundaries.
+    strides = np.array(
+        [table.shape[1] * table.shape[2], table.shape[2], 1],
+        dtype=DEFAULT_INT_DTYPE)
+    i = np.dot(i_f, strides)
+    d = (i_f < i_m) * strides
+
+    return np.reshape(table, (-1, table.shape[-1])), i, d, V_xyzr
+
+
+def _table_interpolation_output(V_xyz, dtype, out):
+    """
+    Returns the output array of the table interpolation kernels and its
+    flattened view.
+
+    Parameters
+    ----------
+    V_xyz : ndarray
+        :math:`V_{xyz}` values to interpolate.
+    dtype : type
+        Output data type.
+    out : ndarray
+        C-contiguous output array, a new array is allocated if *None*.
+
+    Returns
+    -------
+    tuple
+        Output array and its flattened view.
+
+    Raises
+    ------
+    ValueError
+        If the output array is not C-contiguous or does not have the
+        expected shape and data type.
+    """
+
+    if out is None:
+        out = np.empty(V_xyz.shape, dtype=dtype)
+    elif (out.shape != V_xyz.shape or out.dtype != dtype or
+          not out.flags.c_contiguous):
+        raise ValueError(
+            '"out" array must be C-contiguous with "{0}" shape and "{1}" '
+            'data type!'.format(V_xyz.shape, np.dtype(dtype)))
+
+    return out, np.reshape(out, (-1, 3))
+
+
+def _lerp(a, b, t):
+    """
+    Linearly interpolates in-place between given :math:`a` and :math:`b`
+    arrays with given :math:`t` coefficients, both :math:`a` and :math:`b`
+    arrays are overwritten.
+
+    Parameters
+    ----------
+    a : ndarray
+        :math:`a` array, receiving the result.
+    b : ndarray
+        :math:`b` array.
+    t : ndarray
+        :math:`t` coefficients.
+
+    Returns
+    -------
+    ndarray
+        Interpolated array.
+    """
+
+    b -= a
+    b *= t
+    a += b
+
+    return a
+
+
+def table_interpolation_trilinear(V_xyz, table, dtype=None, out=None):
     """
     Performs trilinear interpolation of given :math:`V_{xyz}` values using
     given interpolation table.
@@ -1664,12 +1890,31 @@ def table_interpolation_trilinear(V_xyz, table):
         :math:`V_{xyz}` values to interpolate.
     table : array_like
         4-Dimensional (NxNxNx3) interpolation table.
+    dtype : type, optional
+        Working and output data type, e.g. :class:`numpy.float32`, default
+        to :attr:`colour.constants.DEFAULT_FLOAT_DTYPE`.
+    out : ndarray, optional
+        C-contiguous array with the :math:`V_{xyz}` values shape and given
+        data type into which the interpolated values are written.
 
     Returns
     -------
     ndarray
         Interpolated :math:`V_{xyz}` values.
 
+    Raises
+    ------
+    ValueError
+        If the output array is not C-contiguous or does not have the
+        expected shape and data type.
+
+    Notes
+    -----
+    -   The interpolation is computed as successive linear interpolations
+        along the table axes, gathering the 8 encompassing vertices two at a
+        time, so that the temporary arrays only hold a few :math:`V_{xyz}`
+        sized arrays.
+
     References
     ----------
     :cite:`Bourkeb`
@@ -1695,25 +1940,37 @@ def table_interpolation_trilinear(V_xyz, table):
            [ 1.0976519...,  0.1785998...,  0.2299897...]])
     """
 
-    V_xyz = as_float_array(V_xyz)
+    if dtype is None:
+        dtype = DEFAULT_FLOAT_DTYPE
+
+    V_xyz = np.asarray(V_xyz, dtype=dtype)
+    xyz_o, xyz_f = _table_interpolation_output(V_xyz, dtype, out)
 
-    vertices, V_xyzr = vertices_and_relative_coordinates(V_xyz, table)
+    table, i, d, V_xyzr = _table_interpolation_indexes(V_xyz, table, dtype)
+    x, y, z = [V_xyzr[:, j:j + 1] for j in range(3)]
+    d_x, d_y, d_z = [d[:, j] for j in range(3)]
 
-    vertices = np.moveaxis(vertices, 0, 1)
-    x, y, z = [f[:, np.newaxis] for f in tsplit(V_xyzr)]
+    # Interpolating along the "z" axis and then the "y" axis for the floor
+    # and then the ceiling "x" vertices.
+    i_y = i + d_y
+    V_0 = _lerp(
+        _lerp(table[i], table[i + d_z], z),
+        _lerp(table[i_y], table[i_y + d_z], z), y)
 
-    weights = np.moveaxis(
-        np.transpose([(1 - x) * (1 - y) * (1 - z), (1 - x) * (1 - y) * z,
-                      (1 - x) * y * (1 - z), (1 - x) * y * z, x * (1 - y) *
-                      (1 - z), x * (1 - y) * z, x * y * (1 - z), x * y * z]),
-        0, -1)
+    i += d_x
+    i_y += d_x
+    V_1 = _lerp(
+        _lerp(table[i], table[i + d_z], z),
+        _lerp(table[i_y], table[i_y + d_z], z), y)
 
-    xyz_o = np.reshape(np.sum(vertices * weights, 1), V_xyz.shape)
+    V_1 -= V_0
+    V_1 *= x
+    np.add(V_0, V_1, out=xyz_f)
 
     return xyz_o
 
 
-def table_interpolation_tetrahedral(V_xyz, table):
+def table_interpolation_tetrahedral(V_xyz, table, dtype=None, out=None):
     """
     Performs tetrahedral interpolation of given :math:`V_{xyz}` values using
     given interpolation table.
@@ -1724,12 +1981,32 @@ def table_interpolation_tetrahedral(V_xyz, table):
         :math:`V_{xyz}` values to interpolate.
     table : array_like
         4-Dimensional (NxNxNx3) interpolation table.
+    dtype : type, optional
+        Working and output data type, e.g. :class:`numpy.float32`, default
+        to :attr:`colour.constants.DEFAULT_FLOAT_DTYPE`.
+    out : ndarray, optional
+        C-contiguous array with the :math:`V_{xyz}` values shape and given
+        data type into which the interpolated values are written.
 
     Returns
     -------
     ndarray
         Interpolated :math:`V_{xyz}` values.
 
+    Raises
+    ------
+    ValueError
+        If the output array is not C-contiguous or does not have the
+        expected shape and data type.
+
+    Notes
+    -----
+    -   The tetrahedron encompassing a given :math:`V_{xyz}` value is
+        selected by sorting its indexes relative :math:`V_{xyzr}` coordinates
+        in descending order: walking from the floor vertex along the axes in
+        that order visits the 4 vertices of the tetrahedron, thus only them
+        are gathered and weighted.
+
     References
     ----------
     :cite:`Kirk2006`
@@ -1755,31 +2032,31 @@ def table_interpolation_tetrahedral(V_xyz, table):
            [ 1.1178206...,  0.1762039...,  0.2209534...]])
     """
 
-    V_xyz = as_float_array(V_xyz)
-
-    vertices, V_xyzr = vertices_and_relative_coordinates(V_xyz, table)
-
-    vertices = np.moveaxis(vertices, 0, -1)
-    V000, V001, V010, V011, V100, V101, V110, V111 = tsplit(vertices)
-    x, y, z = [r[:, np.newaxis] for r in tsplit(V_xyzr)]
-
-    xyz_o = np.select([
-        np.logical_and(x > y, y > z),
-        np.logical_and(x > y, x > z),
-        np.logical_and(x > y, np.logical_and(y <= z, x <= z)),
-        np.logical_and(x <= y, z > y),
-        np.logical_and(x <= y, z > x),
-        np.logical_and(x <= y, np.logical_and(z <= y, z <= x)),
-    ], [
-        (1 - x) * V000 + (x - y) * V100 + (y - z) * V110 + z * V111,
-        (1 - x) * V000 + (x - z) * V100 + (z - y) * V101 + y * V111,
-        (1 - z) * V000 + (z - x) * V001 + (x - y) * V101 + y * V111,
-        (1 - z) * V000 + (z - y) * V001 + (y - x) * V011 + x * V111,
-        (1 - y) * V000 + (y - z) * V010 + (z - x) * V011 + x * V111,
-        (1 - y) * V000 + (y - x) * V010 + (x - z) * V110 + z * V111,
-    ])
+    if dtype is None:
+        dtype = DEFAULT_FLOAT_DTYPE
 
-    xyz_o = np.reshape(xyz_o, V_xyz.shape)
+    V_xyz = np.asarray(V_xyz, dtype=dtype)
+    xyz_o, xyz_f = _table_interpolation_output(V_xyz, dtype, out)
+
+    table, i, d, V_xyzr = _table_interpolation_indexes(V_xyz, table, dtype)
+
+    # Sorting the relative coordinates and the ceiling vertices offsets in
+    # descending relative coordinates order, the cumulative offsets are then
+    # the tetrahedron vertices indexes relative to the floor vertex.
+    rows = np.arange(V_xyzr.shape[0])[:, np.newaxis]
+    order = np.argsort(V_xyzr, axis=-1)[:, ::-1]
+    V_xyzr = V_xyzr[rows, order]
+    d = np.cumsum(d[rows, order], axis=-1)
+
+    np.multiply(table[i], 1 - V_xyzr[:, 0:1], out=xyz_f)
+    for j in range(3):
+        w = V_xyzr[:, j:j + 1]
+        if j < 2:
+            w = w - V_xyzr[:, j + 1:j + 2]
+
+        V = table[i + d[:, j]]
+        V *= w
+        xyz_f += V
 
     return xyz_o
 
@@ -1800,7 +2077,7 @@ TABLE_INTERPOLATION_METHODS : CaseInsensitiveMapping
 """
 
 
-def table_interpolation(V_xyz, table, method='Trilinear'):
+def table_interpolation(V_xyz, table, method='Trilinear', **kwargs):
     """
     Performs interpolation of given :math:`V_{xyz}` values using given
     interpolation table.
@@ -1815,6 +2092,19 @@ def table_interpolation(V_xyz, table, method='Trilinear'):
         **{'Trilinear', 'Tetrahedral'}**,
         Interpolation method.
 
+    Other Parameters
+    ----------------
+    dtype : type, optional
+        {:func:`colour.algebra.table_interpolation_trilinear`,
+        :func:`colour.algebra.table_interpolation_tetrahedral`},
+        Working and output data type, e.g. :class:`numpy.float32`, default
+        to :attr:`colour.constants.DEFAULT_FLOAT_DTYPE`.
+    out : ndarray, optional
+        {:func:`colour.algebra.table_interpolation_trilinear`,
+        :func:`colour.algebra.table_interpolation_tetrahedral`},
+        C-contiguous array with the :math:`V_{xyz}` values shape and given
+        data type into which the interpolated values are written.
+
     Returns
     -------
     ndarray
@@ -1850,4 +2140,4 @@ def table_interpolation(V_xyz, table, method='Trilinear'):
            [ 1.1178206...,  0.1762039...,  0.2209534...]])
     """
 
-    return TABLE_INTERPOLATION_METHODS.get(method)(V_xyz, table)
+    return TABLE_INTERPOLATION_METHODS.get(method)(V_xyz, table, **kwargs)
@@ -96,6 +96,31 @@ class TestExtrapolator(unittest.TestCase):
             extrapolator((0.1, 0.2, 8.0, 9.0)), (-1.9, -1.8, 6.0, 7.0))
         self.assertEqual(extrapolator(9), 7.)
 
+    def test_n_dimensional__call__(self):
+        """
+        Tests :func:`colour.algebra.extrapolation.Extrapolator.__call__`
+        method n-dimensional support.
+        """
+
+        x = np.array([3, 4, 5, 6])
+        y = np.transpose([[1, 2, 3, 4], [2, 4, 6, 8]])
+
+        extrapolator = Extrapolator(LinearInterpolator(x, y))
+        np.testing.assert_almost_equal(
+            extrapolator((0.1, 4.5, 9.0)),
+            np.array([[-1.9, -3.8], [2.5, 5.0], [7.0, 14.0]]))
+
+        extrapolator = Extrapolator(
+            CubicSplineInterpolator(x, y), method='Constant')
+        np.testing.assert_almost_equal(
+            extrapolator((0.1, 4.5, 9.0)),
+            np.array([[1.0, 2.0], [2.5, 5.0], [4.0, 8.0]]))
+
+        extrapolator = Extrapolator(
+            LinearInterpolator(x, y), method='Constant', left=0)
+        np.testing.assert_almost_equal(
+            extrapolator((0.1, 9.0)), np.array([[0.0, 0.0], [4.0, 8.0]]))
+
     @ignore_numpy_errors
     def test_nan__call__(self):
         """
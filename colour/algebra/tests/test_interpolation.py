@@ -426,6 +426,34 @@ class TestKernelInterpolator(unittest.TestCase):
             KernelInterpolator(x_3, y)(x_i / 10),
             decimal=7)
 
+    def test_kernel_weights(self):
+        """
+        Tests :func:`colour.algebra.interpolation.KernelInterpolator.__call__`
+        method kernel weights reuse.
+        """
+
+        x = np.arange(11, 26, 1)
+        y = np.sin(x / len(x) * np.pi * 6) / (x / len(x)) + np.pi
+        x_i = np.linspace(11, 25, 25)
+
+        kernel_interpolator = KernelInterpolator(x, y)
+        kernel_interpolator(x_i)
+        weights = kernel_interpolator._weights[1]
+
+        kernel_interpolator.y = y * 2
+        np.testing.assert_almost_equal(
+            kernel_interpolator(x_i),
+            KernelInterpolator(x, y * 2)(x_i),
+            decimal=7)
+        self.assertIs(kernel_interpolator._weights[1], weights)
+
+        kernel_interpolator.kernel = kernel_sinc
+        np.testing.assert_almost_equal(
+            kernel_interpolator(x_i),
+            KernelInterpolator(x, y * 2, kernel=kernel_sinc)(x_i),
+            decimal=7)
+        self.assertIsNot(kernel_interpolator._weights[1], weights)
+
     @ignore_numpy_errors
     def test_nan__call__(self):
         """
@@ -491,6 +519,67 @@ class TestLinearInterpolator(unittest.TestCase):
                           len(POINTS_DATA_A) - 1 + interval, interval)),
             LINEAR_INTERPOLATED_POINTS_DATA_A_10_SAMPLES)
 
+    def test_uniform__call__(self):
+        """
+        Tests :func:`colour.algebra.interpolation.LinearInterpolator.__call__`
+        method with uniformly spaced independent variable.
+        """
+
+        x = np.linspace(360, 830, 95)
+        y = np.sin(x / 50)
+        x_i = np.linspace(360, 830, 1000)
+
+        np.testing.assert_almost_equal(
+            LinearInterpolator(x, y)(x_i), np.interp(x_i, x, y), decimal=7)
+
+        np.testing.assert_almost_equal(
+            LinearInterpolator(x, y, dtype=np.float32)(x_i),
+            np.interp(x_i, x, y),
+            decimal=5)
+
+        for samples in (10, 95, 1024, 4096):
+            x = np.linspace(0, 1, samples)
+            y = np.sin(x * 8)
+            x_i = np.linspace(0, 1, 1000)
+
+            linear_interpolator = LinearInterpolator(x, y)
+            self.assertIsNotNone(linear_interpolator._x_interval)
+            np.testing.assert_almost_equal(
+                linear_interpolator(x_i), np.interp(x_i, x, y), decimal=7)
+
+        x[1] += 0.5 / samples
+        linear_interpolator = LinearInterpolator(x, y)
+        self.assertIsNone(linear_interpolator._x_interval)
+        np.testing.assert_almost_equal(
+            linear_interpolator(x_i), np.interp(x_i, x, y), decimal=7)
+
+        self.assertIsNone(LinearInterpolator(x[::-1], y)._x_interval)
+
+    def test_n_dimensional__call__(self):
+        """
+        Tests :func:`colour.algebra.interpolation.LinearInterpolator.__call__`
+        method n-dimensional support.
+        """
+
+        interval = 0.1
+        x = np.arange(len(POINTS_DATA_A))
+        y = np.array(POINTS_DATA_A)
+        y = np.transpose([y, y * 2, y[::-1]])
+        linear_interpolator = LinearInterpolator(x, y)
+
+        x_i = np.arange(0, len(POINTS_DATA_A) - 1 + interval, interval)
+        np.testing.assert_almost_equal(
+            linear_interpolator(x_i),
+            np.transpose([
+                LinearInterpolator(x, y[..., i])(x_i) for i in range(3)
+            ]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            linear_interpolator(x_i)[..., 0],
+            LINEAR_INTERPOLATED_POINTS_DATA_A_10_SAMPLES,
+            decimal=7)
+
     @ignore_numpy_errors
     def test_nan__call__(self):
         """
@@ -559,6 +648,83 @@ class TestSpragueInterpolator(unittest.TestCase):
                           len(POINTS_DATA_A) - 1 + interval, interval)),
             SPRAGUE_INTERPOLATED_POINTS_DATA_A_10_SAMPLES)
 
+    def test_n_dimensional__call__(self):
+        """
+        Tests :func:`colour.algebra.interpolation.SpragueInterpolator.__call__`
+        method n-dimensional support.
+        """
+
+        interval = 0.1
+        x = np.arange(len(POINTS_DATA_A))
+        y = np.array(POINTS_DATA_A)
+        y = np.transpose([y, y * 2, y[::-1]])
+        sprague_interpolator = SpragueInterpolator(x, y)
+
+        x_i = np.arange(0, len(POINTS_DATA_A) - 1 + interval, interval)
+        np.testing.assert_almost_equal(
+            sprague_interpolator(x_i),
+            np.transpose([
+                SpragueInterpolator(x, y[..., i])(x_i) for i in range(3)
+            ]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            sprague_interpolator(x_i)[..., 0],
+            SPRAGUE_INTERPOLATED_POINTS_DATA_A_10_SAMPLES,
+            decimal=7)
+
+        x_i = np.linspace(0, len(POINTS_DATA_A) - 1, 7)
+        for y_i in (y, y[:, 0:1]):
+            np.testing.assert_almost_equal(
+                SpragueInterpolator(x, y_i)(x_i),
+                np.transpose([
+                    SpragueInterpolator(x, y_i[..., i])(x_i)
+                    for i in range(y_i.shape[-1])
+                ]),
+                decimal=7)
+
+    def test__polynomial_coefficients(self):
+        """
+        Tests :func:`colour.algebra.interpolation.SpragueInterpolator.\
+_polynomial_coefficients` method.
+        """
+
+        x = np.arange(len(POINTS_DATA_A))
+        y = np.array(POINTS_DATA_A)
+        y = np.transpose([y, y * 2, y[::-1]])
+
+        for y_i in (y[..., 0], y):
+            sprague_interpolator = SpragueInterpolator(x, y_i)
+            r = sprague_interpolator._yp
+
+            # Former per-call evaluation, the neighbours of the first and
+            # last intervals wrapping around with negative indexing.
+            x_i = np.arange(0, len(POINTS_DATA_A) - 1, 0.1)
+            i = np.searchsorted(sprague_interpolator._xp, x_i) - 1
+            X = ((x_i - sprague_interpolator._xp[i]) /
+                 (sprague_interpolator._xp[i + 1] -
+                  sprague_interpolator._xp[i]))
+            if y_i.ndim > 1:
+                X = X[..., np.newaxis]
+
+            a0p = r[i]
+            a1p = ((2 * r[i - 2] - 16 * r[i - 1] + 16 * r[i + 1] -
+                    2 * r[i + 2]) / 24)  # yapf: disable
+            a2p = ((-r[i - 2] + 16 * r[i - 1] - 30 * r[i] + 16 * r[i + 1] -
+                    r[i + 2]) / 24)  # yapf: disable
+            a3p = ((-9 * r[i - 2] + 39 * r[i - 1] - 70 * r[i] +
+                    66 * r[i + 1] - 33 * r[i + 2] + 7 * r[i + 3]) / 24)
+            a4p = ((13 * r[i - 2] - 64 * r[i - 1] + 126 * r[i] -
+                    124 * r[i + 1] + 61 * r[i + 2] - 12 * r[i + 3]) / 24)
+            a5p = ((-5 * r[i - 2] + 25 * r[i - 1] - 50 * r[i] +
+                    50 * r[i + 1] - 25 * r[i + 2] + 5 * r[i + 3]) / 24)
+
+            np.testing.assert_almost_equal(
+                sprague_interpolator(x_i),
+                a0p + a1p * X + a2p * X ** 2 + a3p * X ** 3 + a4p * X ** 4 +
+                a5p * X ** 5,
+                decimal=10)
+
     @ignore_numpy_errors
     def test_nan__call__(self):
         """
@@ -834,6 +1000,36 @@ table_interpolation_trilinear` definition.
                 [0.59220355, 0.93136492, 0.30063692],
             ]))
 
+    def test_interpolation_trilinear_dtype_out(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_trilinear` definition ``dtype`` and ``out`` arguments.
+        """
+
+        prng = np.random.RandomState(4)
+
+        V_xyz = random_triplet_generator(16, random_state=prng)
+        V_xyz = np.reshape(V_xyz, (4, 4, 3))
+        xyz_o = table_interpolation_trilinear(V_xyz, LUT_TABLE)
+
+        out = np.empty((4, 4, 3), dtype=np.float32)
+        self.assertIs(
+            table_interpolation_trilinear(
+                V_xyz, LUT_TABLE, dtype=np.float32, out=out), out)
+        np.testing.assert_almost_equal(out, xyz_o, decimal=5)
+
+        np.testing.assert_almost_equal(
+            table_interpolation_trilinear(np.ones(3), LUT_TABLE),
+            LUT_TABLE[-1, -1, -1],
+            decimal=7)
+
+        self.assertRaises(
+            ValueError,
+            table_interpolation_trilinear,
+            V_xyz,
+            LUT_TABLE,
+            out=out)
+
 
 class TestTableInterpolationTetrahedral(unittest.TestCase):
     """
@@ -872,6 +1068,36 @@ table_interpolation_tetrahedral` definition.
                 [0.61272658, 0.92799297, 0.29650424],
             ]))
 
+    def test_interpolation_tetrahedral_dtype_out(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_tetrahedral` definition ``dtype`` and ``out`` arguments.
+        """
+
+        prng = np.random.RandomState(4)
+
+        V_xyz = random_triplet_generator(16, random_state=prng)
+        V_xyz = np.reshape(V_xyz, (4, 4, 3))
+        xyz_o = table_interpolation_tetrahedral(V_xyz, LUT_TABLE)
+
+        out = np.empty((4, 4, 3), dtype=np.float32)
+        self.assertIs(
+            table_interpolation_tetrahedral(
+                V_xyz, LUT_TABLE, dtype=np.float32, out=out), out)
+        np.testing.assert_almost_equal(out, xyz_o, decimal=5)
+
+        np.testing.assert_almost_equal(
+            table_interpolation_tetrahedral(np.ones(3), LUT_TABLE),
+            LUT_TABLE[-1, -1, -1],
+            decimal=7)
+
+        self.assertRaises(
+            ValueError,
+            table_interpolation_tetrahedral,
+            V_xyz,
+            LUT_TABLE,
+            out=out)
+
 
 if __name__ == '__main__':
     unittest.main()
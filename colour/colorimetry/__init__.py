@@ -8,7 +8,8 @@ from colour.utilities.deprecation import ModuleAPI, Renamed
 from colour.utilities.documentation import is_documentation_building
 
 from .spectrum import (SpectralShape, DEFAULT_SPECTRAL_SHAPE,
-                       SpectralDistribution, MultiSpectralDistribution)
+                       SpectralDistribution, MultiSpectralDistribution,
+                       reshape_sd)
 from .blackbody import sd_blackbody, blackbody_spectral_radiance, planck_law
 from .cmfs import (LMS_ConeFundamentals, RGB_ColourMatchingFunctions,
                    XYZ_ColourMatchingFunctions)
@@ -28,7 +29,8 @@ from .tristimulus import (
     tristimulus_weighting_factors_ASTME202211,
     adjust_tristimulus_weighting_factors_ASTME30815, sd_to_XYZ_integration,
     sd_to_XYZ_tristimulus_weighting_factors_ASTME30815, sd_to_XYZ_ASTME30815,
-    multi_sd_to_XYZ_integration, wavelength_to_XYZ)
+    multi_sd_to_XYZ_integration, multi_sd_to_XYZ_ASTME30815,
+    TristimulusEngine, wavelength_to_XYZ)
 from .correction import BANDPASS_CORRECTION_METHODS
 from .correction import bandpass_correction
 from .correction import bandpass_correction_Stearns1988
@@ -65,7 +67,7 @@ from .yellowness import yellowness_ASTMD1925, yellowness_ASTME313
 
 __all__ = [
     'SpectralShape', 'DEFAULT_SPECTRAL_SHAPE', 'SpectralDistribution',
-    'MultiSpectralDistribution'
+    'MultiSpectralDistribution', 'reshape_sd'
 ]
 __all__ += ['sd_blackbody', 'blackbody_spectral_radiance', 'planck_law']
 __all__ += [
@@ -87,7 +89,8 @@ __all__ += [
     'tristimulus_weighting_factors_ASTME202211',
     'adjust_tristimulus_weighting_factors_ASTME30815', 'sd_to_XYZ_integration',
     'sd_to_XYZ_tristimulus_weighting_factors_ASTME30815',
-    'sd_to_XYZ_ASTME30815', 'multi_sd_to_XYZ_integration', 'wavelength_to_XYZ'
+    'sd_to_XYZ_ASTME30815', 'multi_sd_to_XYZ_integration',
+    'multi_sd_to_XYZ_ASTME30815', 'TristimulusEngine', 'wavelength_to_XYZ'
 ]
 __all__ += ['BANDPASS_CORRECTION_METHODS']
 __all__ += ['bandpass_correction']
@@ -24,7 +24,7 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.colorimetry import PHOTOPIC_LEFS
+from colour.colorimetry import PHOTOPIC_LEFS, reshape_sd
 from colour.constants import K_M
 
 __author__ = 'Colour Developers'
@@ -70,7 +70,8 @@ def luminous_flux(sd,
     23807.6555273...
     """
 
-    lef = lef.copy().align(
+    lef = reshape_sd(
+        lef,
         sd.shape,
         extrapolator_args={
             'method': 'Constant',
@@ -114,7 +115,8 @@ def luminous_efficiency(
     0.1994393...
     """
 
-    lef = lef.copy().align(
+    lef = reshape_sd(
+        lef,
         sd.shape,
         extrapolator_args={
             'method': 'Constant',
@@ -8,6 +8,7 @@ Defines the classes handling spectral data computations:
 -   :class:`colour.SpectralShape`
 -   :class:`colour.SpectralDistribution`
 -   :class:`colour.MultiSpectralDistribution`
+-   :func:`colour.colorimetry.reshape_sd`
 
 See Also
 --------
@@ -30,14 +31,17 @@ References
 from __future__ import division, unicode_literals
 
 import numpy as np
+from collections import OrderedDict
 from six.moves import zip
 
 from colour.algebra import (Extrapolator, CubicSplineInterpolator,
+                            LinearInterpolator, PchipInterpolator,
                             SpragueInterpolator)
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.continuous import Signal, MultiSignal
 from colour.utilities import (as_float, first_item, is_iterable, is_numeric,
-                              is_string, is_uniform, interval, runtime_warning)
+                              is_string, is_uniform, interval, runtime_warning,
+                              tsplit)
 from colour.utilities.deprecation import Removed, Renamed
 
 __author__ = 'Colour Developers'
@@ -49,7 +53,7 @@ __status__ = 'Production'
 
 __all__ = [
     'SpectralShape', 'DEFAULT_SPECTRAL_SHAPE', 'SpectralDistribution',
-    'MultiSpectralDistribution'
+    'MultiSpectralDistribution', 'reshape_sd'
 ]
 
 
@@ -475,6 +479,51 @@ DEFAULT_SPECTRAL_SHAPE : SpectralShape
 """
 
 
+_COLUMN_WISE_INTERPOLATORS = (CubicSplineInterpolator, LinearInterpolator,
+                              PchipInterpolator, SpragueInterpolator)
+"""
+Interpolators supporting a 2-D dependent :math:`y` variable and interpolating
+it column-wise, allowing a :class:`colour.MultiSpectralDistribution` class
+instance to be interpolated in a single call.
+
+_COLUMN_WISE_INTERPOLATORS : tuple
+"""
+
+
+def _interpolation_shape(shape, self_shape):
+    """
+    Returns the spectral shape to interpolate a spectral distribution of given
+    shape to, unspecified attributes are taken from the spectral distribution
+    shape and the bounds are clamped to its range.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Requested spectral shape.
+    self_shape : SpectralShape
+        Spectral distribution shape.
+
+    Returns
+    -------
+    SpectralShape
+        Interpolation spectral shape.
+    """
+
+    s_e_i = zip((shape.start, shape.end, shape.interval),
+                (self_shape.start, self_shape.end, self_shape.interval))
+    shape = SpectralShape(*[x[0] if x[0] is not None else x[1] for x in s_e_i])
+    # Defining proper interpolation bounds.
+    # TODO: Provide support for fractional interval like 0.1, etc...
+    if (round(self_shape.start) != self_shape.start or
+            round(self_shape.end) != self_shape.end):
+        runtime_warning('Fractional bound encountered, rounding will occur!')
+
+    shape.start = max(shape.start, np.ceil(self_shape.start))
+    shape.end = min(shape.end, np.floor(self_shape.end))
+
+    return shape
+
+
 class SpectralDistribution(Signal):
     """
     Defines the spectral distribution: the base object for spectral
@@ -1104,20 +1153,7 @@ dict_like, optional
          [ 600.            0.136    ...]]
         """
 
-        self_shape = self.shape
-        s_e_i = zip((shape.start, shape.end, shape.interval),
-                    (self_shape.start, self_shape.end, self_shape.interval))
-        shape = SpectralShape(
-            *[x[0] if x[0] is not None else x[1] for x in s_e_i])
-        # Defining proper interpolation bounds.
-        # TODO: Provide support for fractional interval like 0.1, etc...
-        if (round(self_shape.start) != self_shape.start or
-                round(self_shape.end) != self_shape.end):
-            runtime_warning(
-                'Fractional bound encountered, rounding will occur!')
-
-        shape.start = max(shape.start, np.ceil(self_shape.start))
-        shape.end = min(shape.end, np.floor(self_shape.end))
+        shape = _interpolation_shape(shape, self.shape)
 
         if interpolator is None:
             if self.is_uniform():
@@ -1860,8 +1896,48 @@ MultiSpectralDistribution or array_like or dict_like, optional
          [ 700.         0.5945     0.995      0.0039 ]]
         """
 
-        for signal in self.signals.values():
-            signal.extrapolate(shape, extrapolator, extrapolator_args)
+        signals = list(self._signals.values())
+        if not signals:
+            return self
+
+        if extrapolator is None:
+            extrapolator = Extrapolator
+
+        if extrapolator_args is None:
+            extrapolator_args = {
+                'method': 'Constant',
+                'left': None,
+                'right': None
+            }
+
+        signal = signals[0]
+        column_wise = (extrapolator is Extrapolator and
+                       signal.interpolator in _COLUMN_WISE_INTERPOLATORS and
+                       all(s.interpolator is signal.interpolator and
+                           s.interpolator_args == signal.interpolator_args
+                           for s in signals))
+
+        if not column_wise:
+            for signal in signals:
+                signal.extrapolate(shape, extrapolator, extrapolator_args)
+
+            return self
+
+        self_shape = self.shape
+        wavelengths = np.hstack([
+            np.arange(shape.start, self_shape.start, self_shape.interval),
+            np.arange(self_shape.end + self_shape.interval,
+                      shape.end + self_shape.interval, self_shape.interval)
+        ])
+
+        extrapolator = extrapolator(
+            signal.interpolator(self.wavelengths, self.values,
+                                **signal.interpolator_args),
+            **extrapolator_args)
+
+        values = extrapolator(wavelengths).reshape(-1, len(signals))
+        for signal, value in zip(signals, tsplit(values)):
+            signal[wavelengths] = value
 
         return self
 
@@ -1888,6 +1964,9 @@ MultiSpectralDistribution or array_like or dict_like, optional
         -----
         -   See :meth:`colour.SpectralDistribution.interpolate` method notes
         section.
+        -   With the *Sprague (1880)*, linear, cubic spline and *Pchip*
+            interpolators, the :class:`colour.SpectralDistribution` class
+            instances are interpolated column-wise in a single call.
 
         Warning
         -------
@@ -2050,8 +2129,35 @@ MultiSpectralDistribution or array_like or dict_like, optional
          [ 560.            0.5945   ...    0.995    ...    0.0039   ...]]
         """
 
-        for signal in self.signals.values():
-            signal.interpolate(shape, interpolator, interpolator_args)
+        signals = list(self._signals.values())
+        if not signals:
+            return self
+
+        if interpolator is None:
+            if self.is_uniform():
+                interpolator = SpragueInterpolator
+            else:
+                interpolator = CubicSplineInterpolator
+
+        if interpolator not in _COLUMN_WISE_INTERPOLATORS:
+            for signal in signals:
+                signal.interpolate(shape, interpolator, interpolator_args)
+
+            return self
+
+        if interpolator_args is None:
+            interpolator_args = {}
+
+        shape = _interpolation_shape(shape, self.shape)
+
+        interpolator = interpolator(self.wavelengths, self.values,
+                                    **interpolator_args)
+
+        wavelengths = shape.range().astype(self.dtype)
+        values = interpolator(wavelengths).reshape(-1, len(signals))
+        for signal, value in zip(signals, tsplit(values)):
+            signal.domain = wavelengths
+            signal.range = value
 
         return self
 
@@ -2162,9 +2268,8 @@ MultiSpectralDistribution or array_like or dict_like, optional
          [ 565.            0.5945   ...    0.995    ...    0.0039   ...]]
         """
 
-        for signal in self.signals.values():
-            signal.align(shape, interpolator, interpolator_args, extrapolator,
-                         extrapolator_args)
+        self.interpolate(shape, interpolator, interpolator_args)
+        self.extrapolate(shape, extrapolator, extrapolator_args)
 
         return self
 
@@ -2242,8 +2347,23 @@ MultiSpectralDistribution or array_like or dict_like, optional
          [ 560.            0.5945   ...    0.995    ...    0.0039   ...]]
         """
 
-        for signal in self.signals.values():
-            signal.trim(shape)
+        signals = list(self._signals.values())
+        if not signals:
+            return self
+
+        start = max(shape.start, self.shape.start)
+        end = min(shape.end, self.shape.end)
+
+        wavelengths = self.wavelengths
+        indexes = np.where(
+            np.logical_and(wavelengths >= start, wavelengths <= end))
+
+        wavelengths = wavelengths[indexes]
+        values = self.values[indexes]
+
+        for signal, value in zip(signals, tsplit(values)):
+            signal.wavelengths = wavelengths
+            signal.values = value
 
         return self
 
@@ -2291,8 +2411,9 @@ MultiSpectralDistribution or array_like or dict_like, optional
          [ 560.            1.       ...    1.       ...    0.0143382...]]
         """
 
-        for signal in self.signals.values():
-            signal.normalise(factor)
+        if self._signals:
+            values = self.values
+            self.values = values * (1 / np.max(values, axis=0) * factor)
 
         return self
 
@@ -2440,3 +2561,123 @@ MultiSpectralDistribution or array_like or dict_like, optional
                         'MultiSpectralDistribution.copy')))
 
         return self.copy()
+
+
+_RESHAPED_SDS_CACHE = None
+_RESHAPED_SDS_CACHE_SIZE = 64
+
+_RESHAPE_METHODS = ('align', 'extrapolate', 'interpolate', 'trim')
+
+
+def _sd_version(sd):
+    """
+    Returns a token describing the state of given spectral distribution or
+    multi-spectral distribution, the token changes whenever the distribution
+    is mutated.
+
+    Parameters
+    ----------
+    sd : SpectralDistribution or MultiSpectralDistribution
+        Spectral distribution or multi-spectral distribution.
+
+    Returns
+    -------
+    tuple
+        Distribution state token.
+    """
+
+    if isinstance(sd, MultiSignal):
+        return (sd.name, tuple(sd.labels),
+                tuple((id(signal), signal._version)
+                      for signal in sd.signals.values()))
+    else:
+        return sd.name, sd._version
+
+
+def reshape_sd(sd, shape, method='Align', **kwargs):
+    """
+    Returns a copy of given spectral distribution or multi-spectral
+    distribution reshaped to given spectral shape using given method.
+
+    The reshaped copies are kept in a process-wide cache with least recently
+    used eviction so that reference data, e.g. colour matching functions or
+    illuminants, is only reshaped once per spectral shape.
+
+    Parameters
+    ----------
+    sd : SpectralDistribution or MultiSpectralDistribution
+        Spectral distribution or multi-spectral distribution to reshape.
+    shape : SpectralShape
+        Spectral shape used for reshaping.
+    method : unicode, optional
+        **{'Align', 'Extrapolate', 'Interpolate', 'Trim'}**,
+        Reshaping method, i.e. the spectral distribution method called on the
+        copy.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the reshaping method, e.g. *interpolator* or
+        *extrapolator_args*.
+
+    Returns
+    -------
+    SpectralDistribution or MultiSpectralDistribution
+        Reshaped spectral distribution or multi-spectral distribution.
+
+    Warning
+    -------
+    The returned object is shared with the other callers requesting the same
+    reshaping and must be treated as read-only.
+
+    Notes
+    -----
+    -   The reshaped copies are cached in
+        :attr:`colour.colorimetry.spectrum._RESHAPED_SDS_CACHE` attribute.
+        Their identifier key is defined by the distribution identity along
+        the spectral shape, the method and its arguments.
+    -   A cached copy is discarded and computed again if either the given
+        distribution or the copy itself has been mutated since caching.
+
+    Examples
+    --------
+    >>> from colour import ILLUMINANTS_SDS
+    >>> sd = ILLUMINANTS_SDS['D65']
+    >>> reshape_sd(sd, SpectralShape(400, 700, 10)).shape
+    SpectralShape(400.0, 700.0, 10.0)
+    >>> reshape_sd(sd, SpectralShape(400, 700, 10)) is reshape_sd(
+    ...     sd, SpectralShape(400, 700, 10))
+    True
+    """
+
+    method = method.lower()
+    assert method in _RESHAPE_METHODS, (
+        '"{0}" method is invalid, it must be one of {1}!'.format(
+            method, _RESHAPE_METHODS))
+
+    global _RESHAPED_SDS_CACHE
+    if _RESHAPED_SDS_CACHE is None:
+        _RESHAPED_SDS_CACHE = OrderedDict()
+
+    key = (id(sd), shape.start, shape.end, shape.interval, method,
+           repr(sorted(kwargs.items())))
+
+    entry = _RESHAPED_SDS_CACHE.pop(key, None)
+    if entry is not None:
+        cached_sd, version, reshaped_sd, reshaped_version = entry
+        if (cached_sd is sd and version == _sd_version(sd) and
+                reshaped_version == _sd_version(reshaped_sd)):
+            _RESHAPED_SDS_CACHE[key] = entry
+
+            return reshaped_sd
+
+    reshaped_sd = getattr(sd.copy(), method)(shape, **kwargs)
+
+    # The distribution is referenced by the cache entry so that its identity
+    # cannot be reused by another object while the entry exists.
+    _RESHAPED_SDS_CACHE[key] = (sd, _sd_version(sd), reshaped_sd,
+                                _sd_version(reshaped_sd))
+    while len(_RESHAPED_SDS_CACHE) > _RESHAPED_SDS_CACHE_SIZE:
+        _RESHAPED_SDS_CACHE.popitem(last=False)
+
+    return reshaped_sd
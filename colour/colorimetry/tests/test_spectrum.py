@@ -10,8 +10,9 @@ import unittest
 import scipy
 from distutils.version import LooseVersion
 
+from colour.algebra import CubicSplineInterpolator, LinearInterpolator
 from colour.colorimetry.spectrum import (SpectralShape, SpectralDistribution,
-                                         MultiSpectralDistribution)
+                                         MultiSpectralDistribution, reshape_sd)
 from colour.utilities import tstack
 
 __author__ = 'Colour Developers'
@@ -26,7 +27,7 @@ __all__ = [
     'INTERPOLATED_SAMPLE_SD_DATA', 'INTERPOLATED_NON_UNIFORM_SAMPLE_SD_DATA',
     'NORMALISED_SAMPLE_SD_DATA', 'CIE_1931_2_DEGREE_STANDARD_OBSERVER',
     'CMFS_DATA', 'TestSpectralShape', 'TestSpectralDistribution',
-    'TestMultiSpectralDistribution'
+    'TestMultiSpectralDistribution', 'TestReshapeSd'
 ]
 
 SAMPLE_SD_DATA = {
@@ -1625,6 +1626,27 @@ MultiSpectralDistribution.extrapolate` method.
         np.testing.assert_almost_equal(
             multi_sd[50], np.array([2.5, 2.5, 2.5]), decimal=7)
 
+        multi_sd = self._sample_multi_sd.copy()
+        multi_sd.values = multi_sd.values * np.array([1, 2, 3])
+        sds = multi_sd.to_sds()
+        shape = SpectralShape(300, 800)
+        multi_sd.extrapolate(
+            shape, extrapolator_args={
+                'method': 'Linear',
+                'left': None,
+                'right': None
+            })
+        for signal, sd in zip(multi_sd.signals.values(), sds):
+            sd.extrapolate(
+                shape,
+                extrapolator_args={
+                    'method': 'Linear',
+                    'left': None,
+                    'right': None
+                })
+            np.testing.assert_almost_equal(signal.domain, sd.domain)
+            np.testing.assert_almost_equal(signal.range, sd.range, decimal=7)
+
     def test_interpolate(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -1638,6 +1660,19 @@ MultiSpectralDistribution.interpolate` method.
             np.testing.assert_almost_equal(
                 signal.values, INTERPOLATED_SAMPLE_SD_DATA, decimal=7)
 
+        multi_sd = self._sample_multi_sd.copy()
+        multi_sd.values = multi_sd.values * np.array([1, 2, 3])
+        sds = multi_sd.to_sds()
+        shape = SpectralShape(interval=1)
+        for interpolator in (None, LinearInterpolator,
+                             CubicSplineInterpolator):
+            multi_sd_i = multi_sd.copy().interpolate(shape, interpolator)
+            for signal, sd in zip(multi_sd_i.signals.values(), sds):
+                sd = sd.copy().interpolate(shape, interpolator)
+                np.testing.assert_almost_equal(signal.domain, sd.domain)
+                np.testing.assert_almost_equal(
+                    signal.range, sd.range, decimal=7)
+
         # TODO: Remove statement whenever we make "Scipy" 0.19.0 the minimum
         # version.
         # Skipping tests because of "Scipy" 0.19.0 interpolation code changes.
@@ -1667,6 +1702,21 @@ MultiSpectralDistribution.align` method.
         shape = SpectralShape(600, 650, 1)
         self.assertEqual(multi_sd.align(shape).shape, shape)
 
+        for multi_sd in (self._sample_multi_sd,
+                         self._non_uniform_sample_multi_sd):
+            multi_sd = multi_sd.copy()
+            multi_sd.values = multi_sd.values * np.array([1, 2, 3])
+            sds = multi_sd.to_sds()
+            for shape in (SpectralShape(100, 900, 5),
+                          SpectralShape(400, 700, 1),
+                          SpectralShape(600, 650, 1)):
+                multi_sd_a = multi_sd.copy().align(shape)
+                for signal, sd in zip(multi_sd_a.signals.values(), sds):
+                    sd = sd.copy().align(shape)
+                    np.testing.assert_almost_equal(signal.domain, sd.domain)
+                    np.testing.assert_almost_equal(
+                        signal.range, sd.range, decimal=7)
+
     def test_trim(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -1690,6 +1740,12 @@ MultiSpectralDistribution.normalise` method.
             self._sample_multi_sd.copy().normalise(100).values,
             tstack([NORMALISED_SAMPLE_SD_DATA] * 3))
 
+        multi_sd = self._sample_multi_sd.copy()
+        multi_sd.values = multi_sd.values * np.array([1, 2, 3])
+        np.testing.assert_almost_equal(
+            multi_sd.normalise(100).values,
+            tstack([NORMALISED_SAMPLE_SD_DATA] * 3))
+
     def to_sds(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -1707,5 +1763,82 @@ MultiSpectralDistribution.to_sds` method.
                 self._non_uniform_sample_multi_sd.name))
 
 
+class TestReshapeSd(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.spectrum.reshape_sd` definition unit
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._sd = SpectralDistribution(SAMPLE_SD_DATA, name='Sample')
+        self._multi_sd = MultiSpectralDistribution(
+            CIE_1931_2_DEGREE_STANDARD_OBSERVER,
+            name='Observer',
+            labels=('x_bar', 'y_bar', 'z_bar'))
+
+    def test_reshape_sd(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.reshape_sd` definition.
+        """
+
+        shape = SpectralShape(400, 700, 5)
+
+        sd = reshape_sd(self._sd, shape)
+        self.assertEqual(sd, self._sd.copy().align(shape))
+        self.assertIsNot(sd, self._sd)
+        self.assertIs(reshape_sd(self._sd, shape), sd)
+
+        self.assertEqual(
+            reshape_sd(self._sd, shape, 'Trim'),
+            self._sd.copy().trim(shape))
+        self.assertEqual(
+            reshape_sd(self._sd, shape, 'Interpolate'),
+            self._sd.copy().interpolate(shape))
+        self.assertEqual(
+            reshape_sd(self._sd, shape, interpolator=LinearInterpolator),
+            self._sd.copy().align(shape, interpolator=LinearInterpolator))
+        self.assertIsNot(
+            reshape_sd(self._sd, shape, interpolator=LinearInterpolator), sd)
+
+        multi_sd = reshape_sd(self._multi_sd, shape)
+        self.assertEqual(multi_sd, self._multi_sd.copy().align(shape))
+        self.assertIs(reshape_sd(self._multi_sd, shape), multi_sd)
+
+        self.assertRaises(AssertionError,
+                          lambda: reshape_sd(self._sd, shape, 'Undefined'))
+
+    def test_reshape_sd_invalidation(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.reshape_sd` definition cache
+        invalidation when the distributions are mutated.
+        """
+
+        shape = SpectralShape(400, 700, 5)
+
+        sd = reshape_sd(self._sd, shape)
+        self._sd *= 2
+        sd_m = reshape_sd(self._sd, shape)
+        self.assertIsNot(sd_m, sd)
+        self.assertEqual(sd_m, self._sd.copy().align(shape))
+
+        sd_m.normalise()
+        self.assertEqual(
+            reshape_sd(self._sd, shape), self._sd.copy().align(shape))
+
+        multi_sd = reshape_sd(self._multi_sd, shape)
+        self._multi_sd.labels = ('a', 'b', 'c')
+        self.assertIsNot(reshape_sd(self._multi_sd, shape), multi_sd)
+
+        multi_sd = reshape_sd(self._multi_sd, shape)
+        self._multi_sd *= 2
+        self.assertEqual(
+            reshape_sd(self._multi_sd, shape),
+            self._multi_sd.copy().align(shape))
+
+
 if __name__ == '__main__':
     unittest.main()
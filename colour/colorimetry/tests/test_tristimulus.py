@@ -16,14 +16,16 @@ import unittest
 
 from colour.algebra import LinearInterpolator
 from colour.colorimetry import (CMFS, sd_CIE_standard_illuminant_A,
-                                ILLUMINANTS_SDS, SpectralDistribution,
-                                SpectralShape)
+                                ILLUMINANTS_SDS, MultiSpectralDistribution,
+                                SpectralDistribution, SpectralShape)
 from colour.colorimetry import (
     lagrange_coefficients_ASTME202211,
     tristimulus_weighting_factors_ASTME202211,
     adjust_tristimulus_weighting_factors_ASTME30815, sd_to_XYZ_integration,
     sd_to_XYZ_tristimulus_weighting_factors_ASTME30815, sd_to_XYZ_ASTME30815,
-    multi_sd_to_XYZ_integration, wavelength_to_XYZ)
+    multi_sd_to_XYZ_integration, multi_sd_to_XYZ_ASTME30815, multi_sd_to_XYZ,
+    TristimulusEngine, wavelength_to_XYZ)
+from colour.colorimetry import tristimulus
 from colour.utilities import domain_range_scale
 
 __author__ = 'Colour Developers'
@@ -41,7 +43,9 @@ __all__ = [
     'TestTristimulusWeightingFactorsASTME202211',
     'TestAdjustTristimulusWeightingFactorsASTME30815',
     'TestSd_to_XYZ_integration', 'TestSd_to_XYZ_ASTME30815',
-    'TestMultiSd_to_XYZ_integration', 'TestWavelength_to_XYZ'
+    'TestMultiSd_to_XYZ_integration', 'TestMultiSd_to_XYZ_ASTME30815',
+    'TestTristimulusEngine',
+    'TestWavelength_to_XYZ'
 ]
 
 SAMPLE_SD = SpectralDistribution({
@@ -395,6 +399,38 @@ tristimulus_weighting_factors_ASTME202211` definition.
         np.testing.assert_almost_equal(
             np.round(twf, 3), D65_CIE_1931_2_20_TWF, decimal=3)
 
+    def test_cache_tristimulus_weighting_factors_ASTME202211(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+tristimulus_weighting_factors_ASTME202211` definition caching.
+        """
+
+        cmfs = CMFS['CIE 1964 10 Degree Standard Observer']
+        A = sd_CIE_standard_illuminant_A(cmfs.shape)
+        shape = SpectralShape(360, 830, 10)
+
+        twf = tristimulus_weighting_factors_ASTME202211(cmfs, A, shape)
+        self.assertIs(
+            tristimulus_weighting_factors_ASTME202211(cmfs, A, shape), twf)
+
+        A_s = A.copy()
+        A_s.values = A_s.values * np.linspace(0.5, 1.5, len(A_s.values))
+        self.assertFalse(
+            np.allclose(
+                tristimulus_weighting_factors_ASTME202211(cmfs, A_s, shape),
+                twf))
+
+        for i in range(tristimulus._TRISTIMULUS_WEIGHTING_FACTORS_CACHE_SIZE):
+            A_s = A.copy()
+            A_s.values = A_s.values + i + 1
+            tristimulus_weighting_factors_ASTME202211(cmfs, A_s, shape)
+
+        self.assertLessEqual(
+            len(tristimulus._TRISTIMULUS_WEIGHTING_FACTORS_CACHE),
+            tristimulus._TRISTIMULUS_WEIGHTING_FACTORS_CACHE_SIZE)
+        self.assertIsNot(
+            tristimulus_weighting_factors_ASTME202211(cmfs, A, shape), twf)
+
 
 class TestAdjustTristimulusWeightingFactorsASTME30815(unittest.TestCase):
     """
@@ -798,6 +834,45 @@ multi_sd_to_XYZ_integration`
             XYZ_D65,
             decimal=7)
 
+    def test_tiled_multi_sd_to_XYZ_integration(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_sd_to_XYZ_integration` definition tiled conversion, working data type
+        and output array support.
+        """
+
+        cmfs = CMFS['CIE 1931 2 Degree Standard Observer']
+        shape = SpectralShape(400, 700, 60)
+        D65 = ILLUMINANTS_SDS['D65']
+
+        for tile_size in (1, 5, 12, 64):
+            np.testing.assert_almost_equal(
+                multi_sd_to_XYZ_integration(
+                    MSD, shape, cmfs, D65, tile_size=tile_size),
+                XYZ_D65,
+                decimal=7)
+
+        out = np.zeros(XYZ_D65.shape)
+        XYZ = multi_sd_to_XYZ_integration(
+            MSD, shape, cmfs, D65, tile_size=5, out=out)
+        self.assertIs(XYZ, out)
+        np.testing.assert_almost_equal(out, XYZ_D65, decimal=7)
+
+        XYZ = multi_sd_to_XYZ_integration(
+            MSD.astype(np.float32), shape, cmfs, D65, tile_size=5,
+            dtype=np.float32)
+        self.assertEqual(XYZ.dtype, np.float32)
+        np.testing.assert_allclose(XYZ, XYZ_D65, rtol=0.00001)
+
+        self.assertRaises(
+            ValueError,
+            multi_sd_to_XYZ_integration,
+            MSD,
+            shape,
+            cmfs,
+            D65,
+            out=np.zeros(XYZ_D65.shape, dtype=np.float32))
+
     def test_domain_range_scale_multi_sd_to_XYZ_integration(self):
         """
         Tests :func:`colour.colorimetry.tristimulus.\
@@ -816,6 +891,224 @@ multi_sd_to_XYZ_integration` definition domain and range scale support.
                     decimal=7)
 
 
+class TestMultiSd_to_XYZ_ASTME30815(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.tristimulus.\
+multi_sd_to_XYZ_ASTME30815` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._sd = SAMPLE_SD.copy()
+        self._cmfs = CMFS['CIE 1931 2 Degree Standard Observer']
+        self._A = sd_CIE_standard_illuminant_A(self._cmfs.shape)
+
+    def test_multi_sd_to_XYZ_ASTME30815(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_sd_to_XYZ_ASTME30815` definition.
+        """
+
+        shapes = (SpectralShape(360, 780, 1), SpectralShape(360, 830, 5),
+                  SpectralShape(400, 700, 10), SpectralShape(360, 820, 20),
+                  SpectralShape(400, 700, 20))
+
+        for shape in shapes:
+            sd = self._sd.copy().align(shape)
+            msd = np.array([sd.values, sd.values * 0.5, sd.values * 2])
+            msd = np.reshape(np.tile(msd, (2, 1)), (2, 3, -1))
+
+            XYZ = sd_to_XYZ_ASTME30815(sd, self._cmfs, self._A)
+            XYZ = np.reshape(np.tile([XYZ, XYZ * 0.5, XYZ * 2], (2, 1)),
+                             (2, 3, 3))
+
+            np.testing.assert_almost_equal(
+                multi_sd_to_XYZ_ASTME30815(msd, shape, self._cmfs, self._A),
+                XYZ,
+                decimal=7)
+
+            np.testing.assert_almost_equal(
+                multi_sd_to_XYZ(
+                    msd,
+                    shape,
+                    self._cmfs,
+                    self._A,
+                    method='ASTM E308-15',
+                    tile_size=4),
+                XYZ,
+                decimal=7)
+
+        sd = self._sd.copy().align(SpectralShape(400, 700, 20))
+        np.testing.assert_almost_equal(
+            multi_sd_to_XYZ_ASTME30815(
+                sd.values,
+                sd.shape,
+                self._cmfs,
+                self._A,
+                mi_20nm_interpolation_method=False),
+            sd_to_XYZ_ASTME30815(
+                sd, self._cmfs, self._A, mi_20nm_interpolation_method=False),
+            decimal=7)
+
+    def test_domain_range_scale_multi_sd_to_XYZ_ASTME30815(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_sd_to_XYZ_ASTME30815` definition domain and range scale support.
+        """
+
+        sd = self._sd.copy().align(SpectralShape(400, 700, 10))
+        XYZ = sd_to_XYZ_ASTME30815(sd, self._cmfs, self._A)
+
+        d_r = (('reference', 1), (1, 0.01), (100, 1))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    multi_sd_to_XYZ_ASTME30815(sd.values, sd.shape,
+                                               self._cmfs, self._A),
+                    XYZ * factor,
+                    decimal=7)
+
+    def test_raise_exception_multi_sd_to_XYZ_ASTME30815(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_sd_to_XYZ_ASTME30815` definition raised exception.
+        """
+
+        self.assertRaises(ValueError, multi_sd_to_XYZ_ASTME30815, MSD,
+                          SpectralShape(400, 700, 60))
+
+
+class TestTristimulusEngine(unittest.TestCase):
+    """
+    Defines :class:`colour.colorimetry.tristimulus.TristimulusEngine` class
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._sd = SAMPLE_SD.copy()
+        self._cmfs = CMFS['CIE 1931 2 Degree Standard Observer']
+        self._A = sd_CIE_standard_illuminant_A(self._cmfs.shape)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('shape', 'method', 'weights')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(TristimulusEngine))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__call__')
+
+        for method in required_methods:
+            self.assertIn(method, dir(TristimulusEngine))
+
+    def test_ASTME30815(self):
+        """
+        Tests :class:`colour.colorimetry.tristimulus.TristimulusEngine` class
+        against :func:`colour.colorimetry.tristimulus.sd_to_XYZ_ASTME30815`
+        definition.
+        """
+
+        shapes = (SpectralShape(360, 780, 1), SpectralShape(400, 700, 1),
+                  SpectralShape(360, 830, 5), SpectralShape(400, 700, 5),
+                  SpectralShape(360, 830, 10), SpectralShape(400, 700, 10),
+                  SpectralShape(360, 820, 20), SpectralShape(400, 700, 20))
+        kwargs = ({}, {
+            'use_practice_range': False
+        }, {
+            'mi_5nm_omission_method': False
+        }, {
+            'mi_20nm_interpolation_method': False
+        })
+
+        for shape in shapes:
+            sd = self._sd.copy().align(shape)
+            for kwargs_i in kwargs:
+                engine = TristimulusEngine(self._cmfs, self._A, shape,
+                                           **kwargs_i)
+                np.testing.assert_almost_equal(
+                    engine(sd),
+                    sd_to_XYZ_ASTME30815(sd, self._cmfs, self._A, **kwargs_i),
+                    decimal=7)
+
+    def test_integration(self):
+        """
+        Tests :class:`colour.colorimetry.tristimulus.TristimulusEngine` class
+        against :func:`colour.colorimetry.tristimulus.sd_to_XYZ_integration`
+        and :func:`colour.colorimetry.tristimulus.multi_sd_to_XYZ_integration`
+        definitions.
+        """
+
+        for shape in (self._cmfs.shape, SpectralShape(400, 700, 1)):
+            sd = self._sd.copy().align(shape)
+            engine = TristimulusEngine(
+                self._cmfs, self._A, shape, method='Integration')
+            np.testing.assert_almost_equal(
+                engine(sd),
+                sd_to_XYZ_integration(sd, self._cmfs, self._A),
+                decimal=7)
+
+        engine = TristimulusEngine(
+            self._cmfs,
+            ILLUMINANTS_SDS['D65'],
+            SpectralShape(400, 700, 60),
+            method='Integration')
+        np.testing.assert_almost_equal(engine(MSD), XYZ_D65, decimal=7)
+
+    def test_multi_spectral_distribution(self):
+        """
+        Tests :class:`colour.colorimetry.tristimulus.TristimulusEngine` class
+        conversion of multi-spectral distributions and arrays.
+        """
+
+        engine = TristimulusEngine(self._cmfs, self._A, self._sd.shape)
+        XYZ = engine(self._sd)
+
+        msd = MultiSpectralDistribution(
+            np.transpose([self._sd.values] * 3), self._sd.wavelengths)
+        np.testing.assert_almost_equal(
+            engine(msd), np.tile(XYZ, (3, 1)), decimal=7)
+
+        np.testing.assert_almost_equal(
+            engine(np.tile(self._sd.values, (2, 3, 1))),
+            np.tile(XYZ, (2, 3, 1)),
+            decimal=7)
+
+    def test_raise_exception_TristimulusEngine(self):
+        """
+        Tests :class:`colour.colorimetry.tristimulus.TristimulusEngine` class
+        raised exception.
+        """
+
+        self.assertRaises(ValueError, TristimulusEngine, self._cmfs, self._A,
+                          SpectralShape(400, 700, 2))
+
+        self.assertRaises(
+            ValueError,
+            TristimulusEngine,
+            self._cmfs,
+            self._A,
+            self._sd.shape,
+            method='Undefined')
+
+        engine = TristimulusEngine(self._cmfs, self._A, self._sd.shape)
+        self.assertRaises(ValueError, engine, np.ones(3))
+
+
 class TestWavelength_to_XYZ(unittest.TestCase):
     """
     Defines :func:`colour.colorimetry.tristimulus.wavelength_to_XYZ` definition
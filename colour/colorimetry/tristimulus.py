@@ -12,7 +12,9 @@ sd_to_XYZ_tristimulus_weighting_factors_ASTME30815`
 -   :func:`colour.colorimetry.sd_to_XYZ_ASTME30815`
 -   :func:`colour.sd_to_XYZ`
 -   :func:`colour.colorimetry.multi_sd_to_XYZ_integration`
+-   :func:`colour.colorimetry.multi_sd_to_XYZ_ASTME30815`
 -   :func:`colour.multi_sd_to_XYZ`
+-   :class:`colour.colorimetry.TristimulusEngine`
 -   :func:`colour.wavelength_to_XYZ`
 
 The default implementation is based on practise *ASTM E308-15* method.
@@ -33,14 +35,15 @@ References
 from __future__ import division, unicode_literals
 
 import numpy as np
+from collections import OrderedDict
 
 from colour.algebra import lagrange_coefficients
-from colour.colorimetry import (DEFAULT_SPECTRAL_SHAPE, SpectralShape,
-                                STANDARD_OBSERVERS_CMFS, sd_ones)
-from colour.constants import DEFAULT_INT_DTYPE
+from colour.colorimetry import (
+    DEFAULT_SPECTRAL_SHAPE, MultiSpectralDistribution, SpectralDistribution,
+    SpectralShape, STANDARD_OBSERVERS_CMFS, reshape_sd, sd_ones)
+from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
 from colour.utilities import (CaseInsensitiveMapping, as_float_array,
-                              filter_kwargs, from_range_100, runtime_warning,
-                              tsplit)
+                              filter_kwargs, from_range_100, runtime_warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -55,8 +58,9 @@ __all__ = [
     'adjust_tristimulus_weighting_factors_ASTME30815', 'sd_to_XYZ_integration',
     'sd_to_XYZ_tristimulus_weighting_factors_ASTME30815',
     'sd_to_XYZ_ASTME30815', 'SD_TO_XYZ_METHODS', 'sd_to_XYZ',
-    'multi_sd_to_XYZ_integration', 'MULTI_SD_TO_XYZ_METHODS',
-    'multi_sd_to_XYZ', 'wavelength_to_XYZ'
+    'multi_sd_to_XYZ_integration', 'multi_sd_to_XYZ_ASTME30815',
+    'MULTI_SD_TO_XYZ_METHODS', 'multi_sd_to_XYZ', 'TristimulusEngine',
+    'wavelength_to_XYZ'
 ]
 
 ASTME30815_PRACTISE_SHAPE = DEFAULT_SPECTRAL_SHAPE
@@ -73,6 +77,7 @@ ASTME30815_PRACTISE_SHAPE : SpectralShape
 _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE = None
 
 _TRISTIMULUS_WEIGHTING_FACTORS_CACHE = None
+_TRISTIMULUS_WEIGHTING_FACTORS_CACHE_SIZE = 32
 
 
 def lagrange_coefficients_ASTME202211(interval=10, interval_type='inner'):
@@ -172,20 +177,15 @@ def tristimulus_weighting_factors_ASTME202211(cmfs, illuminant, shape):
         If the colour matching functions or illuminant intervals are not equal
         to 1 nm.
 
-    Warning
-    -------
-    -   The tables of tristimulus weighting factors are cached in
-        :attr:`colour.colorimetry.tristimulus.\
-_TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
-        defined by the colour matching functions and illuminant names along
-        the current shape such as:
-        `CIE 1964 10 Degree Standard Observer, A, (360.0, 830.0, 10.0)`
-        Considering the above, one should be mindful that using similar colour
-        matching functions and illuminant names but with different spectral
-        data will lead to unexpected behaviour.
-
     Notes
     -----
+    -   The tables of tristimulus weighting factors are cached in
+        :attr:`colour.colorimetry.tristimulus.\
+_TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute with least recently used
+        eviction. Their identifier key is defined by the colour matching
+        functions and illuminant
+        :attr:`colour.continuous.Signal.fingerprint` attribute along the
+        current shape.
     -   Input colour matching functions and illuminant intervals are expected
         to be equal to 1 nm. If the illuminant data is not available at 1 nm
         interval, it needs to be interpolated using *CIE* recommendations:
@@ -244,17 +244,20 @@ _TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
 
     global _TRISTIMULUS_WEIGHTING_FACTORS_CACHE
     if _TRISTIMULUS_WEIGHTING_FACTORS_CACHE is None:
-        _TRISTIMULUS_WEIGHTING_FACTORS_CACHE = CaseInsensitiveMapping()
+        _TRISTIMULUS_WEIGHTING_FACTORS_CACHE = OrderedDict()
 
-    name_twf = ', '.join((cmfs.name, illuminant.name, str(shape)))
-    if name_twf in _TRISTIMULUS_WEIGHTING_FACTORS_CACHE:
-        return _TRISTIMULUS_WEIGHTING_FACTORS_CACHE[name_twf]
+    key_twf = (cmfs.fingerprint, illuminant.fingerprint, str(shape))
+
+    if key_twf in _TRISTIMULUS_WEIGHTING_FACTORS_CACHE:
+        W = _TRISTIMULUS_WEIGHTING_FACTORS_CACHE.pop(key_twf)
+        _TRISTIMULUS_WEIGHTING_FACTORS_CACHE[key_twf] = W
+
+        return W
 
     Y = cmfs.values
     S = illuminant.values
 
     interval_i = DEFAULT_INT_DTYPE(shape.interval)
-    W = S[::interval_i, np.newaxis] * Y[::interval_i, :]
 
     # First and last measurement intervals *Lagrange Coefficients*.
     c_c = lagrange_coefficients_ASTME202211(interval_i, 'boundary')
@@ -269,38 +272,41 @@ _TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
     w_lif = w_c - (w_c - 1) % interval_i - 1 - r_c
 
     # Intervals count.
-    i_c = W.shape[0]
+    i_c = len(range(0, w_c, interval_i))
     i_cm = i_c - 1
 
-    for i in range(3):
+    # Banded matrix distributing the wavelengths onto the measurement
+    # intervals: the tristimulus weighting factors are given by its product
+    # with the illuminant weighted colour matching functions.
+    A = np.zeros([i_c, w_c])
+    A[np.arange(i_c), np.arange(i_c) * interval_i] = 1
+
+    if r_c > 0:
+        j = np.arange(r_c)[:, np.newaxis]
+        k = np.arange(3)[np.newaxis, :]
+
         # First interval.
-        for j in range(r_c):
-            for k in range(3):
-                W[k, i] = W[k, i] + c_c[j, k] * S[j + 1] * Y[j + 1, i]
+        np.add.at(A, (k, j + 1), c_c)
 
         # Last interval.
-        for j in range(r_c):
-            for k in range(i_cm, i_cm - 3, -1):
-                W[k, i] = (W[k, i] + c_c[r_c - j - 1, i_cm - k] * S[j + w_lif]
-                           * Y[j + w_lif, i])
+        np.add.at(A, (i_cm - k, j + w_lif), c_c[::-1])
 
         # Intermediate intervals.
-        for j in range(i_c - 3):
-            for k in range(r_c):
-                w_i = (r_c + 1) * (j + 1) + 1 + k
-                W[j, i] = W[j, i] + c_b[k, 0] * S[w_i] * Y[w_i, i]
-                W[j + 1, i] = W[j + 1, i] + c_b[k, 1] * S[w_i] * Y[w_i, i]
-                W[j + 2, i] = W[j + 2, i] + c_b[k, 2] * S[w_i] * Y[w_i, i]
-                W[j + 3, i] = W[j + 3, i] + c_b[k, 3] * S[w_i] * Y[w_i, i]
-
-        # Extrapolation of potential incomplete interval.
-        for j in range(
-                DEFAULT_INT_DTYPE(w_c - ((w_c - 1) % interval_i)), w_c, 1):
-            W[i_cm, i] = W[i_cm, i] + S[j] * Y[j, i]
+        i = np.arange(max(i_c - 3, 0))[:, np.newaxis, np.newaxis]
+        w_i = (r_c + 1) * (i + 1) + 1 + j[np.newaxis, ...]
+        np.add.at(A, (i + np.arange(4), w_i), c_b[np.newaxis, ...])
+
+    # Extrapolation of potential incomplete interval.
+    A[i_cm, DEFAULT_INT_DTYPE(w_c - ((w_c - 1) % interval_i)):w_c] += 1
+
+    W = np.dot(A, S[..., np.newaxis] * Y)
 
     W *= 100 / np.sum(W, axis=0)[1]
 
-    _TRISTIMULUS_WEIGHTING_FACTORS_CACHE[name_twf] = W
+    _TRISTIMULUS_WEIGHTING_FACTORS_CACHE[key_twf] = W
+    while (len(_TRISTIMULUS_WEIGHTING_FACTORS_CACHE) >
+           _TRISTIMULUS_WEIGHTING_FACTORS_CACHE_SIZE):
+        _TRISTIMULUS_WEIGHTING_FACTORS_CACHE.popitem(last=False)
 
     return W
 
@@ -378,6 +384,350 @@ def adjust_tristimulus_weighting_factors_ASTME30815(W, shape_r, shape_t):
     return W[start_index:-end_index or None, ...]
 
 
+def _tristimulus_weighting_matrix_integration(cmfs, illuminant):
+    """
+    Returns the weighting matrix converting spectral data sharing the shape of
+    given colour matching functions and illuminant to *CIE XYZ* tristimulus
+    values according to classical integration method.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution
+        Illuminant spectral distribution.
+
+    Returns
+    -------
+    ndarray, (bins, 3)
+        Weighting matrix.
+    """
+
+    S = illuminant.values
+    dw = cmfs.shape.interval
+
+    W = S[..., np.newaxis] * cmfs.values * dw
+    W *= 100 / np.sum(W[..., 1])
+
+    return W
+
+
+def _tristimulus_weighting_matrix_ASTME30815(cmfs, illuminant, shape):
+    """
+    Returns the table of tristimulus weighting factors for given colour
+    matching functions and illuminant adjusted to given test spectral shape
+    using practise *ASTM E308-15* method.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution
+        Illuminant spectral distribution.
+    shape : SpectralShape
+        Test spectral shape.
+
+    Returns
+    -------
+    ndarray, (bins, 3)
+        Adjusted tristimulus weighting factors.
+    """
+
+    W = tristimulus_weighting_factors_ASTME202211(
+        cmfs, illuminant,
+        SpectralShape(cmfs.shape.start, cmfs.shape.end, shape.interval))
+    start_w = cmfs.shape.start
+    end_w = cmfs.shape.start + shape.interval * (W.shape[0] - 1)
+
+    return adjust_tristimulus_weighting_factors_ASTME30815(
+        W, SpectralShape(start_w, end_w, shape.interval), shape)
+
+
+def _interpolate_sd_20nm_ASTME30815(sd):
+    """
+    Interpolates given 20 nm measurement interval spectral distribution to
+    10 nm using practise *ASTM E308-15* dedicated interpolation method.
+
+    Parameters
+    ----------
+    sd : SpectralDistribution
+        Spectral distribution, it is modified in place.
+
+    Returns
+    -------
+    SpectralDistribution
+        Interpolated spectral distribution.
+    """
+
+    # Extrapolation of additional 20nm padding intervals.
+    sd.align(SpectralShape(sd.shape.start - 20, sd.shape.end + 20, 10))
+    for i in range(2):
+        sd[sd.wavelengths[i]] = (
+            3 * sd.values[i + 2] -
+            3 * sd.values[i + 4] + sd.values[i + 6])  # yapf: disable
+        i_e = len(sd.domain) - 1 - i
+        sd[sd.wavelengths[i_e]] = (
+            sd.values[i_e - 6] - 3 * sd.values[i_e - 4] +
+            3 * sd.values[i_e - 2])
+
+    # Interpolating every odd numbered values.
+    # TODO: Investigate code vectorisation.
+    for i in range(3, len(sd.domain) - 3, 2):
+        sd[sd.wavelengths[i]] = (
+            -0.0625 * sd.values[i - 3] + 0.5625 * sd.values[i - 1] +
+            0.5625 * sd.values[i + 1] - 0.0625 * sd.values[i + 3])
+
+    # Discarding the additional 20nm padding intervals.
+    sd.trim(SpectralShape(sd.shape.start + 20, sd.shape.end - 20, 10))
+
+    return sd
+
+
+def _fold_tristimulus_weighting_matrix(W, shape_r, shape_t):
+    """
+    Folds given weighting matrix from given reference spectral shape onto
+    given test spectral shape sharing the same interval: the weights at the
+    wavelengths outside the test spectral shape are added to the weights at
+    its shortest and longest wavelengths, mirroring the constant
+    extrapolation of the spectral data, and the test spectral shape
+    wavelengths outside the reference spectral shape are given null weights.
+
+    Parameters
+    ----------
+    W : array_like
+        Weighting matrix.
+    shape_r : SpectralShape
+        Reference spectral shape.
+    shape_t : SpectralShape
+        Test spectral shape.
+
+    Returns
+    -------
+    ndarray, (bins, 3)
+        Folded weighting matrix.
+    """
+
+    wavelengths = shape_t.range()
+
+    index = np.around((shape_r.range() - shape_t.start) / shape_t.interval)
+    index = np.clip(index, 0, len(wavelengths) - 1).astype(DEFAULT_INT_DTYPE)
+
+    W_t = np.zeros([len(wavelengths), 3])
+    np.add.at(W_t, index, W)
+
+    return W_t
+
+
+def _tristimulus_weighting_matrix_shape_integration(cmfs, illuminant,
+                                                    shape=None):
+    """
+    Returns the weighting matrix converting spectral data with given spectral
+    shape to *CIE XYZ* tristimulus values according to classical integration
+    method, reproducing the alignment of the spectral data to the colour
+    matching functions shape.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution
+        Illuminant spectral distribution.
+    shape : SpectralShape, optional
+        Spectral shape of the spectral data, default to the colour matching
+        functions shape.
+
+    Returns
+    -------
+    tuple
+        Weighting matrix and spectral shape of the spectral data.
+    """
+
+    if shape is None:
+        shape = cmfs.shape
+
+    if cmfs.shape.interval != shape.interval:
+        runtime_warning('Aligning "{0}" cmfs shape to "{1}".'.format(
+            cmfs.name, shape))
+        cmfs = reshape_sd(cmfs, shape)
+
+    if illuminant.shape != cmfs.shape:
+        runtime_warning(
+            'Aligning "{0}" illuminant shape to "{1}" colour matching '
+            'functions shape.'.format(illuminant.name, cmfs.name))
+        illuminant = reshape_sd(illuminant, cmfs.shape)
+
+    W = _tristimulus_weighting_matrix_integration(cmfs, illuminant)
+
+    return _fold_tristimulus_weighting_matrix(W, cmfs.shape, shape), shape
+
+
+def _tristimulus_weighting_matrix_shape_ASTME30815(
+        cmfs,
+        illuminant,
+        shape=None,
+        use_practice_range=True,
+        mi_5nm_omission_method=True,
+        mi_20nm_interpolation_method=True):
+    """
+    Returns the weighting matrix converting spectral data with given spectral
+    shape to *CIE XYZ* tristimulus values according to practise
+    *ASTM E308-15* method, reproducing the trimming and interpolation of the
+    spectral data performed by
+    :func:`colour.colorimetry.sd_to_XYZ_ASTME30815` definition.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution
+        Illuminant spectral distribution.
+    shape : SpectralShape, optional
+        Spectral shape of the spectral data, default to the colour matching
+        functions shape.
+    use_practice_range : bool, optional
+        Practise *ASTM E308-15* working wavelengths range is [360, 780],
+        if *True* this argument will trim the colour matching functions
+        appropriately.
+    mi_5nm_omission_method : bool, optional
+        5 nm measurement intervals spectral distribution conversion to
+        tristimulus values will use a 5 nm version of the colour matching
+        functions instead of a table of tristimulus weighting factors.
+    mi_20nm_interpolation_method : bool, optional
+        20 nm measurement intervals spectral distribution conversion to
+        tristimulus values will use a dedicated interpolation method instead
+        of a table of tristimulus weighting factors.
+
+    Returns
+    -------
+    tuple
+        Weighting matrix and spectral shape of the spectral data.
+
+    Raises
+    ------
+    ValueError
+        If the spectral shape interval is not 1, 5, 10 or 20 nm.
+    """
+
+    if use_practice_range:
+        cmfs = reshape_sd(cmfs, ASTME30815_PRACTISE_SHAPE, 'Trim')
+
+    if shape is None:
+        shape = cmfs.shape
+
+    if shape.interval not in (1, 5, 10, 20):
+        raise ValueError(
+            'Tristimulus values conversion from spectral data according to '
+            'practise "ASTM E308-15" should be performed on spectral data '
+            'with measurement interval of 1, 5, 10 or 20nm!')
+
+    if shape.interval == 1 or (shape.interval == 5 and
+                               mi_5nm_omission_method):
+        if shape.interval == 5 and cmfs.shape.interval != 5:
+            cmfs = reshape_sd(cmfs, SpectralShape(interval=5),
+                              'Interpolate')
+
+        return _tristimulus_weighting_matrix_shape_integration(
+            cmfs, illuminant, shape)
+
+    if illuminant.shape != cmfs.shape:
+        runtime_warning(
+            'Aligning "{0}" illuminant shape to "{1}" colour matching '
+            'functions shape.'.format(illuminant.name, cmfs.name))
+        illuminant = reshape_sd(illuminant, cmfs.shape)
+
+    shape_t = shape
+    if shape.boundaries != cmfs.shape.boundaries:
+        runtime_warning('Trimming "{0}" shape to "{1}" colour matching '
+                        'functions shape.'.format(shape, cmfs.name))
+        shape_t = sd_ones(shape).trim(cmfs.shape).shape
+
+    if shape.interval == 20 and mi_20nm_interpolation_method:
+        # The dedicated interpolation method being linear, its matrix is
+        # built by interpolating the canonical basis.
+        basis = [
+            _interpolate_sd_20nm_ASTME30815(
+                SpectralDistribution(e, shape_t.range()))
+            for e in np.identity(len(shape_t.range()))
+        ]
+        M = as_float_array([sd.values for sd in basis])
+        W = np.dot(M,
+                   _tristimulus_weighting_matrix_ASTME30815(
+                       cmfs, illuminant, basis[0].shape))
+    else:
+        W = _tristimulus_weighting_matrix_ASTME30815(cmfs, illuminant,
+                                                     shape_t)
+
+    return _fold_tristimulus_weighting_matrix(W, shape_t, shape), shape
+
+
+def _tristimulus_weighting_matrix_contraction(msd,
+                                              W,
+                                              tile_size=None,
+                                              dtype=None,
+                                              out=None):
+    """
+    Contracts given multi-spectral distribution array :math:`msd` against
+    given weighting matrix, tile by tile over its flattened spatial axes.
+
+    Parameters
+    ----------
+    msd : array_like
+        Multi-spectral distribution array :math:`msd`, the wavelengths are
+        expected to be in the last axis.
+    W : array_like
+        Weighting matrix.
+    tile_size : int, optional
+        Count of spectral distributions converted at once, the whole
+        multi-spectral distribution array :math:`msd` is converted at once if
+        *None*.
+    dtype : type, optional
+        Working and output data type.
+    out : ndarray, optional
+        C-contiguous output array.
+
+    Returns
+    -------
+    ndarray
+        *CIE XYZ* tristimulus values.
+
+    Raises
+    ------
+    ValueError
+        If the output array is not C-contiguous or does not have the
+        expected shape and data type.
+    """
+
+    if dtype is None:
+        dtype = DEFAULT_FLOAT_DTYPE
+
+    msd = np.asarray(msd)
+    W = np.asarray(W, dtype=dtype)
+
+    shape_XYZ = msd.shape[:-1] + (3, )
+    if out is None:
+        out = np.empty(shape_XYZ, dtype=dtype)
+    elif (out.shape != shape_XYZ or out.dtype != dtype or
+          not out.flags.c_contiguous):
+        raise ValueError(
+            '"out" array must be C-contiguous with "{0}" shape and "{1}" '
+            'data type!'.format(shape_XYZ, np.dtype(dtype)))
+
+    R = np.reshape(msd, (-1, msd.shape[-1]))
+    XYZ = np.reshape(out, (-1, 3))
+
+    count = R.shape[0]
+    if tile_size is None:
+        tile_size = max(count, 1)
+
+    for i in range(0, count, tile_size):
+        np.dot(
+            np.asarray(R[i:i + tile_size], dtype=dtype),
+            W,
+            out=XYZ[i:i + tile_size])
+
+    return out
+
+
 def sd_to_XYZ_integration(
         sd,
         cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
@@ -449,7 +799,7 @@ def sd_to_XYZ_integration(
         runtime_warning(
             'Aligning "{0}" illuminant shape to "{1}" colour matching '
             'functions shape.'.format(illuminant.name, cmfs.name))
-        illuminant = illuminant.copy().align(cmfs.shape)
+        illuminant = reshape_sd(illuminant, cmfs.shape)
 
     if sd.shape != cmfs.shape:
         runtime_warning('Aligning "{0}" spectral distribution shape to "{1}" '
@@ -457,18 +807,9 @@ def sd_to_XYZ_integration(
                             sd.name, cmfs.name))
         sd = sd.copy().align(cmfs.shape)
 
-    S = illuminant.values
-    x_bar, y_bar, z_bar = tsplit(cmfs.values)
-    R = sd.values
-    dw = cmfs.shape.interval
-
-    k = 100 / (np.sum(y_bar * S) * dw)
-
-    X_p = R * x_bar * S * dw
-    Y_p = R * y_bar * S * dw
-    Z_p = R * z_bar * S * dw
+    W = _tristimulus_weighting_matrix_integration(cmfs, illuminant)
 
-    XYZ = k * np.sum(np.array([X_p, Y_p, Z_p]), axis=-1)
+    XYZ = np.dot(sd.values, W)
 
     return from_range_100(XYZ)
 
@@ -543,7 +884,7 @@ def sd_to_XYZ_tristimulus_weighting_factors_ASTME30815(
         runtime_warning(
             'Aligning "{0}" illuminant shape to "{1}" colour matching '
             'functions shape.'.format(illuminant.name, cmfs.name))
-        illuminant = illuminant.copy().align(cmfs.shape)
+        illuminant = reshape_sd(illuminant, cmfs.shape)
 
     if sd.shape.boundaries != cmfs.shape.boundaries:
         runtime_warning('Trimming "{0}" spectral distribution shape to "{1}" '
@@ -551,13 +892,7 @@ def sd_to_XYZ_tristimulus_weighting_factors_ASTME30815(
                             illuminant.name, cmfs.name))
         sd = sd.copy().trim(cmfs.shape)
 
-    W = tristimulus_weighting_factors_ASTME202211(
-        cmfs, illuminant,
-        SpectralShape(cmfs.shape.start, cmfs.shape.end, sd.shape.interval))
-    start_w = cmfs.shape.start
-    end_w = cmfs.shape.start + sd.shape.interval * (W.shape[0] - 1)
-    W = adjust_tristimulus_weighting_factors_ASTME30815(
-        W, SpectralShape(start_w, end_w, sd.shape.interval), sd.shape)
+    W = _tristimulus_weighting_matrix_ASTME30815(cmfs, illuminant, sd.shape)
     R = sd.values
 
     XYZ = np.sum(W * R[..., np.newaxis], axis=0)
@@ -603,18 +938,6 @@ def sd_to_XYZ_ASTME30815(
     ndarray, (3,)
         *CIE XYZ* tristimulus values.
 
-    Warning
-    -------
-    -   The tables of tristimulus weighting factors are cached in
-        :attr:`colour.colorimetry.tristimulus.\
-_TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
-        defined by the colour matching functions and illuminant names along
-        the current shape such as:
-        `CIE 1964 10 Degree Standard Observer, A, (360.0, 830.0, 10.0)`
-        Considering the above, one should be mindful that using similar colour
-        matching functions and illuminant names but with different spectral
-        data will lead to unexpected behaviour.
-
     Notes
     -----
 
@@ -665,14 +988,15 @@ _TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
             'with measurement interval of 1, 5, 10 or 20nm!')
 
     if use_practice_range:
-        cmfs = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
+        cmfs = reshape_sd(cmfs, ASTME30815_PRACTISE_SHAPE, 'Trim')
 
     method = sd_to_XYZ_tristimulus_weighting_factors_ASTME30815
     if sd.shape.interval == 1:
         method = sd_to_XYZ_integration
     elif sd.shape.interval == 5 and mi_5nm_omission_method:
         if cmfs.shape.interval != 5:
-            cmfs = cmfs.copy().interpolate(SpectralShape(interval=5))
+            cmfs = reshape_sd(cmfs, SpectralShape(interval=5),
+                              'Interpolate')
         method = sd_to_XYZ_integration
     elif sd.shape.interval == 20 and mi_20nm_interpolation_method:
         sd = sd.copy()
@@ -683,26 +1007,7 @@ _TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their identifier key is
                     illuminant.name, cmfs.name))
             sd.trim(cmfs.shape)
 
-        # Extrapolation of additional 20nm padding intervals.
-        sd.align(SpectralShape(sd.shape.start - 20, sd.shape.end + 20, 10))
-        for i in range(2):
-            sd[sd.wavelengths[i]] = (
-                3 * sd.values[i + 2] -
-                3 * sd.values[i + 4] + sd.values[i + 6])  # yapf: disable
-            i_e = len(sd.domain) - 1 - i
-            sd[sd.wavelengths[i_e]] = (
-                sd.values[i_e - 6] - 3 * sd.values[i_e - 4] +
-                3 * sd.values[i_e - 2])
-
-        # Interpolating every odd numbered values.
-        # TODO: Investigate code vectorisation.
-        for i in range(3, len(sd.domain) - 3, 2):
-            sd[sd.wavelengths[i]] = (
-                -0.0625 * sd.values[i - 3] + 0.5625 * sd.values[i - 1] +
-                0.5625 * sd.values[i + 1] - 0.0625 * sd.values[i + 3])
-
-        # Discarding the additional 20nm padding intervals.
-        sd.trim(SpectralShape(sd.shape.start + 20, sd.shape.end - 20, 10))
+        sd = _interpolate_sd_20nm_ASTME30815(sd)
 
     XYZ = method(sd, cmfs, illuminant)
 
@@ -837,7 +1142,10 @@ def multi_sd_to_XYZ_integration(
         shape,
         cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
         illuminant=sd_ones(STANDARD_OBSERVERS_CMFS[
-            'CIE 1931 2 Degree Standard Observer'].shape)):
+            'CIE 1931 2 Degree Standard Observer'].shape),
+        tile_size=None,
+        dtype=None,
+        out=None):
     """
     Converts given multi-spectral distribution array :math:`msd` with given
     spectral shape to *CIE XYZ* tristimulus values using given colour matching
@@ -856,6 +1164,17 @@ def multi_sd_to_XYZ_integration(
         Standard observer colour matching functions.
     illuminant : SpectralDistribution, optional
         Illuminant spectral distribution.
+    tile_size : int, optional
+        Count of spectral distributions converted at once, bounding the peak
+        memory usage to a tile of ``tile_size`` spectral distributions at
+        the working data type. The whole multi-spectral distribution array
+        :math:`msd` is converted at once if *None*.
+    dtype : type, optional
+        Working and output data type, e.g. :class:`numpy.float32`, default
+        to :attr:`colour.constants.DEFAULT_FLOAT_DTYPE`.
+    out : ndarray, optional
+        C-contiguous array with the output shape and data type into which
+        the *CIE XYZ* tristimulus values are written.
 
     Returns
     -------
@@ -863,6 +1182,12 @@ def multi_sd_to_XYZ_integration(
         *CIE XYZ* tristimulus values, for a 512x384 multi-spectral image with
         77 bins, the output shape will be (384, 512, 3).
 
+    Raises
+    ------
+    ValueError
+        If the output array is not C-contiguous or does not have the
+        expected shape and data type.
+
     Notes
     -----
 
@@ -872,6 +1197,12 @@ def multi_sd_to_XYZ_integration(
     | ``XYZ``   | [0, 100]              | [0, 1]        |
     +-----------+-----------------------+---------------+
 
+    -   The multi-spectral distribution array :math:`msd` is contracted
+        against a single (bins, 3) weighting matrix, tile by tile over its
+        spatial axes, and the tiles are only cast to the working data type
+        as they are processed. A multi-spectral distribution array that is
+        not C-contiguous will be copied when flattening its spatial axes.
+
     References
     ----------
     :cite:`Wyszecki2000bf`
@@ -916,34 +1247,142 @@ def multi_sd_to_XYZ_integration(
             [ 24.7830551...,  26.2221584...,  36.4430633...]]])
     """
 
-    msd = as_float_array(msd)
-
     if cmfs.shape != shape:
         runtime_warning('Aligning "{0}" cmfs shape to "{1}".'.format(
             cmfs.name, shape))
-        cmfs = cmfs.copy().align(shape)
+        cmfs = reshape_sd(cmfs, shape)
 
     if illuminant.shape != shape:
         runtime_warning('Aligning "{0}" illuminant shape to "{1}".'.format(
             illuminant.name, shape))
-        illuminant = illuminant.copy().align(shape)
+        illuminant = reshape_sd(illuminant, shape)
 
-    S = illuminant.values
-    x_bar, y_bar, z_bar = tsplit(cmfs.values)
-    dw = cmfs.shape.interval
+    # The range scale is folded into the weighting matrix so that the output
+    # does not need to be scaled afterwards.
+    W = from_range_100(
+        _tristimulus_weighting_matrix_integration(cmfs, illuminant))
+
+    return _tristimulus_weighting_matrix_contraction(msd, W, tile_size, dtype,
+                                                     out)
+
+
+def multi_sd_to_XYZ_ASTME30815(
+        msd,
+        shape,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        illuminant=sd_ones(ASTME30815_PRACTISE_SHAPE),
+        use_practice_range=True,
+        mi_5nm_omission_method=True,
+        mi_20nm_interpolation_method=True,
+        tile_size=None,
+        dtype=None,
+        out=None):
+    """
+    Converts given multi-spectral distribution array :math:`msd` with given
+    spectral shape to *CIE XYZ* tristimulus values using given colour matching
+    functions and illuminant according to practise *ASTM E308-15* method.
+
+    Parameters
+    ----------
+    msd : array_like
+        Multi-spectral distribution array :math:`msd`, the wavelengths are
+        expected to be in the last axis, e.g. for a 512x384 multi-spectral
+        image with 77 bins, ``msd`` shape should be (384, 512, 77).
+    shape : SpectralShape
+        Spectral shape of the multi-spectral distribution array :math:`msd`.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution, optional
+        Illuminant spectral distribution.
+    use_practice_range : bool, optional
+        Practise *ASTM E308-15* working wavelengths range is [360, 780],
+        if *True* this argument will trim the colour matching functions
+        appropriately.
+    mi_5nm_omission_method : bool, optional
+        5 nm measurement intervals multi-spectral distribution array
+        conversion to tristimulus values will use a 5 nm version of the colour
+        matching functions instead of a table of tristimulus weighting
+        factors.
+    mi_20nm_interpolation_method : bool, optional
+        20 nm measurement intervals multi-spectral distribution array
+        conversion to tristimulus values will use a dedicated interpolation
+        method instead of a table of tristimulus weighting factors.
+    tile_size : int, optional
+        Count of spectral distributions converted at once, bounding the peak
+        memory usage to a tile of ``tile_size`` spectral distributions at
+        the working data type. The whole multi-spectral distribution array
+        :math:`msd` is converted at once if *None*.
+    dtype : type, optional
+        Working and output data type, e.g. :class:`numpy.float32`, default
+        to :attr:`colour.constants.DEFAULT_FLOAT_DTYPE`.
+    out : ndarray, optional
+        C-contiguous array with the output shape and data type into which
+        the *CIE XYZ* tristimulus values are written.
 
-    k = 100 / (np.sum(y_bar * S) * dw)
+    Returns
+    -------
+    array_like
+        *CIE XYZ* tristimulus values, for a 512x384 multi-spectral image with
+        77 bins, the output shape will be (384, 512, 3).
 
-    X_p = msd * x_bar * S * dw
-    Y_p = msd * y_bar * S * dw
-    Z_p = msd * z_bar * S * dw
+    Raises
+    ------
+    ValueError
+        If the spectral shape interval is not 1, 5, 10 or 20 nm or if the
+        output array is not C-contiguous or does not have the expected shape
+        and data type.
 
-    XYZ = k * np.sum(np.array([X_p, Y_p, Z_p]), axis=-1)
+    Notes
+    -----
 
-    return from_range_100(np.rollaxis(XYZ, 0, msd.ndim))
+    +-----------+-----------------------+---------------+
+    | **Range** | **Scale - Reference** | **Scale - 1** |
+    +===========+=======================+===============+
+    | ``XYZ``   | [0, 100]              | [0, 1]        |
+    +-----------+-----------------------+---------------+
+
+    -   The tables of tristimulus weighting factors, adjusted to the spectral
+        shape, are applied to the multi-spectral distribution array
+        :math:`msd` in a single contraction yielding the same values than
+        :func:`colour.colorimetry.sd_to_XYZ_ASTME30815` definition for each
+        of its spectral distributions.
+
+    References
+    ----------
+    :cite:`ASTMInternational2015b`
+
+    Examples
+    --------
+    >>> from colour import CMFS, ILLUMINANTS_SDS, SpectralShape
+    >>> cmfs = CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> msd = np.array([
+    ...     [0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772,
+    ...      0.0870, 0.1128, 0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852],
+    ...     [0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772,
+    ...      0.0870, 0.1128, 0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852],
+    ... ])
+    >>> illuminant = ILLUMINANTS_SDS['D65']
+    >>> multi_sd_to_XYZ_ASTME30815(
+    ...     msd, SpectralShape(400, 700, 20), cmfs, illuminant)
+    ... # doctest: +ELLIPSIS
+    array([[ 10.8399031...,   9.6840375...,   6.2164159...],
+           [ 10.8399031...,   9.6840375...,   6.2164159...]])
+    """
+
+    W, shape = _tristimulus_weighting_matrix_shape_ASTME30815(
+        cmfs, illuminant, shape, use_practice_range, mi_5nm_omission_method,
+        mi_20nm_interpolation_method)
+
+    # The range scale is folded into the weighting matrix so that the output
+    # does not need to be scaled afterwards.
+    W = from_range_100(W)
+
+    return _tristimulus_weighting_matrix_contraction(msd, W, tile_size, dtype,
+                                                     out)
 
 
 MULTI_SD_TO_XYZ_METHODS = CaseInsensitiveMapping({
+    'ASTM E308-15': multi_sd_to_XYZ_ASTME30815,
     'Integration': multi_sd_to_XYZ_integration
 })
 MULTI_SD_TO_XYZ_METHODS.__doc__ = """
@@ -952,11 +1391,17 @@ methods.
 
 References
 ----------
-:cite:`Wyszecki2000bf`
+:cite:`ASTMInternational2015b`, :cite:`Wyszecki2000bf`
 
 MULTI_SD_TO_XYZ_METHODS : CaseInsensitiveMapping
-    **{'Integration'}**
+    **{'ASTM E308-15', 'Integration'}**
+
+Aliases:
+
+-   'astm2015': 'ASTM E308-15'
 """
+MULTI_SD_TO_XYZ_METHODS['astm2015'] = (
+    MULTI_SD_TO_XYZ_METHODS['ASTM E308-15'])
 
 
 def multi_sd_to_XYZ(
@@ -964,7 +1409,8 @@ def multi_sd_to_XYZ(
         shape=DEFAULT_SPECTRAL_SHAPE,
         cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
         illuminant=sd_ones(ASTME30815_PRACTISE_SHAPE),
-        method='Integration'):
+        method='Integration',
+        **kwargs):
     """
     Converts given multi-spectral distribution array :math:`msd` with given
     spectral shape to *CIE XYZ* tristimulus values using given colour matching
@@ -984,9 +1430,43 @@ def multi_sd_to_XYZ(
     illuminant : SpectralDistribution, optional
         Illuminant spectral distribution.
     method : unicode, optional
-        **{'Integration'}**,
+        **{'ASTM E308-15', 'Integration'}**,
         Computation method.
 
+    Other Parameters
+    ----------------
+    use_practice_range : bool, optional
+        {:func:`colour.colorimetry.multi_sd_to_XYZ_ASTME30815`},
+        Practise *ASTM E308-15* working wavelengths range is [360, 780],
+        if *True* this argument will trim the colour matching functions
+        appropriately.
+    mi_5nm_omission_method : bool, optional
+        {:func:`colour.colorimetry.multi_sd_to_XYZ_ASTME30815`},
+        5 nm measurement intervals multi-spectral distribution array
+        conversion to tristimulus values will use a 5 nm version of the colour
+        matching functions instead of a table of tristimulus weighting
+        factors.
+    mi_20nm_interpolation_method : bool, optional
+        {:func:`colour.colorimetry.multi_sd_to_XYZ_ASTME30815`},
+        20 nm measurement intervals multi-spectral distribution array
+        conversion to tristimulus values will use a dedicated interpolation
+        method instead of a table of tristimulus weighting factors.
+    tile_size : int, optional
+        {:func:`colour.colorimetry.multi_sd_to_XYZ_integration`,
+        :func:`colour.colorimetry.multi_sd_to_XYZ_ASTME30815`},
+        Count of spectral distributions converted at once, bounding the peak
+        memory usage to a tile of ``tile_size`` spectral distributions at
+        the working data type.
+    dtype : type, optional
+        {:func:`colour.colorimetry.multi_sd_to_XYZ_integration`,
+        :func:`colour.colorimetry.multi_sd_to_XYZ_ASTME30815`},
+        Working and output data type, e.g. :class:`numpy.float32`.
+    out : ndarray, optional
+        {:func:`colour.colorimetry.multi_sd_to_XYZ_integration`,
+        :func:`colour.colorimetry.multi_sd_to_XYZ_ASTME30815`},
+        C-contiguous array with the output shape and data type into which
+        the *CIE XYZ* tristimulus values are written.
+
     Returns
     -------
     array_like
@@ -1045,7 +1525,230 @@ def multi_sd_to_XYZ(
 
     function = MULTI_SD_TO_XYZ_METHODS[method]
 
-    return function(msd, shape, cmfs, illuminant)
+    return function(msd, shape, cmfs, illuminant,
+                    **filter_kwargs(function, **kwargs))
+
+
+class TristimulusEngine(object):
+    """
+    Converts spectral data to *CIE XYZ* tristimulus values using a weighting
+    matrix precomputed for given colour matching functions, illuminant,
+    spectral shape and method.
+
+    The weighting matrix has shape (bins, 3) so that the conversion of a
+    spectral distribution, a multi-spectral distribution or a multi-spectral
+    array reduces to a single matrix product.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution, optional
+        Illuminant spectral distribution.
+    shape : SpectralShape, optional
+        Spectral shape of the spectral data to convert, default to the colour
+        matching functions shape, trimmed to the practise range with
+        *ASTM E308-15* method.
+    method : unicode, optional
+        **{'ASTM E308-15', 'Integration'}**,
+        Computation method.
+
+    Other Parameters
+    ----------------
+    use_practice_range : bool, optional
+        {:func:`colour.colorimetry.sd_to_XYZ_ASTME30815`},
+        Practise *ASTM E308-15* working wavelengths range is [360, 780],
+        if *True* this argument will trim the colour matching functions
+        appropriately.
+    mi_5nm_omission_method : bool, optional
+        {:func:`colour.colorimetry.sd_to_XYZ_ASTME30815`},
+        5 nm measurement intervals spectral distribution conversion to
+        tristimulus values will use a 5 nm version of the colour matching
+        functions instead of a table of tristimulus weighting factors.
+    mi_20nm_interpolation_method : bool, optional
+        {:func:`colour.colorimetry.sd_to_XYZ_ASTME30815`},
+        20 nm measurement intervals spectral distribution conversion to
+        tristimulus values will use a dedicated interpolation method instead
+        of a table of tristimulus weighting factors.
+
+    Attributes
+    ----------
+    shape
+    method
+    weights
+
+    Methods
+    -------
+    __call__
+
+    Notes
+    -----
+    -   The weighting matrix reproduces the alignment or trimming of the
+        spectral data to the colour matching functions shape performed by
+        :func:`colour.sd_to_XYZ` definition, the dedicated 20 nm
+        interpolation method of the *ASTM E308-15* method, being linear, is
+        also folded into it. When the spectral shape and the colour matching
+        functions intervals differ with the *Integration* method, the colour
+        matching functions are aligned to the spectral shape as done by
+        :func:`colour.multi_sd_to_XYZ` definition.
+    -   Spectral distributions and multi-spectral distributions with a
+        different shape are aligned to the engine spectral shape.
+
+    References
+    ----------
+    :cite:`ASTMInternational2011a`, :cite:`ASTMInternational2015b`,
+    :cite:`Wyszecki2000bf`
+
+    Examples
+    --------
+    >>> from colour import (
+    ...     CMFS, ILLUMINANTS_SDS, SpectralDistribution, SpectralShape)
+    >>> cmfs = CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> data = {
+    ...     400: 0.0641,
+    ...     420: 0.0645,
+    ...     440: 0.0562,
+    ...     460: 0.0537,
+    ...     480: 0.0559,
+    ...     500: 0.0651,
+    ...     520: 0.0705,
+    ...     540: 0.0772,
+    ...     560: 0.0870,
+    ...     580: 0.1128,
+    ...     600: 0.1360,
+    ...     620: 0.1511,
+    ...     640: 0.1688,
+    ...     660: 0.1996,
+    ...     680: 0.2397,
+    ...     700: 0.2852
+    ... }
+    >>> sd = SpectralDistribution(data)
+    >>> illuminant = ILLUMINANTS_SDS['D65']
+    >>> engine = TristimulusEngine(cmfs, illuminant, sd.shape)
+    >>> engine(sd)  # doctest: +ELLIPSIS
+    array([ 10.8399031...,   9.6840375...,   6.2164159...])
+    >>> engine(np.tile(sd.values, (2, 1)))  # doctest: +ELLIPSIS
+    array([[ 10.8399031...,   9.6840375...,   6.2164159...],
+           [ 10.8399031...,   9.6840375...,   6.2164159...]])
+    """
+
+    def __init__(
+            self,
+            cmfs=STANDARD_OBSERVERS_CMFS[
+                'CIE 1931 2 Degree Standard Observer'],
+            illuminant=sd_ones(ASTME30815_PRACTISE_SHAPE),
+            shape=None,
+            method='ASTM E308-15',
+            **kwargs):
+
+        if method.lower() in ('astm e308-15', 'astm2015'):
+            self._weights, self._shape = (
+                _tristimulus_weighting_matrix_shape_ASTME30815(
+                    cmfs, illuminant, shape,
+                    **filter_kwargs(
+                        _tristimulus_weighting_matrix_shape_ASTME30815,
+                        **kwargs)))
+        elif method.lower() == 'integration':
+            self._weights, self._shape = (
+                _tristimulus_weighting_matrix_shape_integration(
+                    cmfs, illuminant, shape))
+        else:
+            raise ValueError(
+                '"{0}" method is not supported, it must be one of {1}!'.format(
+                    method, sorted(SD_TO_XYZ_METHODS.keys())))
+
+        self._method = method
+
+    @property
+    def shape(self):
+        """
+        Getter property for the spectral shape of the spectral data to
+        convert.
+
+        Returns
+        -------
+        SpectralShape
+            Spectral shape of the spectral data to convert.
+        """
+
+        return self._shape
+
+    @property
+    def method(self):
+        """
+        Getter property for the computation method.
+
+        Returns
+        -------
+        unicode
+            Computation method.
+        """
+
+        return self._method
+
+    @property
+    def weights(self):
+        """
+        Getter property for the weighting matrix.
+
+        Returns
+        -------
+        ndarray, (bins, 3)
+            Weighting matrix.
+        """
+
+        return self._weights
+
+    def __call__(self, sd):
+        """
+        Converts given spectral data to *CIE XYZ* tristimulus values.
+
+        Parameters
+        ----------
+        sd : SpectralDistribution or MultiSpectralDistribution or array_like
+            Spectral distribution, multi-spectral distribution or
+            multi-spectral array, the wavelengths are expected to be in the
+            last axis of the latter.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values.
+
+        Raises
+        ------
+        ValueError
+            If the multi-spectral array bins count does not match the
+            weighting matrix.
+
+        Notes
+        -----
+
+        +-----------+-----------------------+---------------+
+        | **Range** | **Scale - Reference** | **Scale - 1** |
+        +===========+=======================+===============+
+        | ``XYZ``   | [0, 100]              | [0, 1]        |
+        +-----------+-----------------------+---------------+
+        """
+
+        if isinstance(sd, (SpectralDistribution, MultiSpectralDistribution)):
+            if sd.shape != self._shape:
+                runtime_warning('Aligning "{0}" shape to "{1}".'.format(
+                    sd.name, self._shape))
+                sd = sd.copy().align(self._shape)
+
+            R = np.transpose(sd.values)
+        else:
+            R = as_float_array(sd)
+
+            if R.shape[-1] != self._weights.shape[0]:
+                raise ValueError(
+                    '"{0}" bins count must be equal to "{1}" weighting matrix '
+                    'bins count!'.format(R.shape[-1], self._weights.shape[0]))
+
+        XYZ = np.dot(R, self._weights)
+
+        return from_range_100(XYZ)
 
 
 def wavelength_to_XYZ(
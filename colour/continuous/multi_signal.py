@@ -10,6 +10,7 @@ Defines the class implementing support for multi-continuous signal:
 
 from __future__ import division, unicode_literals
 
+import hashlib
 import numpy as np
 from collections import Iterator, Mapping, OrderedDict, Sequence
 
@@ -90,6 +91,7 @@ dict_like, optional
     extrapolator
     extrapolator_args
     function
+    fingerprint
     signals
     labels
     signal_type
@@ -521,6 +523,44 @@ dict_like, optional
         if self._signals:
             return first_item(self._signals.values()).function
 
+    @property
+    def fingerprint(self):
+        """
+        Getter property for the multi-continuous signal content fingerprint.
+
+        Returns
+        -------
+        unicode
+            Multi-continuous signal content fingerprint.
+
+        Notes
+        -----
+        -   This property is read only.
+        -   The fingerprint is the *SHA-1* hexadecimal digest of the
+            :class:`colour.continuous.Signal` sub-class instances labels and
+            :attr:`colour.continuous.Signal.fingerprint` attribute, the latter
+            being memoised by each instance until it changes.
+
+        Examples
+        --------
+        >>> domain = np.arange(0, 9, 1)
+        >>> range_ = tstack([np.linspace(10, 100, 9)] * 3)
+        >>> multi_signal_1 = MultiSignal(range_, domain)
+        >>> multi_signal_2 = MultiSignal(range_, domain)
+        >>> multi_signal_1.fingerprint == multi_signal_2.fingerprint
+        True
+        >>> multi_signal_2[0] = 0
+        >>> multi_signal_1.fingerprint == multi_signal_2.fingerprint
+        False
+        """
+
+        fingerprint = hashlib.sha1()
+        for label, signal in self._signals.items():
+            fingerprint.update('{0}{1}'.format(
+                label, signal.fingerprint).encode('utf-8'))
+
+        return fingerprint.hexdigest()
+
     @property
     def signals(self):
         """
@@ -707,9 +747,14 @@ dict_like
         -------
         int
             Object hash.
+
+        Notes
+        -----
+        -   The hash is derived from the
+            :attr:`colour.continuous.MultiSignal.fingerprint` attribute.
         """
 
-        return hash(repr(self))
+        return hash(self.fingerprint)
 
     def __getitem__(self, x):
         """
@@ -10,6 +10,7 @@ Defines the class implementing support for continuous signal:
 
 from __future__ import division, unicode_literals
 
+import hashlib
 import numpy as np
 from collections import Iterator, Mapping, OrderedDict, Sequence
 from operator import add, mul, pow, sub, iadd, imul, ipow, isub
@@ -88,6 +89,7 @@ class Signal(AbstractContinuousFunction):
     extrapolator
     extrapolator_args
     function
+    fingerprint
 
     Methods
     -------
@@ -200,6 +202,11 @@ class Signal(AbstractContinuousFunction):
         self._dtype = None
         self._domain = None
         self._range = None
+        self._version = 0
+        self._function = None
+        self._function_version = None
+        self._fingerprint = None
+        self._fingerprint_version = None
         self._interpolator = KernelInterpolator
         self._interpolator_args = {}
         self._extrapolator = Extrapolator
@@ -218,8 +225,6 @@ class Signal(AbstractContinuousFunction):
         self.extrapolator = kwargs.get('extrapolator')
         self.extrapolator_args = kwargs.get('extrapolator_args')
 
-        self._create_function()
-
     @property
     def dtype(self):
         """
@@ -308,7 +313,7 @@ class Signal(AbstractContinuousFunction):
                     self._range = np.resize(self._range, value.shape)
 
             self._domain = value
-            self._create_function()
+            self._update_version()
 
     @property
     def range(self):
@@ -350,7 +355,7 @@ class Signal(AbstractContinuousFunction):
                     '"domain" and "range" variables must have same size!')
 
             self._range = value
-            self._create_function()
+            self._update_version()
 
     @property
     def interpolator(self):
@@ -380,7 +385,7 @@ class Signal(AbstractContinuousFunction):
         if value is not None:
             # TODO: Check for interpolator capabilities.
             self._interpolator = value
-            self._create_function()
+            self._update_version()
 
     @property
     def interpolator_args(self):
@@ -415,7 +420,7 @@ class Signal(AbstractContinuousFunction):
             ).format('interpolator_args', value)
 
             self._interpolator_args = value
-            self._create_function()
+            self._update_version()
 
     @property
     def extrapolator(self):
@@ -445,7 +450,7 @@ class Signal(AbstractContinuousFunction):
         if value is not None:
             # TODO: Check for extrapolator capabilities.
             self._extrapolator = value
-            self._create_function()
+            self._update_version()
 
     @property
     def extrapolator_args(self):
@@ -480,7 +485,7 @@ class Signal(AbstractContinuousFunction):
                 format('extrapolator_args', value))
 
             self._extrapolator_args = value
-            self._create_function()
+            self._update_version()
 
     @property
     def function(self):
@@ -500,10 +505,70 @@ class Signal(AbstractContinuousFunction):
         Notes
         -----
         -   This property is read only.
+        -   The continuous signal callable is lazily created on first
+            evaluation and memoised until the continuous signal independent
+            domain :math:`x` variable, corresponding range :math:`y` variable,
+            interpolator, extrapolator or their arguments change.
         """
 
+        if self._function_version != self._version:
+            self._create_function()
+            self._function_version = self._version
+
         return self._function
 
+    @property
+    def fingerprint(self):
+        """
+        Getter property for the continuous signal content fingerprint.
+
+        Returns
+        -------
+        unicode
+            Continuous signal content fingerprint.
+
+        Notes
+        -----
+        -   This property is read only.
+        -   The fingerprint is the *SHA-1* hexadecimal digest of the
+            independent domain :math:`x` variable and corresponding range
+            :math:`y` variable raw buffers, their dtype, and the interpolator,
+            extrapolator and their arguments. It is lazily computed on first
+            access and memoised until any of them change, making it suitable
+            as a key for caches built on continuous signals.
+        -   The continuous signal name does not contribute to the fingerprint.
+
+        Examples
+        --------
+        >>> range_ = np.linspace(10, 100, 10)
+        >>> signal_1 = Signal(range_, name='Signal 1')
+        >>> signal_2 = Signal(range_, name='Signal 2')
+        >>> signal_1.fingerprint == signal_2.fingerprint
+        True
+        >>> signal_2[0] = 0
+        >>> signal_1.fingerprint == signal_2.fingerprint
+        False
+        """
+
+        if self._fingerprint_version != self._version:
+            fingerprint = hashlib.sha1()
+            for a in (self._domain, self._range):
+                if a is not None:
+                    a = np.ascontiguousarray(a)
+                    fingerprint.update(a.dtype.str.encode('utf-8'))
+                    fingerprint.update(a)
+
+            fingerprint.update('{0}{1}{2}{3}'.format(
+                self._interpolator.__name__,
+                sorted(self._interpolator_args.items()),
+                self._extrapolator.__name__,
+                sorted(self._extrapolator_args.items())).encode('utf-8'))
+
+            self._fingerprint = fingerprint.hexdigest()
+            self._fingerprint_version = self._version
+
+        return self._fingerprint
+
     def __str__(self):
         """
         Returns a formatted string representation of the continuous signal.
@@ -595,9 +660,14 @@ class Signal(AbstractContinuousFunction):
         -------
         int
             Object hash.
+
+        Notes
+        -----
+        -   The hash is derived from the
+            :attr:`colour.continuous.Signal.fingerprint` attribute.
         """
 
-        return hash(repr(self))
+        return hash(self.fingerprint)
 
     def __getitem__(self, x):
         """
@@ -643,7 +713,7 @@ class Signal(AbstractContinuousFunction):
         if isinstance(x, slice):
             return self._range[x]
         else:
-            return self._function(x)
+            return self.function(x)
 
     def __setitem__(self, x, y):
         """
@@ -733,7 +803,7 @@ class Signal(AbstractContinuousFunction):
                 self._domain = np.insert(self._domain, indexes, x_nm)
                 self._range = np.insert(self._range, indexes, y[~mask])
 
-        self._create_function()
+        self._update_version()
 
     def __contains__(self, x):
         """
@@ -852,6 +922,14 @@ class Signal(AbstractContinuousFunction):
 
         return not (self == other)
 
+    def _update_version(self):
+        """
+        Increments the continuous signal version so that its underlying
+        function is created again on next evaluation.
+        """
+
+        self._version += 1
+
     def _create_function(self):
         """
         Creates the continuous signal underlying function.
@@ -908,7 +986,7 @@ class Signal(AbstractContinuousFunction):
         """
 
         self._domain = fill_nan(self._domain, method, default)
-        self._create_function()
+        self._update_version()
 
     def _fill_range_nan(self, method='Interpolation', default=0):
         """
@@ -931,7 +1009,7 @@ class Signal(AbstractContinuousFunction):
         """
 
         self._range = fill_nan(self._range, method, default)
-        self._create_function()
+        self._update_version()
 
     def arithmetical_operation(self, a, operation, in_place=False):
         """
@@ -50,8 +50,9 @@ class TestMultiSignal(unittest.TestCase):
 
         required_attributes = ('dtype', 'domain', 'range', 'interpolator',
                                'interpolator_args', 'extrapolator',
-                               'extrapolator_args', 'function', 'signals',
-                               'labels', 'signal_type')
+                               'extrapolator_args', 'function',
+                               'fingerprint', 'signals', 'labels',
+                               'signal_type')
 
         for attribute in required_attributes:
             self.assertIn(attribute, dir(MultiSignal))
@@ -221,6 +222,24 @@ extrapolator_args` property.
 
         assert hasattr(self._multi_signal.function, '__call__')
 
+    def test_fingerprint(self):
+        """
+        Tests :func:`colour.continuous.multi_signal.MultiSignal.fingerprint`
+        property.
+        """
+
+        multi_signal = self._multi_signal.copy()
+        fingerprint = multi_signal.fingerprint
+        self.assertEqual(fingerprint, self._multi_signal.fingerprint)
+        self.assertEqual(hash(multi_signal), hash(self._multi_signal))
+
+        multi_signal[0] = 0
+        self.assertNotEqual(multi_signal.fingerprint, fingerprint)
+
+        multi_signal = self._multi_signal.copy()
+        multi_signal.labels = ['a', 'b', 'c']
+        self.assertNotEqual(multi_signal.fingerprint, fingerprint)
+
     def test_signals(self):
         """
         Tests :func:`colour.continuous.multi_signal.MultiSignal.signals`
@@ -47,7 +47,8 @@ class TestSignal(unittest.TestCase):
 
         required_attributes = ('dtype', 'domain', 'range', 'interpolator',
                                'interpolator_args', 'extrapolator',
-                               'extrapolator_args', 'function')
+                               'extrapolator_args', 'function',
+                               'fingerprint')
 
         for attribute in required_attributes:
             self.assertIn(attribute, dir(Signal))
@@ -185,6 +186,51 @@ class TestSignal(unittest.TestCase):
 
         assert hasattr(self._signal.function, '__call__')
 
+        signal = self._signal.copy()
+        function = signal.function
+        self.assertIs(signal.function, function)
+
+        signal.range = self._range * 10
+        self.assertIsNot(signal.function, function)
+        np.testing.assert_almost_equal(signal[0], 100.0, decimal=7)
+
+        function = signal.function
+        signal.interpolator = CubicSplineInterpolator
+        signal.extrapolator_args = {'method': 'Linear'}
+        self.assertIsNot(signal.function, function)
+
+    def test_fingerprint(self):
+        """
+        Tests :func:`colour.continuous.signal.Signal.fingerprint` property.
+        """
+
+        signal = self._signal.copy()
+        fingerprint = signal.fingerprint
+        self.assertEqual(fingerprint, self._signal.fingerprint)
+        self.assertEqual(hash(signal), hash(self._signal))
+
+        signal.name = 'Signal'
+        self.assertEqual(signal.fingerprint, fingerprint)
+
+        signal[0] = 0
+        self.assertNotEqual(signal.fingerprint, fingerprint)
+
+        signal = self._signal.copy()
+        signal.domain = self._domain
+        self.assertNotEqual(signal.fingerprint, fingerprint)
+
+        signal = self._signal.copy()
+        signal.interpolator = CubicSplineInterpolator
+        self.assertNotEqual(signal.fingerprint, fingerprint)
+
+        signal = self._signal.copy()
+        signal.extrapolator_args = {'method': 'Linear'}
+        self.assertNotEqual(signal.fingerprint, fingerprint)
+
+        signal = self._signal.copy()
+        signal += 1
+        self.assertNotEqual(signal.fingerprint, fingerprint)
+
     def test__init__(self):
         """
         Tests :func:`colour.continuous.signal.Signal.__init__` method.
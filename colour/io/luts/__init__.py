@@ -15,7 +15,9 @@ open?id=143Eh08ZYncCAMwJ1q4gWxVOqR_OSWYvs
 
 from __future__ import absolute_import
 
+import hashlib
 import os
+import tempfile
 
 from colour.utilities import CaseInsensitiveMapping, filter_kwargs
 from .lut import (AbstractLUTSequenceOperator, LUT1D, LUT2D, LUT3D,
@@ -25,6 +27,7 @@ from .resolve_cube import read_LUT_ResolveCube, write_LUT_ResolveCube
 from .sony_spi1d import read_LUT_SonySPI1D, write_LUT_SonySPI1D
 from .sony_spi3d import read_LUT_SonySPI3D, write_LUT_SonySPI3D
 from .cinespace_csp import read_LUT_Cinespace, write_LUT_Cinespace
+from .colour_binary import read_LUT_ColourBinary, write_LUT_ColourBinary
 
 __all__ = [
     'AbstractLUTSequenceOperator', 'LUT1D', 'LUT2D', 'LUT3D', 'LUTSequence',
@@ -35,22 +38,25 @@ __all__ += ['read_LUT_ResolveCube', 'write_LUT_ResolveCube']
 __all__ += ['read_LUT_SonySPI1D', 'write_LUT_SonySPI1D']
 __all__ += ['read_LUT_SonySPI3D', 'write_LUT_SonySPI3D']
 __all__ += ['read_LUT_Cinespace', 'write_LUT_Cinespace']
+__all__ += ['read_LUT_ColourBinary', 'write_LUT_ColourBinary']
 
 EXTENSION_TO_LUT_FORMAT_MAPPING = CaseInsensitiveMapping({
     '.cube': 'Iridas Cube',
     '.spi1d': 'Sony SPI1D',
     '.spi3d': 'Sony SPI3D',
-    '.csp': 'Cinespace'
+    '.csp': 'Cinespace',
+    '.lutb': 'Colour Binary'
 })
 """
 Extension to *LUT* format.
 
 EXTENSION_TO_LUT_FORMAT_MAPPING : CaseInsensitiveMapping
-    **{'.cube', '.spi1d'}**
+    **{'.cube', '.spi1d', '.spi3d', '.csp', '.lutb'}**
 """
 
 LUT_READ_METHODS = CaseInsensitiveMapping({
     'Cinespace': read_LUT_Cinespace,
+    'Colour Binary': read_LUT_ColourBinary,
     'Iridas Cube': read_LUT_IridasCube,
     'Resolve Cube': read_LUT_ResolveCube,
     'Sony SPI1D': read_LUT_SonySPI1D,
@@ -64,12 +70,29 @@ References
 :cite:`AdobeSystems2013b`, :cite:`Chamberlain2015`
 
 LUT_READ_METHODS : CaseInsensitiveMapping
-    **{'Cinespace', 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D',
-    'Sony SPI3D'}**
+    **{'Cinespace', 'Colour Binary', 'Iridas Cube', 'Resolve Cube',
+    'Sony SPI1D', 'Sony SPI3D'}**
 """
 
 
-def read_LUT(path, method=None, **kwargs):
+def _LUT_cache_path(path, cache_directory, method, **kwargs):
+    """
+    Returns the *Colour* binary *.lutb* cache file path of given *LUT* file
+    keyed by its absolute path, modification time and size, the reading
+    method and its arguments.
+    """
+
+    stat = os.stat(path)
+    key = '{0}{1}{2}{3}{4}'.format(
+        os.path.abspath(path), stat.st_mtime, stat.st_size, method,
+        sorted(kwargs.items()))
+
+    return os.path.join(
+        cache_directory, '{0}.lutb'.format(
+            hashlib.sha1(key.encode('utf-8')).hexdigest()))
+
+
+def read_LUT(path, method=None, cache_directory=None, **kwargs):
     """
     Reads given *LUT* file using given method.
 
@@ -78,14 +101,25 @@ def read_LUT(path, method=None, **kwargs):
     path : unicode
         *LUT* path.
     method : unicode, optional
-        **{None, 'Cinespace', 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D',
-        'Sony SPI3D'}**, Reading method, if *None*, the method will be
-        auto-detected according to extension.
+        **{None, 'Cinespace', 'Colour Binary', 'Iridas Cube', 'Resolve Cube',
+        'Sony SPI1D', 'Sony SPI3D'}**, Reading method, if *None*, the method
+        will be auto-detected according to extension.
+    cache_directory : unicode, optional
+        Directory caching the parsed *LUT* files as *Colour* binary *.lutb*
+        files keyed by their absolute path, modification time and size: the
+        *LUT* file is only parsed if it is not in the cache or if it has
+        changed, it is memory-mapped from the cache otherwise.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the reading method.
 
     Returns
     -------
-    LUT1D or LUT2D or LUT3D
-        :class:`LUT1D`, :class:`LUT2D` or :class:`LUT3D` class instance.
+    LUT1D or LUT2D or LUT3D or LUTSequence
+        :class:`LUT1D`, :class:`LUT2D`, :class:`LUT3D` or :class:`LUTSequence`
+        class instance.
 
     References
     ----------
@@ -143,8 +177,33 @@ def read_LUT(path, method=None, **kwargs):
         method = EXTENSION_TO_LUT_FORMAT_MAPPING[os.path.splitext(path)[-1]]
 
     function = LUT_READ_METHODS[method]
+    kwargs = filter_kwargs(function, **kwargs)
+
+    if cache_directory is None or function is read_LUT_ColourBinary:
+        return function(path, **kwargs)
+
+    cache_path = _LUT_cache_path(path, cache_directory, method, **kwargs)
+    if os.path.exists(cache_path):
+        return read_LUT_ColourBinary(cache_path)
+
+    LUT = function(path, **kwargs)
+
+    if not os.path.exists(cache_directory):
+        os.makedirs(cache_directory)
+
+    # The cache file is written aside and renamed so that concurrent readers
+    # never see a partially written file.
+    descriptor, temporary_path = tempfile.mkstemp(
+        '.lutb', dir=cache_directory)
+    os.close(descriptor)
+    try:
+        write_LUT_ColourBinary(LUT, temporary_path)
+        os.rename(temporary_path, cache_path)
+    except OSError:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
 
-    return function(path, **filter_kwargs(function, **kwargs))
+    return LUT
 
 
 LUT_WRITE_METHODS = CaseInsensitiveMapping({
@@ -153,6 +212,7 @@ LUT_WRITE_METHODS = CaseInsensitiveMapping({
     'Sony SPI1D': write_LUT_SonySPI1D,
     'Sony SPI3D': write_LUT_SonySPI3D,
     'Cinespace': write_LUT_Cinespace,
+    'Colour Binary': write_LUT_ColourBinary,
 })
 LUT_WRITE_METHODS.__doc__ = """
 Supported *LUT* reading methods.
@@ -162,8 +222,8 @@ References
 :cite:`AdobeSystems2013b`, :cite:`Chamberlain2015`
 
 LUT_WRITE_METHODS : CaseInsensitiveMapping
-    **{'Cinespace', 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D',
-    'Sony SPI3D'}**
+    **{'Cinespace', 'Colour Binary', 'Iridas Cube', 'Resolve Cube',
+    'Sony SPI1D', 'Sony SPI3D'}**
 """
 
 
@@ -173,17 +233,17 @@ def write_LUT(LUT, path, decimals=7, method=None, **kwargs):
 
     Parameters
     ----------
-    LUT : LUT1D or LUT2D or LUT3D
-        :class:`LUT1D`, :class:`LUT2D` or :class:`LUT3D` class instance to
-        write at given path.
+    LUT : LUT1D or LUT2D or LUT3D or LUTSequence
+        :class:`LUT1D`, :class:`LUT2D`, :class:`LUT3D` or :class:`LUTSequence`
+        class instance to write at given path.
     path : unicode
         *LUT* path.
     decimals : int, optional
         Formatting decimals.
     method : unicode, optional
-        **{None, 'Cinespace', 'Iridas Cube', 'Resolve Cube', 'Sony SPI1D',
-        'Sony SPI3D'}**, Writing method, if *None*, the method will be
-        auto-detected according to extension.
+        **{None, 'Cinespace', 'Colour Binary', 'Iridas Cube', 'Resolve Cube',
+        'Sony SPI1D', 'Sony SPI3D'}**, Writing method, if *None*, the method
+        will be auto-detected according to extension.
 
     Returns
     -------
@@ -21,7 +21,7 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.io.luts import LUT1D, LUT2D, LUT3D, LUTSequence
-from colour.io.luts.common import parse_array
+from colour.io.luts.common import format_table, parse_array, parse_table
 from colour.utilities import tsplit, tstack
 
 __author__ = 'Colour Developers'
@@ -129,14 +129,13 @@ def read_LUT_Cinespace(path):
         """
 
         size = parse_array(lines[0]).astype(int)
-        table = np.array([parse_array(line) for line in lines[1:]])
+        table = parse_table(lines[1:])
 
         return size, table
 
     with open(path) as csp_file:
-        lines = csp_file.readlines()
+        lines = [line for line in (line.strip() for line in csp_file) if line]
         assert len(lines) > 0, 'LUT file empty!'
-        lines = [line.strip() for line in lines if line.strip()]
 
         header = lines[0]
         assert header == 'CSPLUTV100', 'Invalid header!'
@@ -412,8 +411,8 @@ def write_LUT_Cinespace(LUT, path, decimals=7):
                     LUT[1].table.shape[2]))
                 table = LUT[1].table.reshape((-1, 3), order='F')
 
-                for row in table:
-                    csp_file.write('{0}\n'.format(_format_array(row)))
+                csp_file.write(
+                    format_table(table, '%.{0}f'.format(decimals)))
 
         else:
             for i in range(3):
@@ -424,7 +423,6 @@ def write_LUT_Cinespace(LUT, path, decimals=7):
             csp_file.write('\n{0}\n'.format(LUT[0].size))
             table = LUT[0].table
 
-            for row in table:
-                csp_file.write('{0}\n'.format(_format_array(row)))
+            csp_file.write(format_table(table, '%.{0}f'.format(decimals)))
 
     return True
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Binary LUT Format Input / Output Utilities
+=================================================
+
+Defines *Colour* binary *.lutb* *LUT* Format related input / output utilities
+objects.
+
+-   :func:`colour.io.read_LUT_ColourBinary`
+-   :func:`colour.io.write_LUT_ColourBinary`
+
+The *Colour* binary *.lutb* *LUT* format is a compact container storing the
+tables and domains of a :class:`LUT1D`, :class:`LUT2D`, :class:`LUT3D` or
+:class:`LUTSequence` class instance as raw little-endian *float64* arrays
+along their names and comments. It is laid out as follows:
+
+-   An 8 bytes magic string: ``\\x93COLLUT`` followed by the format version.
+-   The header length as a little-endian *uint32*.
+-   The header, an *UTF-8* *JSON* document describing the *LUTs* type, name,
+    comments and the offset and shape of their table and domain arrays.
+-   The arrays, each one aligned on 64 bytes, their offsets being relative to
+    the first aligned byte following the header.
+
+The arrays are memory-mapped on reading, thus the *LUTs* tables are backed by
+the file without being copied and the pages are only read from disk when
+accessed.
+"""
+
+from __future__ import division, unicode_literals
+
+import json
+import numpy as np
+import struct
+
+from colour.io.luts import LUT1D, LUT2D, LUT3D, LUTSequence
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['read_LUT_ColourBinary', 'write_LUT_ColourBinary']
+
+_MAGIC_STRING = b'\x93COLLUT\x01'
+"""
+*Colour* binary *.lutb* *LUT* format magic string, the last byte being the
+format version.
+
+_MAGIC_STRING : bytes
+"""
+
+_ALIGNMENT = 64
+"""
+*Colour* binary *.lutb* *LUT* format arrays alignment in bytes.
+
+_ALIGNMENT : int
+"""
+
+_LUT_TYPES = {'LUT1D': LUT1D, 'LUT2D': LUT2D, 'LUT3D': LUT3D}
+"""
+*Colour* binary *.lutb* *LUT* format supported *LUT* types.
+
+_LUT_TYPES : dict
+"""
+
+
+def _align(offset):
+    """
+    Aligns given offset on the *Colour* binary *.lutb* *LUT* format arrays
+    alignment.
+    """
+
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _data_start(length):
+    """
+    Returns the *Colour* binary *.lutb* *LUT* format arrays start for given
+    header length.
+    """
+
+    return _align(len(_MAGIC_STRING) + 4 + length)
+
+
+def read_LUT_ColourBinary(path):
+    """
+    Reads given *Colour* binary *.lutb* *LUT* file.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+
+    Returns
+    -------
+    LUT1D or LUT2D or LUT3D or LUTSequence
+        :class:`LUT1D`, :class:`LUT2D`, :class:`LUT3D` or :class:`LUTSequence`
+        class instance.
+
+    Notes
+    -----
+    -   The *LUTs* tables and domains are copy-on-write memory-mapped arrays:
+        modifying them does not modify the file.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'ColourCorrect.lutb')
+    >>> LUT = LUT3D(LUT3D.linear_table(4) ** (1 / 2.2), 'ColourCorrect')
+    >>> write_LUT_ColourBinary(LUT, path)
+    True
+    >>> print(read_LUT_ColourBinary(path))
+    LUT3D - ColourCorrect
+    ---------------------
+    <BLANKLINE>
+    Dimensions : 3
+    Domain     : [[ 0.  0.  0.]
+                  [ 1.  1.  1.]]
+    Size       : (4, 4, 4, 3)
+    """
+
+    with open(path, 'rb') as lutb_file:
+        assert lutb_file.read(len(_MAGIC_STRING)) == _MAGIC_STRING, (
+            '"{0}" is not a "Colour" binary "LUT" file!'.format(path))
+
+        length = struct.unpack('<I', lutb_file.read(4))[0]
+        header = json.loads(lutb_file.read(length).decode('utf-8'))
+
+    data = np.memmap(
+        path, dtype=np.uint8, mode='c', offset=_data_start(length))
+
+    def _array(offset, shape):
+        """
+        Returns the memory-mapped array at given offset with given shape.
+        """
+
+        count = int(np.prod(shape)) * 8
+
+        return data[offset:offset + count].view('<f8').reshape(shape)
+
+    LUTs = []
+    for LUT in header['LUTs']:
+        # The size is only used by the constructor to create a linear table
+        # that is immediately replaced, thus the smallest size is given.
+        LUTs.append(_LUT_TYPES[LUT['type']](
+            _array(*LUT['table']),
+            LUT['name'],
+            _array(*LUT['domain']),
+            size=2,
+            comments=LUT['comments']))
+
+    if header['sequence']:
+        return LUTSequence(*LUTs)
+    else:
+        return LUTs[0]
+
+
+def write_LUT_ColourBinary(LUT, path, decimals=7):
+    """
+    Writes given *LUT* to given *Colour* binary *.lutb* *LUT* file.
+
+    Parameters
+    ----------
+    LUT : LUT1D or LUT2D or LUT3D or LUTSequence
+        :class:`LUT1D`, :class:`LUT2D`, :class:`LUT3D` or :class:`LUTSequence`
+        class instance to write at given path.
+    path : unicode
+        *LUT* path.
+    decimals : int, optional
+        Unused, the arrays are stored at full precision.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Notes
+    -----
+    -   Overwriting a file that is memory-mapped by a *LUT* being used is
+        unsafe, a new file should be written and renamed over it instead.
+
+    Examples
+    --------
+    >>> LUT = LUTSequence(
+    ...     LUT1D(LUT1D.linear_table(16) ** (1 / 2.2), 'My Shaper'),
+    ...     LUT3D(LUT3D.linear_table(16) * 0.5, 'My LUT'))
+    >>> write_LUT_ColourBinary(LUT, 'My_LUT.lutb')  # doctest: +SKIP
+    """
+
+    is_sequence = isinstance(LUT, LUTSequence)
+    LUTs = list(LUT) if is_sequence else [LUT]
+
+    for LUT_i in LUTs:
+        assert type(LUT_i).__name__ in _LUT_TYPES, (
+            '"LUT" must be a 1D, 2D or 3D "LUT" or a "LUTSequence" of '
+            'them!')
+
+    # The arrays offsets are relative to the data start so that the header
+    # does not depend on its own length.
+    arrays, descriptors, offset = [], [], 0
+    for LUT_i in LUTs:
+        descriptor = {
+            'type': type(LUT_i).__name__,
+            'name': LUT_i.name,
+            'comments': list(LUT_i.comments),
+        }
+        for attribute in ('table', 'domain'):
+            array = np.ascontiguousarray(getattr(LUT_i, attribute), '<f8')
+            arrays.append((offset, array))
+            descriptor[attribute] = [offset, list(array.shape)]
+            offset = _align(offset + array.nbytes)
+
+        descriptors.append(descriptor)
+
+    header = json.dumps({
+        'sequence': is_sequence,
+        'LUTs': descriptors
+    }).encode('utf-8')
+
+    start = _data_start(len(header))
+
+    with open(path, 'wb') as lutb_file:
+        lutb_file.write(_MAGIC_STRING)
+        lutb_file.write(struct.pack('<I', len(header)))
+        lutb_file.write(header)
+        for offset, array in arrays:
+            lutb_file.write(b'\x00' * (start + offset - lutb_file.tell()))
+            lutb_file.write(array.tobytes())
+
+    return True
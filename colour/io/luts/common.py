@@ -9,6 +9,7 @@ category.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import os
 import re
 
@@ -22,7 +23,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['parse_array', 'path_to_title']
+__all__ = ['parse_array', 'parse_table', 'format_table', 'path_to_title']
 
 
 def parse_array(a, separator=' ', dtype=DEFAULT_FLOAT_DTYPE):
@@ -57,6 +58,75 @@ def parse_array(a, separator=' ', dtype=DEFAULT_FLOAT_DTYPE):
     return as_array([dtype(token) for token in a], dtype)
 
 
+def parse_table(lines, columns=3, dtype=DEFAULT_FLOAT_DTYPE):
+    """
+    Converts given lines of whitespace separated numeric values to a table
+    with a single bulk parse.
+
+    Parameters
+    ----------
+    lines : array_like
+        Lines of whitespace separated numeric values to convert.
+    columns : int, optional
+        Table columns count.
+    dtype : object
+        Type to use for conversion.
+
+    Returns
+    -------
+    ndarray
+        Converted table.
+
+    Examples
+    --------
+    >>> parse_table(['-0.25 0.5 0.75', '0.0 1.0 2.0'])
+    array([[-0.25,  0.5 ,  0.75],
+           [ 0.  ,  1.  ,  2.  ]])
+    """
+
+    table = np.fromstring(' '.join(lines), dtype=dtype, sep=' ')
+
+    assert table.size % columns == 0, (
+        'Table values count does not match "{0}" columns!'.format(columns))
+
+    return np.reshape(table, (-1, columns))
+
+
+def format_table(table, fmt='%.7f'):
+    """
+    Formats given table as lines of space separated values, the whole table
+    being formatted as a single block.
+
+    Parameters
+    ----------
+    table : array_like
+        Table to format.
+    fmt : unicode or array_like, optional
+        Format, or sequence of formats, one per column, e.g. '%d' or '%.7f'.
+
+    Returns
+    -------
+    unicode
+        Formatted table.
+
+    Examples
+    --------
+    >>> print(format_table(np.array([[-0.25, 0.5, 0.75], [0, 1, 2]]), '%.2f'))
+    -0.25 0.50 0.75
+    0.00 1.00 2.00
+    <BLANKLINE>
+    """
+
+    table = np.asarray(table)
+
+    if is_string(fmt):
+        fmt = [fmt] * table.shape[-1]
+
+    row_format = '{0}\n'.format(' '.join(fmt))
+
+    return (row_format * table.shape[0]) % tuple(np.ravel(table).tolist())
+
+
 def path_to_title(path):
     """
     Converts given file path to title.
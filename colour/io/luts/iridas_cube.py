@@ -21,8 +21,9 @@ import numpy as np
 
 from colour.constants import DEFAULT_INT_DTYPE
 from colour.io.luts import LUT1D, LUT2D, LUT3D, LUTSequence
-from colour.io.luts.common import parse_array, path_to_title
-from colour.utilities import as_float_array, usage_warning
+from colour.io.luts.common import (format_table, parse_array, parse_table,
+                                   path_to_title)
+from colour.utilities import usage_warning
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -107,8 +108,7 @@ def read_LUT_IridasCube(path):
     comments = []
 
     with open(path) as cube_file:
-        lines = cube_file.readlines()
-        for line in lines:
+        for line in cube_file:
             line = line.strip()
 
             if len(line) == 0:
@@ -118,6 +118,12 @@ def read_LUT_IridasCube(path):
                 comments.append(line[1:].strip())
                 continue
 
+            # The table data lines are gathered as they are and parsed at once
+            # afterwards.
+            if not line[0].isalpha():
+                table.append(line)
+                continue
+
             tokens = line.split()
             if tokens[0] == 'TITLE':
                 title = ' '.join(tokens[1:])[1:-1]
@@ -131,10 +137,8 @@ def read_LUT_IridasCube(path):
             elif tokens[0] == 'LUT_3D_SIZE':
                 dimensions = 3
                 size = DEFAULT_INT_DTYPE(tokens[1])
-            else:
-                table.append(parse_array(tokens))
 
-    table = as_float_array(table)
+    table = parse_table(table)
     if dimensions == 2:
         return LUT2D(
             table,
@@ -257,7 +261,6 @@ def write_LUT_IridasCube(LUT, path, decimals=7):
         else:
             table = LUT.table
 
-        for row in table:
-            cube_file.write('{0}\n'.format(_format_array(row)))
+        cube_file.write(format_table(table, '%.{0}f'.format(decimals)))
 
     return True
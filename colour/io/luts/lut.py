@@ -14,11 +14,14 @@ Defines the classes and definitions handling *LUT* processing:
 
 from __future__ import division, unicode_literals
 
+import multiprocessing
 import numpy as np
 import re
+import threading
 from abc import ABCMeta, abstractmethod
 from collections import MutableSequence
 from copy import deepcopy
+from multiprocessing.pool import ThreadPool
 # pylint: disable=W0622
 from operator import add, mul, pow, sub, iadd, imul, ipow, isub
 
@@ -33,10 +36,11 @@ except ImportError:
 from six import add_metaclass
 
 from colour.algebra import LinearInterpolator, table_interpolation_trilinear
-from colour.constants import DEFAULT_INT_DTYPE
-from colour.utilities import (as_float_array, is_numeric, is_iterable,
-                              is_string, linear_conversion, runtime_warning,
-                              tsplit, tstack, usage_warning)
+from colour.constants import DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE
+from colour.utilities import (as_float, as_float_array, is_numeric,
+                              is_iterable, is_string,
+                              linear_conversion, runtime_warning, tsplit,
+                              tstack, usage_warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -51,6 +55,109 @@ __all__ = [
 ]
 
 
+_APPLY_TILED_THREAD_POOL = None
+_APPLY_TILED_THREAD_POOL_LOCK = threading.Lock()
+_APPLY_TILED_THREAD_POOL_WORKER = threading.local()
+
+
+def _apply_tiled_thread_pool():
+    """
+    Returns the thread pool processing the tiles concurrently, it is lazily
+    created with :func:`multiprocessing.cpu_count` threads and shared by the
+    subsequent calls.
+
+    Returns
+    -------
+    ThreadPool
+        Thread pool processing the tiles concurrently.
+    """
+
+    global _APPLY_TILED_THREAD_POOL
+    with _APPLY_TILED_THREAD_POOL_LOCK:
+        if _APPLY_TILED_THREAD_POOL is None:
+            _APPLY_TILED_THREAD_POOL = ThreadPool(
+                multiprocessing.cpu_count(),
+                initializer=setattr,
+                initargs=(_APPLY_TILED_THREAD_POOL_WORKER, 'active', True))
+
+    return _APPLY_TILED_THREAD_POOL
+
+
+def _apply_tiled(function, RGB, tile_size=None, threads=None, dtype=None):
+    """
+    Applies given function to given *RGB* colourspace array by tiles of
+    ``tile_size`` contiguous *RGB* colourspace values, i.e. row strips for an
+    image, processed concurrently by a shared pool of threads.
+
+    Parameters
+    ----------
+    function : callable
+        Function processing the *RGB* colourspace values independently.
+    RGB : array_like
+        *RGB* colourspace array to process.
+    tile_size : int, optional
+        Count of *RGB* colourspace values processed at once, the whole *RGB*
+        colourspace array is processed at once if *None*.
+    threads : int, optional
+        Count of threads processing the tiles concurrently, default to and
+        limited by :func:`multiprocessing.cpu_count`.
+    dtype : type, optional
+        Data type of the processed *RGB* colourspace array when tiled, default
+        to :attr:`colour.constants.DEFAULT_FLOAT_DTYPE`.
+
+    Returns
+    -------
+    ndarray
+        Processed *RGB* colourspace array.
+
+    Notes
+    -----
+    -   The tiles are processed serially when called from a thread of the
+        pool, e.g. by a function itself applying tiles, so that the pool
+        threads never wait for each other.
+    """
+
+    if tile_size is None:
+        return function(RGB)
+
+    RGB = np.asarray(RGB)
+    RGB_f = np.reshape(RGB, (-1, 3))
+
+    tiles = [
+        slice(i, i + tile_size) for i in range(0, RGB_f.shape[0], tile_size)
+    ]
+
+    if len(tiles) <= 1:
+        return function(RGB)
+
+    if dtype is None:
+        dtype = DEFAULT_FLOAT_DTYPE
+
+    RGB_o = np.empty(RGB_f.shape, dtype=dtype)
+
+    def apply_tiles(tiles):
+        """
+        Processes given tiles of the *RGB* colourspace array.
+        """
+
+        for tile in tiles:
+            RGB_o[tile] = function(RGB_f[tile])
+
+    if threads is None:
+        threads = multiprocessing.cpu_count()
+
+    threads = min(threads, len(tiles))
+    if threads > 1 and not getattr(_APPLY_TILED_THREAD_POOL_WORKER, 'active',
+                                   False):
+        _apply_tiled_thread_pool().map(
+            apply_tiles, [tiles[i::threads] for i in range(threads)],
+            chunksize=1)
+    else:
+        apply_tiles(tiles)
+
+    return np.reshape(RGB_o, RGB.shape)
+
+
 @add_metaclass(ABCMeta)
 class AbstractLUT:
     """
@@ -124,6 +231,10 @@ class AbstractLUT:
 
         self._dimensions = dimensions
 
+        # Objects derived from the table and domain, e.g. interpolators,
+        # cached by the sub-classes and cleared when any of them is set.
+        self._cache = {}
+
         self._table = self.linear_table(size, domain)
         self.table = table
         self._domain = None
@@ -158,6 +269,7 @@ class AbstractLUT:
         if value is not None:
             # pylint: disable=E1121
             self._table = self._validate_table(value)
+            self._cache = {}
 
     @property
     def name(self):
@@ -217,6 +329,7 @@ class AbstractLUT:
         if value is not None:
             # pylint: disable=E1121
             self._domain = self._validate_domain(value)
+            self._cache = {}
 
     @property
     def dimensions(self):
@@ -947,10 +1060,63 @@ class LUT1D(AbstractLUT):
 
             return np.linspace(domain[0], domain[1], size)
 
+    def _samples(self):
+        """
+        Returns the *LUT* table samples, i.e. the explicit domain or the
+        uniformly spaced samples of the implicit domain.
+
+        Returns
+        -------
+        ndarray
+            *LUT* table samples.
+        """
+
+        if self.is_domain_explicit():
+            return self.domain
+        else:
+            domain_min, domain_max = self.domain
+
+            return np.linspace(domain_min, domain_max, self._table.size)
+
+    def _uniform_indexing(self):
+        """
+        Returns the data required to directly index the *LUT* table, i.e. the
+        samples extrema and the samples to indexes scale.
+
+        Returns
+        -------
+        tuple or None
+            Uniform indexing data or *None* if the samples are not uniformly
+            spaced and increasing.
+        """
+
+        if self.is_domain_explicit():
+            samples = self.domain
+
+            if len(samples) != len(self._table) or samples[-1] <= samples[0]:
+                return None
+
+            # The explicit domains are commonly generated with
+            # :func:`np.linspace` and their spacings are only equal within
+            # floating point precision.
+            step = (samples[-1] - samples[0]) / (len(samples) - 1)
+            if not np.allclose(np.diff(samples), step, rtol=1e-7, atol=0):
+                return None
+
+            x_min, x_max = samples[0], samples[-1]
+        else:
+            x_min, x_max = self.domain
+
+            if x_max <= x_min:
+                return None
+
+        return x_min, x_max, (len(self._table) - 1) / (x_max - x_min)
+
     def apply(self,
               RGB,
               interpolator=LinearInterpolator,
-              interpolator_args=None):
+              interpolator_args=None,
+              out=None):
         """
         Applies the *LUT* to given *RGB* colourspace array using given method.
 
@@ -962,12 +1128,31 @@ class LUT1D(AbstractLUT):
             Interpolator class type to use as interpolating function.
         interpolator_args : dict_like, optional
             Arguments to use when instantiating the interpolating function.
+        out : ndarray, optional
+            Floating point array with the *RGB* colourspace array shape to
+            store the interpolated *RGB* colourspace array into, it can be the
+            *RGB* colourspace array itself for in-place application.
 
         Returns
         -------
         ndarray
             Interpolated *RGB* colourspace array.
 
+        Raises
+        ------
+        ValueError
+            If the output array does not have the expected shape and a
+            floating point data type.
+
+        Notes
+        -----
+        -   The interpolating function is created on first application and
+            cached until the *LUT* table or domain change, including in-place
+            modifications.
+        -   When using the :class:`colour.LinearInterpolator` class without
+            arguments and the *LUT* samples are uniformly spaced, the table is
+            directly indexed without creating an interpolating function.
+
         Examples
         --------
         >>> LUT = LUT1D(LUT1D.linear_table() ** (1 / 2.2))
@@ -976,16 +1161,100 @@ class LUT1D(AbstractLUT):
         array([ 0.4529220...,  0.4529220...,  0.4529220...])
         """
 
-        if self.is_domain_explicit():
-            samples = self.domain
-        else:
-            domain_min, domain_max = self.domain
+        RGB = np.asarray(RGB)
+
+        if out is not None and (out.shape != RGB.shape or
+                                out.dtype.kind != 'f'):
+            raise ValueError(
+                '"out" array must have "{0}" shape and a floating point data '
+                'type!'.format(RGB.shape))
+
+        # The table and domain getters return the underlying arrays, thus the
+        # cached data is validated against a copy of the arrays it has been
+        # built from to account for in-place modifications.
+        if interpolator is LinearInterpolator and not interpolator_args:
+            cache = self._cache.get('uniform_indexing')
+            if cache is None or not np.array_equal(cache[0], self._domain):
+                cache = (np.copy(self._domain), self._uniform_indexing())
+                self._cache['uniform_indexing'] = cache
+
+            if cache[1] is not None:
+                return self._apply_uniform_indexing(RGB, cache[1],
+                                                    self._table, out)
+
+        interpolator_args = {} if interpolator_args is None else (
+            interpolator_args)
+
+        cache = self._cache.get('interpolator')
+        if (cache is None or cache[0] is not interpolator or
+                cache[1] != interpolator_args or
+                not np.array_equal(cache[2], self._domain) or
+                not np.array_equal(cache[3], self._table)):
+            cache = (interpolator, dict(interpolator_args),
+                     np.copy(self._domain), np.copy(self._table),
+                     interpolator(self._samples(), self._table,
+                                  **interpolator_args))
+            self._cache['interpolator'] = cache
+
+        RGB_o = cache[4](RGB)
+
+        if out is None:
+            return RGB_o
+
+        out[...] = RGB_o
+
+        return out
+
+    @staticmethod
+    def _apply_uniform_indexing(RGB, indexing, table, out=None):
+        """
+        Applies the *LUT* to given *RGB* colourspace array by directly
+        indexing given table with given uniform indexing data.
+
+        Parameters
+        ----------
+        RGB : ndarray
+            *RGB* colourspace array to apply the *LUT* onto.
+        indexing : tuple
+            Uniform indexing data as returned by
+            :meth:`colour.LUT1D._uniform_indexing` method.
+        table : ndarray
+            *LUT* table.
+        out : ndarray, optional
+            Array to store the interpolated *RGB* colourspace array into.
+
+        Returns
+        -------
+        ndarray
+            Interpolated *RGB* colourspace array.
+        """
 
-            samples = np.linspace(domain_min, domain_max, self._table.size)
+        x_min, x_max, scale = indexing
 
-        RGB_interpolator = interpolator(samples, self._table)
+        if np.any(RGB < x_min):
+            raise ValueError('"{0}" is below interpolation range.'.format(RGB))
 
-        return RGB_interpolator(RGB)
+        if np.any(RGB > x_max):
+            raise ValueError('"{0}" is above interpolation range.'.format(RGB))
+
+        is_out = out is not None
+        if not is_out:
+            out = np.empty(RGB.shape, dtype=DEFAULT_FLOAT_DTYPE)
+
+        np.subtract(RGB, x_min, out=out)
+        out *= scale
+
+        # The positions are positive, thus truncating them is flooring them.
+        i = out.astype(DEFAULT_INT_DTYPE)
+        np.clip(i, 0, len(table) - 2, out=i)
+
+        # The slopes are computed from the current table so that in-place
+        # modifications of the table are accounted for.
+        out -= i
+        out *= np.diff(table)[i]
+        out += table[i]
+
+        return out if is_out else as_float(out)
 
     def as_LUT(self, cls, force_conversion=False, **kwargs):
         """
@@ -1771,7 +2040,9 @@ class LUT3D(AbstractLUT):
     def apply(self,
               RGB,
               interpolator=table_interpolation_trilinear,
-              interpolator_args=None):
+              interpolator_args=None,
+              tile_size=None,
+              threads=None):
         """
         Applies the *LUT* to given *RGB* colourspace array using given method.
 
@@ -1783,12 +2054,28 @@ class LUT3D(AbstractLUT):
             Interpolator object to use as interpolating function.
         interpolator_args : dict_like, optional
             Arguments to use when calling the interpolating function.
+        tile_size : int, optional
+            Count of *RGB* colourspace values processed at once, i.e. the
+            size of the strips the array is split into, bounding the peak
+            memory usage of the interpolating function temporaries. The whole
+            *RGB* colourspace array is processed at once if *None*.
+        threads : int, optional
+            Count of threads processing the tiles concurrently when
+            ``tile_size`` is given, default to and limited by
+            :func:`multiprocessing.cpu_count`.
 
         Returns
         -------
         ndarray
             Interpolated *RGB* colourspace array.
 
+        Notes
+        -----
+        -   The *RGB* colourspace values are interpolated independently, thus
+            tiling yields the same output as processing the whole array at
+            once. *Numpy* releasing the *GIL* during the heavy operations, the
+            tiles are processed in parallel by the threads.
+
         Examples
         --------
         >>> LUT = LUT3D(LUT3D.linear_table() ** (1 / 2.2))
@@ -1808,7 +2095,8 @@ class LUT3D(AbstractLUT):
         array([ 0.2996370..., -0.0901332..., -0.3949770...])
         """
 
-        R, G, B = tsplit(RGB)
+        if interpolator_args is None:
+            interpolator_args = {}
 
         if self.is_domain_explicit():
             domain_min = self.domain[0, ...]
@@ -1824,12 +2112,21 @@ class LUT3D(AbstractLUT):
         else:
             domain_min, domain_max = self.domain
 
-        RGB_l = [
-            linear_conversion(j, (domain_min[i], domain_max[i]), (0, 1))
-            for i, j in enumerate((R, G, B))
-        ]
+        def apply_tile(RGB):
+            """
+            Applies the *LUT* to given *RGB* colourspace array tile.
+            """
+
+            RGB_l = [
+                linear_conversion(j, (domain_min[i], domain_max[i]), (0, 1))
+                for i, j in enumerate(tsplit(RGB))
+            ]
+
+            return interpolator(tstack(RGB_l), self._table,
+                                **interpolator_args)
 
-        return interpolator(tstack(RGB_l), self._table)
+        return _apply_tiled(apply_tile, RGB, tile_size, threads,
+                            interpolator_args.get('dtype'))
 
     def as_LUT(self, cls, force_conversion=False, **kwargs):
         """
@@ -2025,6 +2322,45 @@ def LUT_to_LUT(LUT, cls, force_conversion=False, **kwargs):
     return LUT
 
 
+def _shaper_samples_and_values(shaper):
+    """
+    Returns the per channel samples and values of given shaper *LUT*.
+
+    Parameters
+    ----------
+    shaper : LUT1D or LUT2D
+        Shaper *LUT*.
+
+    Returns
+    -------
+    list
+        Per channel samples and values of the shaper *LUT*.
+    """
+
+    if isinstance(shaper, LUT1D):
+        if shaper.is_domain_explicit():
+            samples = shaper.domain
+        else:
+            samples = np.linspace(shaper.domain[0], shaper.domain[1],
+                                  shaper.table.size)
+
+        return [(samples, shaper.table)] * 3
+    else:
+        if shaper.is_domain_explicit():
+            samples = [
+                axes[:(~np.isnan(axes)).cumsum().argmax() + 1]
+                for axes in np.transpose(shaper.domain)
+            ]
+        else:
+            samples = [
+                np.linspace(shaper.domain[0][i], shaper.domain[1][i],
+                            shaper.table.shape[0]) for i in range(3)
+            ]
+
+        return [(samples[i], axes[:len(samples[i])])
+                for i, axes in enumerate(np.transpose(shaper.table))]
+
+
 @add_metaclass(ABCMeta)
 class AbstractLUTSequenceOperator:
     """
@@ -2086,6 +2422,7 @@ class LUTSequence(MutableSequence):
     __ne__
     insert
     apply
+    bake
     copy
 
     Examples
@@ -2331,7 +2668,9 @@ class LUTSequence(MutableSequence):
               interpolator_1D=LinearInterpolator,
               interpolator_1D_args=None,
               interpolator_3D=table_interpolation_trilinear,
-              interpolator_3D_args=None):
+              interpolator_3D_args=None,
+              tile_size=None,
+              threads=None):
         """
         Applies the *LUT* sequence sequentially to given *RGB* colourspace
         array.
@@ -2353,12 +2692,31 @@ class LUTSequence(MutableSequence):
         interpolator_3D_args : dict_like, optional
             Arguments to use when calling the interpolating function for
             :class:`colour.LUT3D` class instances.
+        tile_size : int, optional
+            Count of *RGB* colourspace values processed at once by the whole
+            *LUT* sequence, i.e. the size of the strips the array is split
+            into, bounding the peak memory usage of the operations
+            temporaries. The whole *RGB* colourspace array is processed at
+            once if *None*.
+        threads : int, optional
+            Count of threads processing the tiles concurrently when
+            ``tile_size`` is given, default to and limited by
+            :func:`multiprocessing.cpu_count`.
 
         Returns
         -------
         ndarray
             Processed *RGB* colourspace array.
 
+        Notes
+        -----
+        -   Tiling requires the custom
+            :class:`colour.io.luts.lut.AbstractLUTSequenceOperator` class
+            instances of the *LUT* sequence to process the *RGB* colourspace
+            values independently.
+        -   The tiled *RGB* colourspace array is returned with the
+            :attr:`colour.constants.DEFAULT_FLOAT_DTYPE` data type.
+
         Examples
         --------
         >>> LUT_1 = LUT1D(LUT1D.linear_table(16) + 0.125)
@@ -2375,17 +2733,147 @@ class LUTSequence(MutableSequence):
                [ 0.75     ...,  0.75     ...,  0.75     ...]])
         """
 
-        for operation in self:
-            if isinstance(operation, (LUT1D, LUT2D)):
-                RGB = operation.apply(RGB, interpolator_1D,
-                                      interpolator_1D_args)
-            elif isinstance(operation, LUT3D):
-                RGB = operation.apply(RGB, interpolator_3D,
-                                      interpolator_3D_args)
-            else:
-                RGB = operation.apply(RGB)
+        def apply_tile(RGB):
+            """
+            Applies the *LUT* sequence to given *RGB* colourspace array tile.
+            """
+
+            for operation in self:
+                if isinstance(operation, (LUT1D, LUT2D)):
+                    RGB = operation.apply(RGB, interpolator_1D,
+                                          interpolator_1D_args)
+                elif isinstance(operation, LUT3D):
+                    RGB = operation.apply(RGB, interpolator_3D,
+                                          interpolator_3D_args)
+                else:
+                    RGB = operation.apply(RGB)
 
-        return RGB
+            return RGB
+
+        return _apply_tiled(apply_tile, RGB, tile_size, threads)
+
+    def bake(self,
+             size=33,
+             shaper=None,
+             domain=np.array([[0, 0, 0], [1, 1, 1]]),
+             validation_size=None,
+             additional_data=False,
+             **kwargs):
+        """
+        Bakes the *LUT* sequence into a single :class:`colour.LUT3D` class
+        instance, optionally preceded by a shaper *LUT*, so that applying it
+        costs a single 3D lookup.
+
+        Parameters
+        ----------
+        size : int, optional
+            Baked :class:`colour.LUT3D` class instance size.
+        shaper : LUT1D or LUT2D, optional
+            Strictly increasing shaper *LUT* mapping the input domain, e.g. a
+            *HDR* or logarithmic encoding, to the baked
+            :class:`colour.LUT3D` class instance domain. The *LUT* sequence is
+            sampled at the shaper *LUT* inverse of the baked
+            :class:`colour.LUT3D` class instance vertices.
+        domain : array_like, optional
+            Input domain of the baked :class:`colour.LUT3D` class instance,
+            ignored if a shaper *LUT* is given.
+        validation_size : int, optional
+            Size of the validation grid spanning the input domain on which
+            the maximum error of the baked *LUT* against the *LUT* sequence is
+            computed, default to ``2 * size - 1`` so that the validation grid
+            includes the midpoints of the baked :class:`colour.LUT3D` class
+            instance cells.
+        additional_data : bool, optional
+            Whether to output the maximum error along the baked *LUT*.
+
+        Other Parameters
+        ----------------
+        \\**kwargs : dict, optional
+            Keywords arguments for the :meth:`colour.LUTSequence.apply`
+            method, used to sample the *LUT* sequence and to apply the baked
+            *LUT* on the validation grid.
+
+        Returns
+        -------
+        LUT3D or LUTSequence or tuple
+            Baked :class:`colour.LUT3D` class instance, or *LUT* sequence of
+            the shaper *LUT* and the baked :class:`colour.LUT3D` class
+            instance, and the maximum error if ``additional_data`` is *True*.
+
+        Notes
+        -----
+        -   The maximum error is also stored in the baked
+            :class:`colour.LUT3D` class instance comments.
+
+        Examples
+        --------
+        >>> LUT_1 = LUT1D(LUT1D.linear_table(16) + 0.125)
+        >>> LUT_2 = LUT3D(LUT3D.linear_table(16) ** (1 / 2.2))
+        >>> LUT_3 = LUT2D(LUT2D.linear_table(16) * 0.750)
+        >>> LUT_sequence = LUTSequence(LUT_1, LUT_2, LUT_3)
+        >>> LUT, error = LUT_sequence.bake(16, additional_data=True)
+        >>> print(LUT.table.shape)
+        (16, 16, 16, 3)
+        >>> error < 1e-2
+        True
+        """
+
+        if shaper is not None:
+            assert isinstance(shaper, (LUT1D, LUT2D)), (
+                '"shaper" must be a "LUT1D" or "LUT2D" instance!')
+
+            samples_and_values = _shaper_samples_and_values(shaper)
+            for _samples, values in samples_and_values:
+                assert np.all(np.diff(values) > 0), (
+                    '"shaper" must be strictly increasing!')
+
+            domain_i = np.array([[samples[0] for samples, _values in
+                                  samples_and_values],
+                                 [samples[-1] for samples, _values in
+                                  samples_and_values]])
+            domain_o = np.array([[values[0] for _samples, values in
+                                  samples_and_values],
+                                 [values[-1] for _samples, values in
+                                  samples_and_values]])
+
+            vertices = LUT3D.linear_table(size, domain_o)
+            RGB = tstack([
+                LinearInterpolator(values, samples)(axes)
+                for (samples, values), axes in zip(samples_and_values,
+                                                   tsplit(vertices))
+            ])
+        else:
+            domain_i = domain_o = as_float_array(domain)
+            RGB = LUT3D.linear_table(size, domain_o)
+
+        LUT = LUT3D(
+            self.apply(RGB, **kwargs),
+            'Baked - {0}'.format(' ---> '.join(
+                getattr(operation, 'name', operation.__class__.__name__)
+                for operation in self)),
+            domain_o)
+        LUT_sequence = (LUTSequence(LUT)
+                        if shaper is None else LUTSequence(shaper, LUT))
+
+        if validation_size is None:
+            validation_size = 2 * size - 1
+
+        RGB = LUT3D.linear_table(validation_size, domain_i)
+        error = np.max(
+            np.abs(LUT_sequence.apply(RGB, **kwargs) - self.apply(
+                RGB, **kwargs)))
+
+        LUT.comments = [
+            'Maximum error on a {0}^3 validation grid: {1}'.format(
+                validation_size, error)
+        ]
+
+        LUT = LUT if shaper is None else LUT_sequence
+
+        if additional_data:
+            return LUT, error
+        else:
+            return LUT
 
     def copy(self):
         """
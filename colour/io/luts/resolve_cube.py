@@ -21,8 +21,9 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.io.luts import LUT1D, LUT2D, LUT3D, LUTSequence
-from colour.io.luts.common import parse_array, path_to_title
-from colour.utilities import as_float_array, tstack
+from colour.io.luts.common import (format_table, parse_array, parse_table,
+                                   path_to_title)
+from colour.utilities import tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -107,9 +108,8 @@ def read_LUT_ResolveCube(path):
     has_2D, has_3D = False, False
 
     with open(path) as cube_file:
-        lines = cube_file.readlines()
         LUT = LUTSequence(LUT2D(), LUT3D())
-        for line in lines:
+        for line in cube_file:
             line = line.strip()
 
             if len(line) == 0:
@@ -119,6 +119,12 @@ def read_LUT_ResolveCube(path):
                 comments.append(line[1:].strip())
                 continue
 
+            # The table data lines are gathered as they are and parsed at once
+            # afterwards.
+            if not line[0].isalpha():
+                table.append(line)
+                continue
+
             tokens = line.split()
             if tokens[0] == 'TITLE':
                 title = ' '.join(tokens[1:])[1:-1]
@@ -134,10 +140,8 @@ def read_LUT_ResolveCube(path):
             elif tokens[0] == 'LUT_3D_SIZE':
                 has_3D = True
                 size_3D = np.int_(tokens[1])
-            else:
-                table.append(parse_array(tokens))
 
-    table = as_float_array(table)
+    table = parse_table(table)
     if has_2D and has_3D:
         LUT[0].name = '{0} - Shaper'.format(title)
         LUT[1].name = '{0} - Cube'.format(title)
@@ -253,13 +257,6 @@ def write_LUT_ResolveCube(LUT, path, decimals=7):
     if has_3D:
         assert 2 <= LUT[1].size <= 256, 'Cube size must be in domain [2, 256]!'
 
-    def _format_array(array):
-        """
-        Formats given array as a *Resolve* *.cube* data row.
-        """
-
-        return '{1:0.{0}f} {2:0.{0}f} {3:0.{0}f}'.format(decimals, *array)
-
     def _format_tuple(array):
         """
         Formats given array as 2 space separated values to *decimals*
@@ -295,15 +292,14 @@ def write_LUT_ResolveCube(LUT, path, decimals=7):
                 cube_file.write('LUT_3D_INPUT_RANGE {0}\n'.format(
                     _format_tuple([LUT[1].domain[0][0], LUT[1].domain[1][0]])))
 
+        fmt = '%.{0}f'.format(decimals)
+
         if has_2D:
-            table = LUT[0].table
-            for row in table:
-                cube_file.write('{0}\n'.format(_format_array(row)))
+            cube_file.write(format_table(LUT[0].table, fmt))
             cube_file.write('\n')
 
         if has_3D:
-            table = LUT[1].table.reshape([-1, 3], order='F')
-            for row in table:
-                cube_file.write('{0}\n'.format(_format_array(row)))
+            cube_file.write(
+                format_table(LUT[1].table.reshape([-1, 3], order='F'), fmt))
 
     return True
@@ -15,8 +15,8 @@ import numpy as np
 
 from colour.constants import DEFAULT_INT_DTYPE
 from colour.io.luts import LUT3D, LUTSequence
-from colour.io.luts.common import parse_array, path_to_title
-from colour.utilities import as_float_array, usage_warning
+from colour.io.luts.common import format_table, parse_table, path_to_title
+from colour.utilities import usage_warning
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -64,13 +64,12 @@ def read_LUT_SonySPI3D(path):
     title = path_to_title(path)
     domain_min, domain_max = np.array([0, 0, 0]), np.array([1, 1, 1])
     size = 2
-    indexes = []
+    has_size = False
     table = []
     comments = []
 
     with open(path) as spi3d_file:
-        lines = spi3d_file.readlines()
-        for line in lines:
+        for line in spi3d_file:
             line = line.strip()
 
             if len(line) == 0:
@@ -80,22 +79,29 @@ def read_LUT_SonySPI3D(path):
                 comments.append(line[1:].strip())
                 continue
 
+            # The table data lines following the size line are gathered as
+            # they are and parsed at once afterwards.
+            if has_size:
+                table.append(line)
+                continue
+
             tokens = line.split()
             if len(tokens) == 3:
                 assert len(set(tokens)) == 1, (
                     'Non-uniform "LUT" shape is unsupported!')
 
                 size = DEFAULT_INT_DTYPE(tokens[0])
-            if len(tokens) == 6:
-                indexes.append(parse_array(tokens[:3]))
-                table.append(parse_array(tokens[3:]))
+                has_size = True
+
+    table = parse_table(table, 6)
+    indexes, table = table[:, :3], table[:, 3:]
 
     assert np.array_equal(
         indexes,
         DEFAULT_INT_DTYPE(LUT3D.linear_table(size) * (size - 1)).reshape(
             (-1, 3))), 'Indexes do not match expected "LUT3D" indexes!'
 
-    table = as_float_array(table).reshape([size, size, size, 3])
+    table = table.reshape([size, size, size, 3])
 
     return LUT3D(
         table, title, np.vstack([domain_min, domain_max]), comments=comments)
@@ -152,14 +158,6 @@ def write_LUT_SonySPI3D(LUT, path, decimals=7):
         [1, 1, 1],
     ])), '"LUT" domain must be [[0, 0, 0], [1, 1, 1]]!'
 
-    def _format_array(array):
-        """
-        Formats given array as a *Sony* *.spi3d* data row.
-        """
-
-        return '{1:d} {2:d} {3:d} {4:0.{0}f} {5:0.{0}f} {6:0.{0}f}'.format(
-            decimals, *array)
-
     with open(path, 'w') as spi3d_file:
         spi3d_file.write('SPILUT 1.0\n')
 
@@ -171,9 +169,10 @@ def write_LUT_SonySPI3D(LUT, path, decimals=7):
             LUT.linear_table(LUT.size) * (LUT.size - 1)).reshape([-1, 3])
         table = LUT.table.reshape([-1, 3])
 
-        for i, row in enumerate(indexes):
-            spi3d_file.write('{0}\n'.format(
-                _format_array(list(row) + list(table[i]))))
+        spi3d_file.write(
+            format_table(
+                np.hstack([indexes, table]),
+                ['%d'] * 3 + ['%.{0}f'.format(decimals)] * 3))
 
         if LUT.comments:
             for comment in LUT.comments:
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.io import LUTSequence, read_LUT
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['LUTS_DIRECTORY', 'TestReadLUT']
+
+LUTS_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
+
+
+class TestReadLUT(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.read_LUT` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_LUT_cache(self):
+        """
+        Tests :func:`colour.io.luts.read_LUT` definition cache.
+        """
+
+        cache_directory = os.path.join(self._temporary_directory, 'cache')
+        path = os.path.join(self._temporary_directory, 'LogC_Video.cube')
+        shutil.copy(
+            os.path.join(LUTS_DIRECTORY, 'resolve_cube', 'LogC_Video.cube'),
+            path)
+
+        LUT_r = read_LUT(path, 'Resolve Cube')
+        LUT_t = read_LUT(path, 'Resolve Cube', cache_directory)
+
+        self.assertEqual(LUT_r, LUT_t)
+        self.assertEqual(len(os.listdir(cache_directory)), 1)
+
+        LUT_t = read_LUT(path, 'Resolve Cube', cache_directory)
+
+        self.assertIsInstance(LUT_t, LUTSequence)
+        self.assertEqual(LUT_r, LUT_t)
+        self.assertEqual(len(os.listdir(cache_directory)), 1)
+
+        # Modifying the file invalidates its cache entry.
+        with open(path, 'a') as cube_file:
+            cube_file.write('\n')
+
+        read_LUT(path, 'Resolve Cube', cache_directory)
+        self.assertEqual(len(os.listdir(cache_directory)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.colour_binary` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.io import (LUT1D, LUT2D, LUT3D, LUTSequence,
+                       read_LUT_ColourBinary, read_LUT_ResolveCube,
+                       write_LUT_ColourBinary)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'LUTS_DIRECTORY', 'TestReadLUTColourBinary', 'TestWriteLUTColourBinary'
+]
+
+LUTS_DIRECTORY = os.path.join(
+    os.path.dirname(__file__), 'resources', 'resolve_cube')
+
+
+class TestReadLUTColourBinary(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.colour_binary.read_LUT_ColourBinary`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_LUT_ColourBinary(self):
+        """
+        Tests :func:`colour.io.luts.colour_binary.read_LUT_ColourBinary`
+        definition.
+        """
+
+        path = os.path.join(self._temporary_directory, 'ColourCorrect.lutb')
+        LUT = LUT3D(
+            LUT3D.linear_table(4) ** (1 / 2.2),
+            'ColourCorrect',
+            np.array([[-0.1, -0.2, -0.4], [1.5, 3.0, 6.0]]),
+            comments=['A first comment.', 'A second comment.'])
+        write_LUT_ColourBinary(LUT, path)
+
+        LUT_t = read_LUT_ColourBinary(path)
+
+        self.assertIsInstance(LUT_t, LUT3D)
+        self.assertEqual(LUT_t.name, 'ColourCorrect')
+        self.assertListEqual(LUT_t.comments,
+                             ['A first comment.', 'A second comment.'])
+        np.testing.assert_array_equal(LUT_t.table, LUT.table)
+        np.testing.assert_array_equal(LUT_t.domain, LUT.domain)
+
+        # The table is memory-mapped and copy-on-write.
+        self.assertFalse(LUT_t.table.flags.owndata)
+        LUT_t.table[0, 0, 0] = -1
+        np.testing.assert_array_equal(
+            read_LUT_ColourBinary(path).table, LUT.table)
+
+        with open(os.path.join(self._temporary_directory, 'Invalid.lutb'),
+                  'wb') as lutb_file:
+            lutb_file.write(b'INVALID!' * 4)
+
+        self.assertRaises(AssertionError, read_LUT_ColourBinary,
+                          os.path.join(self._temporary_directory,
+                                       'Invalid.lutb'))
+
+
+class TestWriteLUTColourBinary(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.colour_binary.write_LUT_ColourBinary`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_LUT_ColourBinary(self):
+        """
+        Tests :func:`colour.io.luts.colour_binary.write_LUT_ColourBinary`
+        definition.
+        """
+
+        for i, LUT_r in enumerate((
+                LUT1D(name='Unity 10', size=10),
+                LUT2D(LUT2D.linear_table(16, np.array([[-0.1, -0.2, -0.4],
+                                                       [1.5, 3.0, 6.0]]))),
+                LUT3D(LUT3D.linear_table(5) ** 2, 'Gamma 2'),
+                read_LUT_ResolveCube(
+                    os.path.join(LUTS_DIRECTORY, 'LogC_Video.cube')),
+        )):
+            path = os.path.join(self._temporary_directory,
+                                'LUT_{0}.lutb'.format(i))
+            write_LUT_ColourBinary(LUT_r, path)
+
+            LUT_t = read_LUT_ColourBinary(path)
+
+            self.assertIs(type(LUT_t), type(LUT_r))
+            self.assertEqual(LUT_r, LUT_t)
+
+        path = os.path.join(self._temporary_directory, 'LUTSequence.lutb')
+        write_LUT_ColourBinary(
+            LUTSequence(
+                LUT1D(LUT1D.linear_table(16) ** (1 / 2.2), 'My Shaper'),
+                LUT3D(LUT3D.linear_table(16) * 0.5, 'My LUT')), path)
+
+        LUT_t = read_LUT_ColourBinary(path)
+
+        self.assertIsInstance(LUT_t, LUTSequence)
+        self.assertListEqual([LUT.name for LUT in LUT_t],
+                             ['My Shaper', 'My LUT'])
+
+        self.assertRaises(AssertionError, write_LUT_ColourBinary, object(),
+                          path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,8 @@ import numpy as np
 import unittest
 
 from colour.constants import DEFAULT_INT_DTYPE
-from colour.io.luts.common import parse_array, path_to_title
+from colour.io.luts.common import (format_table, parse_array, parse_table,
+                                   path_to_title)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -18,7 +19,9 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestParseArray', 'TestPathToTitle']
+__all__ = [
+    'TestParseArray', 'TestParseTable', 'TestFormatTable', 'TestPathToTitle'
+]
 
 
 class TestParseArray(unittest.TestCase):
@@ -64,6 +67,58 @@ class TestParseArray(unittest.TestCase):
             DEFAULT_INT_DTYPE)
 
 
+class TestParseTable(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.parse_table` definition unit tests
+    methods.
+    """
+
+    def test_parse_table(self):
+        """
+        Tests :func:`colour.io.luts.common.parse_table` definition.
+        """
+
+        np.testing.assert_equal(
+            parse_table(['-0.25 0.5 0.75', '0.0\t1.0  2.0']),
+            np.array([[-0.25, 0.5, 0.75], [0.0, 1.0, 2.0]]),
+        )
+
+        np.testing.assert_equal(
+            parse_table(['0 0 0 -0.25 0.5 0.75'], 6),
+            np.array([[0, 0, 0, -0.25, 0.5, 0.75]]),
+        )
+
+        self.assertEqual(parse_table([]).shape, (0, 3))
+
+        self.assertRaises(AssertionError, parse_table, ['-0.25 0.5'])
+
+
+class TestFormatTable(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.format_table` definition unit tests
+    methods.
+    """
+
+    def test_format_table(self):
+        """
+        Tests :func:`colour.io.luts.common.format_table` definition.
+        """
+
+        table = np.array([[-0.25, 0.5, 0.75], [0, 1, 2]])
+
+        self.assertEqual(
+            format_table(table),
+            '-0.2500000 0.5000000 0.7500000\n'
+            '0.0000000 1.0000000 2.0000000\n')
+
+        self.assertEqual(
+            format_table(table, ['%d', '%.1f', '%.2f']),
+            '0 0.5 0.75\n0 1.0 2.00\n')
+
+        np.testing.assert_equal(
+            parse_table(format_table(table).splitlines()), table)
+
+
 class TestPathToTitle(unittest.TestCase):
     """
     Defines :func:`colour.io.luts.common.path_to_title` definition unit tests
@@ -10,8 +10,11 @@ import os
 import textwrap
 import unittest
 
-from colour.algebra import random_triplet_generator, spow
-from colour.io.luts.lut import AbstractLUT
+from colour.algebra import (random_triplet_generator, spow,
+                            table_interpolation_trilinear)
+from colour.constants import DEFAULT_INT_DTYPE
+from colour.io.luts.lut import (AbstractLUT, _apply_tiled,
+                                _apply_tiled_thread_pool)
 from colour.io.luts import (AbstractLUTSequenceOperator, LUT1D, LUT2D, LUT3D,
                             LUTSequence, LUT_to_LUT)
 from colour.models import function_gamma
@@ -563,6 +566,109 @@ class TestLUT1D(TestLUT):
              [0.05775947, 0.81950198, 0.94514273]],
         ])
 
+    def test_apply_uniform_indexing(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT1D.apply` method uniform indexing
+        and output array.
+        """
+
+        LUT = LUT1D(self._table_2)
+
+        # Interpolator arguments bypass the uniform indexing.
+        np.testing.assert_almost_equal(
+            LUT.apply(RANDOM_TRIPLETS),
+            LUT.apply(
+                RANDOM_TRIPLETS, interpolator_args={'dtype': np.float64}),
+            decimal=7)
+
+        RGB = np.copy(RANDOM_TRIPLETS).astype(np.float32)
+        self.assertIs(LUT.apply(RGB, out=RGB), RGB)
+        np.testing.assert_almost_equal(RGB, self._applied_1, decimal=6)
+
+        out = np.empty(RANDOM_TRIPLETS.shape)
+        self.assertIs(
+            LUT.apply(
+                RANDOM_TRIPLETS,
+                interpolator_args={'dtype': np.float64},
+                out=out), out)
+        np.testing.assert_almost_equal(out, self._applied_1, decimal=7)
+
+        self.assertIsInstance(LUT.apply(0.18), float)
+
+        # Setting the table clears the cached uniform indexing.
+        LUT.table = self._table_1
+        np.testing.assert_almost_equal(
+            LUT.apply(RANDOM_TRIPLETS), RANDOM_TRIPLETS, decimal=7)
+
+        self.assertRaises(
+            ValueError, LUT.apply, RANDOM_TRIPLETS, out=np.empty(3))
+        self.assertRaises(
+            ValueError,
+            LUT.apply,
+            RANDOM_TRIPLETS,
+            out=np.empty(RANDOM_TRIPLETS.shape, DEFAULT_INT_DTYPE))
+        self.assertRaises(ValueError, LUT.apply, np.array([-0.1, 0.5, 1.0]))
+        self.assertRaises(ValueError, LUT.apply, np.array([0.0, 0.5, 1.1]))
+
+        # The uniform indexing is used for common sizes whose
+        # "np.linspace" spacings are not exactly equal.
+        for size in (10, 1024, 4096, 65536):
+            LUT = LUT1D(LUT1D.linear_table(size) ** (1 / 2.2))
+            LUT.apply(RANDOM_TRIPLETS)
+            self.assertIsNotNone(LUT._cache['uniform_indexing'][1])
+
+            LUT = LUT1D(
+                LUT1D.linear_table(size) ** (1 / 2.2),
+                domain=np.linspace(-0.1, 1.5, size))
+            LUT.apply(RANDOM_TRIPLETS)
+            self.assertIsNotNone(LUT._cache['uniform_indexing'][1])
+
+        LUT = LUT1D(LUT1D.linear_table(4096) ** (1 / 2.2))
+        np.testing.assert_almost_equal(
+            LUT.apply(RANDOM_TRIPLETS),
+            LUT.apply(
+                RANDOM_TRIPLETS, interpolator_args={'dtype': np.float64}),
+            decimal=7)
+
+        domain = np.linspace(0, 1, 4096) ** 2
+        LUT = LUT1D(domain, domain=domain)
+        LUT.apply(RANDOM_TRIPLETS)
+        self.assertIsNone(LUT._cache['uniform_indexing'][1])
+
+    def test_apply_in_place_modification(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT1D.apply` method with in-place
+        modifications of the table and domain.
+        """
+
+        # Uniform indexing.
+        LUT = LUT1D(LUT1D.linear_table(10))
+        self.assertAlmostEqual(LUT.apply(0.55), 0.55, places=7)
+        LUT.table[5] = 10
+        self.assertAlmostEqual(
+            LUT.apply(0.55), LUT1D(LUT.table).apply(0.55), places=7)
+        self.assertAlmostEqual(LUT.apply(0.55), 9.5222222, places=7)
+
+        LUT.domain[1] = 2
+        self.assertAlmostEqual(
+            LUT.apply(1.1),
+            LUT1D(LUT.table, domain=np.array([0, 2])).apply(1.1),
+            places=7)
+
+        # Cached interpolating function.
+        domain = np.linspace(0, 1, 10) ** 2
+        LUT = LUT1D(domain, domain=domain)
+        self.assertAlmostEqual(LUT.apply(0.5), 0.5, places=7)
+        LUT.table[6] = 10
+        self.assertAlmostEqual(
+            LUT.apply(0.5), LUT1D(LUT.table, domain=domain).apply(0.5),
+            places=7)
+
+        LUT.domain[-1] = 2
+        self.assertAlmostEqual(
+            LUT.apply(1.5), LUT1D(LUT.table, domain=LUT.domain).apply(1.5),
+            places=7)
+
 
 class TestLUT2D(TestLUT):
     """
@@ -758,6 +864,47 @@ class TestLUT3D(TestLUT):
              [0.02408419, 0.81991814, 0.94597809]],
         ])
 
+    def test_apply_tiled(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUT3D.apply` method tiling.
+        """
+
+        LUT = LUT3D(self._table_2)
+        RGB = np.reshape(RANDOM_TRIPLETS, (2, 4, 3))
+
+        for tile_size, threads in ((1, 1), (3, 2), (5, None), (100, None)):
+            np.testing.assert_array_equal(
+                LUT.apply(RGB, tile_size=tile_size, threads=threads),
+                LUT.apply(RGB))
+
+        self.assertEqual(
+            LUT.apply(
+                RGB,
+                interpolator_args={'dtype': np.float32},
+                tile_size=3,
+                threads=2).dtype, np.float32)
+
+        V_xyz_sizes = []
+
+        def interpolator(V_xyz, table, **kwargs):
+            """
+            Trilinear interpolator recording the :math:`V_{xyz}` values size.
+            """
+
+            V_xyz_sizes.append(len(V_xyz))
+
+            return table_interpolation_trilinear(V_xyz, table, **kwargs)
+
+        LUT.apply(RGB, interpolator, tile_size=3, threads=2)
+        self.assertListEqual(sorted(V_xyz_sizes), [2, 3, 3])
+
+        self.assertIs(_apply_tiled_thread_pool(), _apply_tiled_thread_pool())
+
+        np.testing.assert_array_equal(
+            _apply_tiled(
+                lambda x: LUT.apply(x, tile_size=1, threads=2), RGB, 3, 2),
+            LUT.apply(RGB))
+
 
 class TestAbstractLUTSequenceOperator(unittest.TestCase):
     """
@@ -812,7 +959,7 @@ class TestLUTSequence(unittest.TestCase):
 
         required_methods = ('__getitem__', '__setitem__', '__delitem__',
                             '__len__', '__str__', '__repr__', '__eq__',
-                            '__ne__', 'insert', 'apply', 'copy')
+                            '__ne__', 'insert', 'apply', 'bake', 'copy')
 
         for method in required_methods:
             self.assertIn(method, dir(LUTSequence))
@@ -1189,6 +1336,44 @@ class TestLUTSequence(unittest.TestCase):
                 [0.75000000, 0.75000000, 0.75000000],
             ]))
 
+        np.testing.assert_array_equal(
+            LUT_sequence.apply(RGB, tile_size=2, threads=2),
+            LUT_sequence.apply(RGB))
+
+    def test_bake(self):
+        """
+        Tests :class:`colour.io.luts.lut.LUTSequence.bake` method.
+        """
+
+        LUT, error = LUTSequence(LUT3D(LUT3D.linear_table(9))).bake(
+            9, additional_data=True)
+        self.assertIsInstance(LUT, LUT3D)
+        np.testing.assert_almost_equal(
+            LUT.table, LUT3D.linear_table(9), decimal=7)
+        self.assertAlmostEqual(error, 0, places=7)
+
+        LUT, error = self._LUT_sequence.bake(33, additional_data=True)
+        self.assertLess(error, 1e-2)
+        self.assertIn('{0}'.format(error), LUT.comments[0])
+        np.testing.assert_almost_equal(
+            LUT.apply(self._RGB),
+            self._LUT_sequence.apply(self._RGB),
+            decimal=2)
+
+        shaper = LUT1D(
+            np.log2(np.linspace(1, 16, 32)) / 4, domain=np.array([0, 15]))
+        LUT_sequence = LUTSequence(
+            LUT3D(
+                LUT3D.linear_table(9) * 0.5,
+                domain=np.array([[0, 0, 0], [15, 15, 15]])))
+        LUT, error = LUT_sequence.bake(9, shaper, additional_data=True)
+        self.assertIsInstance(LUT, LUTSequence)
+        self.assertIs(LUT[0], shaper)
+        self.assertLess(error, 1e-1)
+
+        self.assertRaises(AssertionError, LUT_sequence.bake, 9,
+                          LUT1D(LUT1D.linear_table(9)[::-1]))
+
 
 class TestLUT_to_LUT(unittest.TestCase):
     """
@@ -40,7 +40,7 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.colorimetry import ILLUMINANTS_SDS, sd_to_XYZ
+from colour.colorimetry import ILLUMINANTS_SDS, reshape_sd, sd_to_XYZ
 from colour.models import XYZ_to_xy
 from colour.models.rgb import (ACES_2065_1_COLOURSPACE, ACES_RICD, RGB_to_XYZ,
                                XYZ_to_RGB, normalised_primary_matrix)
@@ -127,7 +127,7 @@ def sd_to_aces_relative_exposure_values(
         sd = sd.copy().align(shape)
 
     if illuminant.shape != ACES_RICD.shape:
-        illuminant = illuminant.copy().align(shape)
+        illuminant = reshape_sd(illuminant, shape)
 
     s_v = sd.values
     i_v = illuminant.values
@@ -117,23 +117,24 @@ MunsellAndKubelkaMunkToolbox/MunsellAndKubelkaMunkToolbox.html
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
 import re
-from collections import OrderedDict
+from scipy.interpolate import griddata
 
 from colour.algebra import (Extrapolator, LinearInterpolator,
-                            cartesian_to_cylindrical, euclidean_distance,
+                            cartesian_to_polar, euclidean_distance,
                             polar_to_cartesian, spow)
 from colour.colorimetry import ILLUMINANTS, luminance_ASTMD153508
 from colour.constants import (DEFAULT_FLOAT_DTYPE, DEFAULT_INT_DTYPE,
                               INTEGER_THRESHOLD, FLOATING_POINT_NUMBER_PATTERN)
-from colour.models import Lab_to_LCHab, XYZ_to_Lab, XYZ_to_xy, xyY_to_XYZ
+from colour.models import Lab_to_LCHab, XYZ_to_Lab, xyY_to_XYZ
 from colour.volume import is_within_macadam_limits
 from colour.notation import MUNSELL_COLOURS_ALL
-from colour.utilities import (CaseInsensitiveMapping, Lookup, as_float_array,
-                              as_float, domain_range_scale, from_range_1,
-                              from_range_10, get_domain_range_scale,
-                              to_domain_1, to_domain_10, to_domain_100,
-                              is_integer, is_numeric, tsplit, usage_warning)
+from colour.utilities import (
+    CaseInsensitiveMapping, Lookup, as_float_array, as_float, as_int,
+    as_int_array, domain_range_scale, from_range_1, from_range_10,
+    get_domain_range_scale, to_domain_1, to_domain_10, to_domain_100,
+    is_integer, is_numeric, tsplit, tstack, usage_warning)
 
 __author__ = 'Colour Developers, Paul Centore'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -197,9 +198,64 @@ MUNSELL_DEFAULT_ILLUMINANT = 'C'
 MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES = (ILLUMINANTS[
     'CIE 1931 2 Degree Standard Observer'][MUNSELL_DEFAULT_ILLUMINANT])
 
+_MUNSELL_INTERPOLATION_METHODS_RADIAL_ASTM_HUES = {
+    1: ((2, ((15, 30), (60, 85))),
+        (4, ((12.5, 27.5), (57.5, 80))),
+        (6, ((55, 80), )),
+        (8, ((67.5, 77.5), )),
+        (10, ((72.5, 77.5), ))),
+    2: ((2, ((15, 27.5), (77.5, 80))),
+        (4, ((12.5, 30), (62.5, 80))),
+        (6, ((7.5, 22.5), (62.5, 80))),
+        (8, ((7.5, 15), (60, 80))),
+        (10, ((65, 77.5), ))),
+    3: ((2, ((10, 37.5), (65, 85))),
+        (4, ((5, 37.5), (55, 72.5))),
+        (6, ((7.5, 37.5), (57.5, 82.5))),
+        (12, ((7.5, 42.5), (57.5, 80)))),
+    4: ((2, ((7.5, 42.5), (57.5, 85))),
+        (6, ((7.5, 40), (57.5, 82.5))),
+        (10, ((7.5, 40), (57.5, 80)))),
+    5: ((2, ((5, 37.5), (55, 85))),
+        (4, ((2.5, 42.5), (55, 85))),
+        (10, ((2.5, 42.5), (55, 82.5)))),
+    6: ((2, ((5, 37.5), (55, 87.5))),
+        (6, ((5, 42.5), (57.5, 87.5))),
+        (8, ((5, 42.5), (60, 85))),
+        (12, ((5, 42.5), (60, 82.5))),
+        (16, ((5, 42.5), (60, 80)))),
+    7: ((2, ((5, 42.5), (60, 85))),
+        (8, ((5, 42.5), (60, 82.5))),
+        (10, ((30, 42.5), (5, 25), (60, 82.5))),
+        (12, ((30, 42.5), (7.5, 27.5), (80, 82.5))),
+        (14, ((32.5, 40), (7.5, 15), (80, 82.5)))),
+    8: ((2, ((5, 40), (60, 85))),
+        (14, ((32.5, 40), (5, 15), (60, 85)))),
+    9: ((2, ((5, 40), (55, 80))),
+        (6, ((5, 42.5), )),
+        (16, ((35, 42.5), ))),
+}  # yapf: disable
+"""
+*ASTM* hue ranges, exclusive of their bounds, where radial interpolation is
+used when drawing ovoids through data points in the
+*Munsell Renotation System* data, linear interpolation being used otherwise.
+
+The ranges are given for each *Munsell* value as a sequence of minimum
+*Munsell* chromas and ranges, each applying to the chromas greater or equal to
+its minimum chroma and lower than the next minimum chroma.
+
+References
+----------
+:cite:`Centore2014l`
+
+_MUNSELL_INTERPOLATION_METHODS_RADIAL_ASTM_HUES : dict
+"""
+
 _MUNSELL_SPECIFICATIONS_CACHE = None
 _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = None
-_MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = None
+_MUNSELL_RENOTATION_GRID_CACHE = None
+_MUNSELL_INTERPOLATION_METHODS_GRID_CACHE = None
+_MUNSELL_INVERSION_TABLE_CACHE = None
 
 
 def _munsell_specifications():
@@ -260,33 +316,184 @@ def _munsell_value_ASTMD153508_interpolator():
     return _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE
 
 
-def _munsell_maximum_chromas_from_renotation():
+def _munsell_renotation_grid():
+    """
+    Returns the *Munsell Renotation System* data as dense arrays indexed by
+    hue, value and chroma and caches them if not existing.
+
+    The *CIE xyY* colourspace grid has shape (40, V, 26, 3): the first axis
+    is indexed with
+    :func:`colour.notation.munsell._munsell_renotation_hue_index` definition,
+    the second axis with the position of the *Munsell* value in the sorted
+    *Munsell Renotation System* values and the third axis with half the
+    *Munsell* chroma. Missing entries are filled with *nan*.
+
+    The maximum chromas grid has shape (40, V) and stores the maximum
+    *Munsell* chroma available for each hue and value.
+
+    Returns
+    -------
+    tuple
+        *Munsell Renotation System* values, *CIE xyY* colourspace grid and
+        maximum chromas grid.
+    """
+
+    global _MUNSELL_RENOTATION_GRID_CACHE
+
+    if _MUNSELL_RENOTATION_GRID_CACHE is None:
+        hue, value, chroma, code = tsplit(_munsell_specifications())
+
+        values = np.unique(value)
+        hue_indexes = _munsell_renotation_hue_index(hue, code)
+        value_indexes = np.searchsorted(values, value)
+        chroma_indexes = as_int_array(np.around(chroma / 2))
+
+        xyY = np.full((40, values.size, 26, 3), np.nan)
+        xyY[hue_indexes, value_indexes, chroma_indexes] = [
+            colour[1] for colour in MUNSELL_COLOURS_ALL
+        ]
+
+        chromas = np.zeros((40, values.size))
+        np.maximum.at(chromas, (hue_indexes, value_indexes), chroma)
+
+        _MUNSELL_RENOTATION_GRID_CACHE = values, xyY, chromas
+
+    return _MUNSELL_RENOTATION_GRID_CACHE
+
+
+def _munsell_interpolation_methods_grid():
+    """
+    Returns the interpolation methods to use when drawing ovoids through data
+    points in the *Munsell Renotation System* data as a dense grid indexed by
+    value, chroma and *ASTM* hue and caches it if not existing.
+
+    The grid has shape (11, 26, 81): the first axis is indexed with the
+    *Munsell* value, the second axis with half the *Munsell* chroma and the
+    third axis with the position of the *ASTM* hue number on a 1.25 lattice:
+    even indexes are multiples of 2.5 while odd indexes are strictly
+    in-between two multiples of 2.5. The interpolation methods are 0 for
+    *None*, 1 for *Linear* and 2 for *Radial*.
+
+    Returns
+    -------
+    ndarray
+        Interpolation methods grid.
+    """
+
+    global _MUNSELL_INTERPOLATION_METHODS_GRID_CACHE
+
+    if _MUNSELL_INTERPOLATION_METHODS_GRID_CACHE is None:
+        methods = np.zeros((11, 26, 81), DEFAULT_INT_DTYPE)
+        ASTM_hue_indexes = np.arange(81)
+
+        for value, ranges in (
+                _MUNSELL_INTERPOLATION_METHODS_RADIAL_ASTM_HUES.items()):
+            methods[value] = 1
+            for chroma_minimum, ASTM_hues in ranges:
+                is_radial = np.logical_or.reduce([
+                    np.logical_and(ASTM_hue_indexes > ASTM_hue_minimum / 1.25,
+                                   ASTM_hue_indexes < ASTM_hue_maximum / 1.25)
+                    for ASTM_hue_minimum, ASTM_hue_maximum in ASTM_hues
+                ])
+                methods[value, chroma_minimum // 2:] = np.where(
+                    is_radial, 2, 1)
+
+        _MUNSELL_INTERPOLATION_METHODS_GRID_CACHE = methods
+
+    return _MUNSELL_INTERPOLATION_METHODS_GRID_CACHE
+
+
+def _munsell_inversion_table():
     """
-    Returns the maximum *Munsell* chromas from *Munsell Renotation System* data
-    and caches them if not existing.
+    Returns the *Munsell Renotation System* inversion table and caches it if
+    not existing.
+
+    The inversion table is built by converting a dense set of *Munsell*
+    *Colorlab* specifications, i.e. every 0.5 *ASTM* hue, 0.25 value and 1
+    chroma up to the maximum chroma from the *Munsell Renotation System* data,
+    to *CIE xy* chromaticity coordinates and resampling them, for each
+    *Munsell* value, onto a polar grid centered on the *Munsell* default
+    illuminant chromaticity coordinates. The polar grid is regular in angle
+    :math:`\\phi` and in the square root of the radius :math:`\\rho` so
+    that the low chroma colours are densely sampled.
+
+    The table has shape (V, :math:`\\phi`, :math:`\\sqrt{\\rho}`, 2) and
+    stores the cartesian coordinates of the *Munsell* chroma along the *ASTM*
+    hue angle, i.e. :math:`C\\cos(h)` and :math:`C\\sin(h)` with
+    :math:`h = 3.6 \\cdot ASTM`, so that it can be linearly interpolated
+    across the hue discontinuity. The entries outside the
+    *Munsell Renotation System* data coverage are filled with *nan*.
+
+    If the *COLOUR_SCIENCE_MUNSELL_INVERSION_TABLE* environment variable
+    defines a path, the inversion table is loaded from it if existing,
+    otherwise it is built and saved to it so that it is only ever built once.
 
     Returns
     -------
     tuple
-        Maximum *Munsell* chromas.
+        *Munsell* values, polar grid :math:`\\phi` and :math:`\\sqrt{\\rho}`
+        axes and inversion table.
     """
 
-    global _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
+    global _MUNSELL_INVERSION_TABLE_CACHE
+
+    if _MUNSELL_INVERSION_TABLE_CACHE is not None:
+        return _MUNSELL_INVERSION_TABLE_CACHE
+
+    path = os.environ.get('COLOUR_SCIENCE_MUNSELL_INVERSION_TABLE')
+    if path and os.path.exists(path):
+        with np.load(path) as archive:
+            _MUNSELL_INVERSION_TABLE_CACHE = (archive['values'],
+                                              archive['phi'], archive['rho'],
+                                              archive['table'])
+
+        return _MUNSELL_INVERSION_TABLE_CACHE
+
+    values = np.arange(1, 10, 0.25)
+    phi_axis = np.linspace(0, 360, 181)
+    rho_axis = np.linspace(0, 1, 65)
+
+    ASTM_hue = np.arange(0.5, 100.5, 0.5)
+    ASTM_hue, value = [
+        np.ravel(a) for a in np.meshgrid(ASTM_hue, values, indexing='ij')
+    ]
+    hue, code = _ASTM_hue_to_hue(ASTM_hue)
+    chroma_maximum = maximum_chroma_from_renotation(hue, value, code)
 
-    if _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE is None:
-        chromas = OrderedDict()
-        for munsell_colour in MUNSELL_COLOURS_ALL:
-            hue, value, chroma, code = munsell_colour_to_munsell_specification(
-                MUNSELL_COLOUR_FORMAT.format(*munsell_colour[0]))
-            index = (hue, value, code)
-            if index in chromas:
-                chroma = max(chromas[index], chroma)
+    specification = []
+    for chroma in np.arange(0, np.max(chroma_maximum) + 1):
+        chroma = np.minimum(chroma, chroma_maximum)
+        specification.append(tstack([hue, value, chroma, code]))
+    specification = np.unique(np.vstack(specification), axis=0)
 
-            chromas[index] = chroma
+    _hue, value, chroma, _code = tsplit(specification)
+    x, y, _Y = tsplit(_munsell_specification_to_xyY(specification))
+    hue_angle = np.radians(
+        hue_to_ASTM_hue(specification[..., 0], specification[..., 3]) * 3.6)
 
-        _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = tuple(
-            zip(chromas.keys(), chromas.values()))
-    return _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
+    x_center, y_center = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+    phi_grid, rho_grid = np.meshgrid(
+        np.radians(phi_axis), rho_axis ** 2, indexing='ij')
+    x_grid = x_center + rho_grid * np.cos(phi_grid)
+    y_grid = y_center + rho_grid * np.sin(phi_grid)
+
+    table = np.empty((values.size, phi_axis.size, rho_axis.size, 2))
+    for i, value_i in enumerate(values):
+        is_value = value == value_i
+        table[i] = griddata(
+            tstack([x[is_value], y[is_value]]),
+            tstack([
+                chroma[is_value] * np.cos(hue_angle[is_value]),
+                chroma[is_value] * np.sin(hue_angle[is_value])
+            ]), (x_grid, y_grid),
+            method='linear')
+
+    if path:
+        np.savez(path, values=values, phi=phi_axis, rho=rho_axis, table=table)
+
+    _MUNSELL_INVERSION_TABLE_CACHE = values, phi_axis, rho_axis, table
+
+    return _MUNSELL_INVERSION_TABLE_CACHE
 
 
 def munsell_value_Priest1920(Y):
@@ -721,15 +928,16 @@ def munsell_specification_to_xyY(specification):
     """
     Converts given *Munsell* *Colorlab* specification to *CIE xyY* colourspace.
 
-
     Parameters
     ----------
-    specification : numeric or tuple
-        *Munsell* *Colorlab* specification.
+    specification : numeric or array_like, (..., 4)
+        *Munsell* *Colorlab* specification, grey specifications of
+        n-dimensional arrays have a *nan* hue, chroma and code, i.e.
+        ``[nan, value, nan, nan]``.
 
     Returns
     -------
-    ndarray, (3,)
+    ndarray, (..., 3)
         *CIE xyY* colourspace array.
 
     Notes
@@ -763,56 +971,24 @@ def munsell_specification_to_xyY(specification):
     array([ 0.4400632...,  0.5522428...,  0.5761962...])
     >>> munsell_specification_to_xyY(8.9)  # doctest: +ELLIPSIS
     array([ 0.31006  ,  0.31616  ,  0.7461345...])
+    >>> munsell_specification_to_xyY(
+    ...     np.array([[2.1, 8.0, 17.9, 4], [np.nan, 8.9, np.nan, np.nan]]))
+    ... # doctest: +ELLIPSIS
+    array([[ 0.4400632...,  0.5522428...,  0.5761962...],
+           [ 0.31006   ,  0.31616   ,  0.7461345...]])
     """
 
     if is_grey_munsell_colour(specification):
-        specification = as_float(to_domain_10(specification))
-        value = specification
+        specification = _munsell_specification_array(
+            as_float(to_domain_10(specification)))
     else:
         chroma_scale = 50 if get_domain_range_scale() == '1' else 2
         specification = to_domain_10(specification,
                                      np.array([10, 10, chroma_scale, 10]))
-        hue, value, chroma, code = ([as_float(i) for i in specification[0:3]] +
-                                    [DEFAULT_INT_DTYPE(specification[-1])])
-
-        assert 0 <= hue <= 10, (
-            '"{0}" specification hue must be normalised to domain '
-            '[0, 10]!'.format(specification))
-        assert 0 <= value <= 10, (
-            '"{0}" specification value must be normalised to domain '
-            '[0, 10]!'.format(specification))
-
-    with domain_range_scale('ignore'):
-        Y = luminance_ASTMD153508(value)
-
-    if is_integer(value):
-        value_minus = value_plus = round(value)
-    else:
-        value_minus = np.floor(value)
-        value_plus = value_minus + 1
-
-    specification_minus = (value_minus if is_grey_munsell_colour(specification)
-                           else (hue, value_minus, chroma, code))
-    x_minus, y_minus = munsell_specification_to_xy(specification_minus)
-
-    plus_specification = (value_plus
-                          if (is_grey_munsell_colour(specification) or
-                              value_plus == 10) else (hue, value_plus, chroma,
-                                                      code))
-    x_plus, y_plus = munsell_specification_to_xy(plus_specification)
-
-    if value_minus == value_plus:
-        x = x_minus
-        y = y_minus
-    else:
-        with domain_range_scale('ignore'):
-            Y_minus = luminance_ASTMD153508(value_minus)
-            Y_plus = luminance_ASTMD153508(value_plus)
 
-        x = LinearInterpolator((Y_minus, Y_plus), (x_minus, x_plus))(Y)
-        y = LinearInterpolator((Y_minus, Y_plus), (y_minus, y_plus))(Y)
+    xyY = _munsell_specification_to_xyY(specification)
 
-    return np.array([x, y, from_range_1(Y / 100)])
+    return tstack([xyY[..., 0], xyY[..., 1], from_range_1(xyY[..., 2])])
 
 
 def munsell_colour_to_xyY(munsell_colour):
@@ -860,12 +1036,12 @@ def xyY_to_munsell_specification(xyY):
 
     Parameters
     ----------
-    xyY : array_like, (3,)
+    xyY : array_like, (..., 3)
         *CIE xyY* colourspace array.
 
     Returns
     -------
-    numeric or ndarray
+    numeric or ndarray, (..., 4)
         *Munsell* *Colorlab* specification.
 
     Raises
@@ -898,6 +1074,14 @@ def xyY_to_munsell_specification(xyY):
     |                   | ``code``   : [0, 10]  | [0, 1]        |
     +-------------------+-----------------------+---------------+
 
+    -   All the samples of an n-dimensional *CIE xyY* colourspace array are
+        solved simultaneously, the converged samples being masked out from
+        the subsequent iterations.
+    -   A single *CIE xyY* colourspace array, i.e. with shape (3, ), returns a
+        numeric *Munsell* value for a grey colour, an n-dimensional array
+        represents grey colours with a *nan* hue, chroma and code, i.e.
+        ``[nan, value, nan, nan]``.
+
     References
     ----------
     :cite:`Centore2014p`
@@ -907,229 +1091,436 @@ def xyY_to_munsell_specification(xyY):
     >>> xyY = np.array([0.38736945, 0.35751656, 0.59362000])
     >>> xyY_to_munsell_specification(xyY)  # doctest: +ELLIPSIS
     array([ 4.2000019...,  8.0999999...,  5.2999996...,  6.        ])
+    >>> xyY = np.array([[0.38736945, 0.35751656, 0.59362000],
+    ...                 [0.31006000, 0.31616000, 0.74613450]])
+    >>> xyY_to_munsell_specification(xyY)  # doctest: +ELLIPSIS
+    array([[ 4.2000019...,  8.0999999...,  5.2999996...,  6.        ],
+           [        nan,  8.9000000...,         nan,         nan]])
+    """
+
+    return _xyY_to_munsell_specification(xyY)
+
+
+def _xyY_to_munsell_specification(xyY, use_inversion_table=False):
     """
+    Converts from *CIE xyY* colourspace to *Munsell* *Colorlab* specification,
+    optionally using the *Munsell Renotation System* inversion table.
+
+    Parameters
+    ----------
+    xyY : array_like, (..., 3)
+        *CIE xyY* colourspace array.
+    use_inversion_table : bool, optional
+        Whether to estimate the specification with the
+        *Munsell Renotation System* inversion table and refine it with a
+        single iteration, the samples not covered by the inversion table
+        are iterated until convergence from the
+        :func:`colour.notation.munsell.LCHab_to_munsell_specification`
+        definition estimate.
 
+    Returns
+    -------
+    numeric or ndarray, (..., 4)
+        *Munsell* *Colorlab* specification.
+
+    Examples
+    --------
+    >>> xyY = np.array([0.38736945, 0.35751656, 0.59362000])
+    >>> _xyY_to_munsell_specification(xyY, True)  # doctest: +ELLIPSIS
+    array([ 4.1989748...,  8.0999999...,  5.3001764...,  6.        ])
+    """
+
+    xyY = as_float_array(xyY)
     x, y, Y = tsplit(xyY)
     Y = to_domain_1(Y)
 
-    if not is_within_macadam_limits(xyY, MUNSELL_DEFAULT_ILLUMINANT):
+    if not np.all(
+            is_within_macadam_limits(
+                tstack([x, y, Y]), MUNSELL_DEFAULT_ILLUMINANT)):
         usage_warning('"{0}" is not within "MacAdam" limits for illuminant '
                       '"{1}"!'.format(xyY, MUNSELL_DEFAULT_ILLUMINANT))
 
-    with domain_range_scale('ignore'):
-        value = munsell_value_ASTMD153508(Y * 100)
-
-    if is_integer(value):
-        value = round(value)
+    x, y, Y = np.ravel(x), np.ravel(y), np.ravel(Y)
 
     with domain_range_scale('ignore'):
-        x_center, y_center, Y_center = np.ravel(
-            munsell_specification_to_xyY(value))
+        value = np.ravel(munsell_value_ASTMD153508(Y * 100))
 
-    rho_input, phi_input, _z_input = cartesian_to_cylindrical(
-        (x - x_center, y - y_center, Y_center))
-    phi_input = np.degrees(phi_input)
+    value = np.where(
+        np.abs(value - np.around(value)) <= INTEGER_THRESHOLD,
+        np.around(value), value)
 
-    grey_threshold = 1e-7
-    if rho_input < grey_threshold:
-        return from_range_10(value)
+    x_center, y_center = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
 
-    X, Y, Z = np.ravel(xyY_to_XYZ((x, y, Y)))
-    xi, yi = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
-    Xr, Yr, Zr = np.ravel(xyY_to_XYZ((xi, yi, Y)))
+    rho_input, _phi_input = tsplit(
+        cartesian_to_polar(tstack([x - x_center, y - y_center])))
 
-    XYZ = np.array([X, Y, Z])
-    XYZr = np.array([(1 / Yr) * Xr, 1, (1 / Yr) * Zr])
+    grey_threshold = 1e-7
+    is_grey = rho_input < grey_threshold
+
+    specification = np.full((x.size, 4), np.nan)
+    specification[..., 1] = value
+
+    is_iterated = ~is_grey
+    if use_inversion_table:
+        specification_table = _munsell_specification_from_inversion_table(
+            tstack([x, y])[is_iterated], value[is_iterated])
+        is_tabulated = np.copy(is_iterated)
+        is_tabulated[is_iterated] = ~np.isnan(specification_table[..., 2])
+        specification[is_tabulated] = _refine_munsell_specification(
+            tstack([x, y])[is_tabulated],
+            specification_table[is_tabulated[is_iterated]],
+            iterations_maximum=1,
+            raise_exception=False)
+        is_iterated = np.logical_and(is_iterated, ~is_tabulated)
 
-    Lab = XYZ_to_Lab(XYZ, XYZ_to_xy(XYZr))
-    LCHab = Lab_to_LCHab(Lab)
+    with domain_range_scale('ignore'):
+        Lab = XYZ_to_Lab(
+            xyY_to_XYZ(tstack([x, y, Y])[is_iterated]),
+            MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES)
+        LCHab = Lab_to_LCHab(Lab)
     hue_initial, _value_initial, chroma_initial, code_initial = (
         LCHab_to_munsell_specification(LCHab))
-    specification_current = [
-        hue_initial, value, (5 / 5.5) * chroma_initial, code_initial
+
+    specification[is_iterated] = _refine_munsell_specification(
+        tstack([x, y])[is_iterated],
+        tstack([
+            np.ravel(hue_initial), value[is_iterated],
+            (5 / 5.5) * np.ravel(chroma_initial),
+            np.ravel(code_initial)
+        ]))
+
+    chroma_scale = 50 if get_domain_range_scale() == '1' else 2
+
+    if xyY.ndim == 1:
+        if is_grey[0]:
+            return from_range_10(as_float(specification[0, 1]))
+        else:
+            return from_range_10(specification[0],
+                                 np.array([10, 10, chroma_scale, 10]))
+
+    return from_range_10(
+        np.reshape(specification, xyY.shape[:-1] + (4, )),
+        np.array([10, 10, chroma_scale, 10]))
+
+
+def _refine_munsell_specification(xy,
+                                  specification,
+                                  iterations_maximum=64,
+                                  raise_exception=True):
+    """
+    Refines given *Munsell* *Colorlab* specification estimates until their
+    *CIE xy* chromaticity coordinates converge to given *CIE xy* chromaticity
+    coordinates.
+
+    Each iteration refines the hue angle and then the chroma of the samples
+    that have not converged yet, the value being kept constant.
+
+    Parameters
+    ----------
+    xy : array_like, (N, 2)
+        *CIE xy* chromaticity coordinates of chromatic colours.
+    specification : array_like, (N, 4)
+        *Munsell* *Colorlab* specification estimates in reference scale.
+    iterations_maximum : int, optional
+        Maximum outer iterations count.
+    raise_exception : bool, optional
+        Whether to raise an exception if the maximum outer iterations count
+        has been reached without convergence, otherwise the current estimates
+        are returned.
+
+    Returns
+    -------
+    ndarray, (N, 4)
+        Refined *Munsell* *Colorlab* specification.
+
+    Raises
+    ------
+    RuntimeError
+        If the maximum iterations count has been reached without converging to
+        a result.
+
+    Examples
+    --------
+    >>> xy = np.array([[0.38736945, 0.35751656]])
+    >>> specification = np.array([[4.0, 8.1, 5.0, 6.0]])
+    >>> _refine_munsell_specification(xy, specification)  # doctest: +ELLIPSIS
+    array([[ 4.2000044...,  8.1       ,  5.2999991...,  6.        ]])
+    """
+
+    x, y = [np.ravel(a) for a in tsplit(xy)]
+    hue_current, value, chroma_current, code_current = [
+        np.ravel(a) for a in tsplit(specification)
     ]
 
+    x_center, y_center = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+
+    rho_input, phi_input = tsplit(
+        cartesian_to_polar(tstack([x - x_center, y - y_center])))
+    phi_input = np.degrees(phi_input)
+
+    # Per-sample state of the samples that have not converged yet.
+    specification = np.copy(
+        tstack([hue_current, value, chroma_current, code_current]))
+    indexes = np.arange(x.size)
+
     convergence_threshold = 1e-7
-    iterations_maximum = 64
     iterations = 0
 
-    while iterations <= iterations_maximum:
+    while indexes.size != 0:
+        if iterations == iterations_maximum:
+            if raise_exception:
+                raise RuntimeError(('Maximum outside iterations count '
+                                    'reached without convergence!'))
+
+            specification[indexes] = tstack(
+                [hue_current, value, chroma_current, code_current])
+            break
+
         iterations += 1
 
-        hue_current, _value_current, chroma_current, code_current = (
-            specification_current)
-        hue_angle_current = hue_to_hue_angle(hue_current, code_current)
+        hue_angle_current = np.ravel(
+            hue_to_hue_angle(hue_current, code_current))
 
-        chroma_maximum = maximum_chroma_from_renotation(
-            hue_current, value, code_current)
-        if chroma_current > chroma_maximum:
-            chroma_current = specification_current[2] = chroma_maximum
+        chroma_maximum = np.ravel(
+            maximum_chroma_from_renotation(hue_current, value, code_current))
+        chroma_current = np.minimum(chroma_current, chroma_maximum)
 
-        with domain_range_scale('ignore'):
-            x_current, y_current, _Y_current = np.ravel(
-                munsell_specification_to_xyY(specification_current))
+        x_current, y_current, _Y_current = tsplit(
+            _munsell_specification_to_xyY(
+                tstack([hue_current, value, chroma_current, code_current])))
 
-        rho_current, phi_current, _z_current = cartesian_to_cylindrical(
-            (x_current - x_center, y_current - y_center, Y_center))
+        _rho_current, phi_current = tsplit(
+            cartesian_to_polar(
+                tstack([x_current - x_center, y_current - y_center])))
         phi_current = np.degrees(phi_current)
         phi_current_difference = (360 - phi_input + phi_current) % 360
-        if phi_current_difference > 180:
-            phi_current_difference -= 360
+        phi_current_difference = np.where(phi_current_difference > 180,
+                                          phi_current_difference - 360,
+                                          phi_current_difference)
+
+        # The hue angle is refined using the current specification and a
+        # single inner specification: their *phi* differences are linearly
+        # interpolated, or extrapolated if they share the same sign.
+        hue_angle_inner = (hue_angle_current + (phi_input - phi_current)) % 360
+        hue_angle_difference_inner = (phi_input - phi_current) % 360
+        hue_angle_difference_inner = np.where(hue_angle_difference_inner > 180,
+                                              hue_angle_difference_inner - 360,
+                                              hue_angle_difference_inner)
+
+        hue_inner, code_inner = hue_angle_to_hue(hue_angle_inner)
+
+        x_inner, y_inner, _Y_inner = tsplit(
+            _munsell_specification_to_xyY(
+                tstack([hue_inner, value, chroma_current, code_inner])))
+
+        _rho_inner, phi_inner = tsplit(
+            cartesian_to_polar(
+                tstack([x_inner - x_center, y_inner - y_center])))
+        phi_inner = np.degrees(phi_inner)
+        phi_inner_difference = (360 - phi_input + phi_inner) % 360
+        phi_inner_difference = np.where(phi_inner_difference > 180,
+                                        phi_inner_difference - 360,
+                                        phi_inner_difference)
+
+        hue_angle_difference_new = _linear_interpolation_on_segment(
+            phi_current_difference, phi_inner_difference,
+            np.zeros(indexes.shape), hue_angle_difference_inner, 0) % 360
+        hue_angle_new = (hue_angle_current + hue_angle_difference_new) % 360
+
+        hue_current, code_current = [
+            np.ravel(a) for a in hue_angle_to_hue(hue_angle_new)
+        ]
 
-        phi_differences = [phi_current_difference]
-        hue_angles = [hue_angle_current]
-        hue_angles_differences = [0]
+        x_current, y_current, _Y_current = tsplit(
+            _munsell_specification_to_xyY(
+                tstack([hue_current, value, chroma_current, code_current])))
+
+        difference = euclidean_distance(
+            tstack([x, y]), tstack([x_current, y_current]))
+        is_converged = difference < convergence_threshold
+        specification[indexes[is_converged]] = tstack(
+            [hue_current, value, chroma_current, code_current])[is_converged]
+
+        (indexes, x, y, value, rho_input, phi_input, hue_current,
+         chroma_current, code_current) = [
+             a[~is_converged]
+             for a in (indexes, x, y, value, rho_input, phi_input, hue_current,
+                       chroma_current, code_current)
+         ]
+
+        if indexes.size == 0:
+            break
+
+        chroma_maximum = np.ravel(
+            maximum_chroma_from_renotation(hue_current, value, code_current))
+        chroma_current = np.minimum(chroma_current, chroma_maximum)
+
+        x_current, y_current, _Y_current = tsplit(
+            _munsell_specification_to_xyY(
+                tstack([hue_current, value, chroma_current, code_current])))
+
+        rho_current, _phi_current = tsplit(
+            cartesian_to_polar(
+                tstack([x_current - x_center, y_current - y_center])))
+
+        # The chroma is refined by scaling the current chroma until the input
+        # *rho* is bracketed, only the closest bounds on each side of the
+        # input *rho* are retained for the linear interpolation.
+        rho_minimum = np.copy(rho_current)
+        rho_maximum = np.copy(rho_current)
+
+        is_lower = rho_current <= rho_input
+        rho_lower = np.where(is_lower, rho_current, -np.inf)
+        chroma_lower = np.where(is_lower, chroma_current, np.nan)
+        rho_upper = np.where(is_lower, np.inf, rho_current)
+        chroma_upper = np.where(is_lower, np.nan, chroma_current)
 
         iterations_maximum_inner = 16
         iterations_inner = 0
-        extrapolate = False
+        is_bracketed = np.zeros(indexes.shape, dtype=np.bool_)
 
-        while np.sign(min(phi_differences)) == np.sign(
-                max(phi_differences)) and extrapolate is False:
+        while not np.all(is_bracketed):
             iterations_inner += 1
 
             if iterations_inner > iterations_maximum_inner:
                 raise RuntimeError(('Maximum inner iterations count reached '
                                     'without convergence!'))
 
-            hue_angle_inner = ((hue_angle_current + iterations_inner *
-                                (phi_input - phi_current)) % 360)
-            hue_angle_difference_inner = (iterations_inner *
-                                          (phi_input - phi_current) % 360)
-            if hue_angle_difference_inner > 180:
-                hue_angle_difference_inner -= 360
-
-            hue_inner, code_inner = hue_angle_to_hue(hue_angle_inner)
-
-            with domain_range_scale('ignore'):
-                x_inner, y_inner, _Y_inner = np.ravel(
-                    munsell_specification_to_xyY((hue_inner, value,
-                                                  chroma_current, code_inner)))
-
-            if len(phi_differences) >= 2:
-                extrapolate = True
-
-            if extrapolate is False:
-                rho_inner, phi_inner, _z_inner = cartesian_to_cylindrical(
-                    (x_inner - x_center, y_inner - y_center, Y_center))
-                phi_inner = np.degrees(phi_inner)
-                phi_inner_difference = ((360 - phi_input + phi_inner) % 360)
-                if phi_inner_difference > 180:
-                    phi_inner_difference -= 360
-
-                phi_differences.append(phi_inner_difference)
-                hue_angles.append(hue_angle_inner)
-                hue_angles_differences.append(hue_angle_difference_inner)
+            i = ~is_bracketed
 
-        phi_differences = np.array(phi_differences)
-        hue_angles_differences = np.array(hue_angles_differences)
+            chroma_inner = ((rho_input[i] / rho_current[i]) **
+                            iterations_inner) * (chroma_current[i])
+            chroma_inner = np.minimum(chroma_inner, chroma_maximum[i])
 
-        phi_differences_indexes = phi_differences.argsort()
+            x_inner, y_inner, _Y_inner = tsplit(
+                _munsell_specification_to_xyY(
+                    tstack([
+                        hue_current[i], value[i], chroma_inner, code_current[i]
+                    ])))
 
-        phi_differences = phi_differences[phi_differences_indexes]
-        hue_angles_differences = hue_angles_differences[
-            phi_differences_indexes]
+            rho_inner, _phi_inner = tsplit(
+                cartesian_to_polar(
+                    tstack([x_inner - x_center, y_inner - y_center])))
 
-        hue_angle_difference_new = Extrapolator(
-            LinearInterpolator(phi_differences,
-                               hue_angles_differences))(0) % 360
-        hue_angle_new = (hue_angle_current + hue_angle_difference_new) % 360
+            rho_minimum[i] = np.minimum(rho_minimum[i], rho_inner)
+            rho_maximum[i] = np.maximum(rho_maximum[i], rho_inner)
 
-        hue_new, code_new = hue_angle_to_hue(hue_angle_new)
-        specification_current = [hue_new, value, chroma_current, code_new]
+            is_lower = np.logical_and(rho_inner <= rho_input[i],
+                                      rho_inner > rho_lower[i])
+            rho_lower[i] = np.where(is_lower, rho_inner, rho_lower[i])
+            chroma_lower[i] = np.where(is_lower, chroma_inner, chroma_lower[i])
 
-        with domain_range_scale('ignore'):
-            x_current, y_current, _Y_current = np.ravel(
-                munsell_specification_to_xyY(specification_current))
+            is_upper = np.logical_and(rho_inner > rho_input[i],
+                                      rho_inner < rho_upper[i])
+            rho_upper[i] = np.where(is_upper, rho_inner, rho_upper[i])
+            chroma_upper[i] = np.where(is_upper, chroma_inner, chroma_upper[i])
 
-        chroma_scale = 50 if get_domain_range_scale() == '1' else 2
+            is_bracketed = np.logical_and(rho_minimum < rho_input,
+                                          rho_input < rho_maximum)
 
-        difference = euclidean_distance((x, y), (x_current, y_current))
-        if difference < convergence_threshold:
-            return from_range_10(
-                np.array(specification_current),
-                np.array([10, 10, chroma_scale, 10]))
+        chroma_current = _linear_interpolation_on_segment(
+            rho_lower, rho_upper, chroma_lower, chroma_upper, rho_input)
 
-        # TODO: Consider refactoring implementation.
-        hue_current, _value_current, chroma_current, code_current = (
-            specification_current)
-        chroma_maximum = maximum_chroma_from_renotation(
-            hue_current, value, code_current)
-        if chroma_current > chroma_maximum:
-            chroma_current = specification_current[2] = chroma_maximum
+        x_current, y_current, _Y_current = tsplit(
+            _munsell_specification_to_xyY(
+                tstack([hue_current, value, chroma_current, code_current])))
 
-        with domain_range_scale('ignore'):
-            x_current, y_current, _Y_current = np.ravel(
-                munsell_specification_to_xyY(specification_current))
+        difference = euclidean_distance(
+            tstack([x, y]), tstack([x_current, y_current]))
+        is_converged = difference < convergence_threshold
+        specification[indexes[is_converged]] = tstack(
+            [hue_current, value, chroma_current, code_current])[is_converged]
 
-        rho_current, phi_current, _z_current = cartesian_to_cylindrical(
-            (x_current - x_center, y_current - y_center, Y_center))
+        (indexes, x, y, value, rho_input, phi_input, hue_current,
+         chroma_current, code_current) = [
+             a[~is_converged]
+             for a in (indexes, x, y, value, rho_input, phi_input, hue_current,
+                       chroma_current, code_current)
+         ]
 
-        rho_bounds = [rho_current]
-        chroma_bounds = [chroma_current]
+    return specification
 
-        iterations_maximum_inner = 16
-        iterations_inner = 0
-        while not (min(rho_bounds) < rho_input < max(rho_bounds)):
-            iterations_inner += 1
 
-            if iterations_inner > iterations_maximum_inner:
-                raise RuntimeError(('Maximum inner iterations count reached '
-                                    'without convergence!'))
-
-            chroma_inner = (((
-                rho_input / rho_current) ** iterations_inner) * chroma_current)
-            if chroma_inner > chroma_maximum:
-                chroma_inner = specification_current[2] = chroma_maximum
+def _munsell_specification_from_inversion_table(xy, value):
+    """
+    Estimates the *Munsell* *Colorlab* specification of given *CIE xy*
+    chromaticity coordinates and *Munsell* value by trilinear interpolation of
+    the *Munsell Renotation System* inversion table.
 
-            specification_inner = (hue_current, value, chroma_inner,
-                                   code_current)
+    Parameters
+    ----------
+    xy : array_like, (N, 2)
+        *CIE xy* chromaticity coordinates of chromatic colours.
+    value : array_like, (N, )
+        *Munsell* value in reference scale.
 
-            with domain_range_scale('ignore'):
-                x_inner, y_inner, _Y_inner = np.ravel(
-                    munsell_specification_to_xyY(specification_inner))
+    Returns
+    -------
+    ndarray, (N, 4)
+        Estimated *Munsell* *Colorlab* specification, the specification is
+        filled with *nan* where the inversion table does not cover the given
+        *CIE xy* chromaticity coordinates and *Munsell* value.
 
-            rho_inner, phi_inner, _z_inner = cartesian_to_cylindrical(
-                (x_inner - x_center, y_inner - y_center, Y_center))
+    Examples
+    --------
+    >>> xy = np.array([[0.38736945, 0.35751656]])
+    >>> _munsell_specification_from_inversion_table(xy, np.array([8.1]))
+    ... # doctest: +ELLIPSIS
+    array([[ 4.1572375...,  8.1       ,  5.2953700...,  6.        ]])
+    """
 
-            rho_bounds.append(rho_inner)
-            chroma_bounds.append(chroma_inner)
+    values, phi_axis, rho_axis, table = _munsell_inversion_table()
 
-        rho_bounds = np.array(rho_bounds)
-        chroma_bounds = np.array(chroma_bounds)
+    x, y = [np.ravel(a) for a in tsplit(xy)]
+    value = np.ravel(value)
 
-        rhos_bounds_indexes = rho_bounds.argsort()
+    x_center, y_center = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+    rho, phi = tsplit(cartesian_to_polar(tstack([x - x_center, y - y_center])))
+    phi = np.degrees(phi) % 360
 
-        rho_bounds = rho_bounds[rhos_bounds_indexes]
-        chroma_bounds = chroma_bounds[rhos_bounds_indexes]
-        chroma_new = LinearInterpolator(rho_bounds, chroma_bounds)(rho_input)
+    coordinates = []
+    for axis, a in ((values, value), (phi_axis, phi), (rho_axis,
+                                                       np.sqrt(rho))):
+        index = (a - axis[0]) / (axis[1] - axis[0])
+        index = np.where(
+            np.logical_and(index >= 0, index <= axis.size - 1), index, np.nan)
+        index_floor = np.clip(
+            np.floor(np.nan_to_num(index)), 0,
+            axis.size - 2).astype(DEFAULT_INT_DTYPE)
+        coordinates.append((index_floor, index - index_floor))
 
-        specification_current = [hue_current, value, chroma_new, code_current]
+    (v_i, v_t), (p_i, p_t), (r_i, r_t) = coordinates
+    a_b = np.zeros((x.size, 2))
+    for v_o in (0, 1):
+        for p_o in (0, 1):
+            for r_o in (0, 1):
+                weight = ((v_t if v_o else 1 - v_t) * (p_t if p_o else 1 - p_t)
+                          * (r_t if r_o else 1 - r_t))
+                a_b += (weight[..., np.newaxis] *
+                        table[v_i + v_o, p_i + p_o, r_i + r_o])
 
-        with domain_range_scale('ignore'):
-            x_current, y_current, _Y_current = np.ravel(
-                munsell_specification_to_xyY(specification_current))
+    a, b = tsplit(a_b)
+    chroma = np.hypot(a, b)
+    ASTM_hue = np.degrees(np.arctan2(b, a)) % 360 / 3.6
+    hue, code = _ASTM_hue_to_hue(ASTM_hue)
 
-        difference = euclidean_distance((x, y), (x_current, y_current))
-        if difference < convergence_threshold:
-            return from_range_10(
-                np.array(specification_current),
-                np.array([10, 10, chroma_scale, 10]))
+    specification = tstack([hue, value, chroma, code])
+    specification[np.isnan(chroma)] = np.nan
 
-    raise RuntimeError(
-        'Maximum outside iterations count reached without convergence!')
+    return specification
 
 
 def xyY_to_munsell_colour(xyY,
                           hue_decimals=1,
                           value_decimals=1,
-                          chroma_decimals=1):
+                          chroma_decimals=1,
+                          use_inversion_table=False):
     """
     Converts from *CIE xyY* colourspace to *Munsell* colour.
 
     Parameters
     ----------
-    xyY : array_like, (3,)
+    xyY : array_like, (..., 3)
         *CIE xyY* colourspace array.
     hue_decimals : int
         Hue formatting decimals.
@@ -1137,10 +1528,15 @@ def xyY_to_munsell_colour(xyY,
         Value formatting decimals.
     chroma_decimals : int
         Chroma formatting decimals.
+    use_inversion_table : bool, optional
+        Whether to use the *Munsell Renotation System* inversion table to
+        estimate the *Munsell* *Colorlab* specification, the estimate is then
+        refined with a single iteration instead of iterating until
+        convergence.
 
     Returns
     -------
-    unicode
+    unicode or ndarray
         *Munsell* colour.
 
     Notes
@@ -1152,6 +1548,16 @@ def xyY_to_munsell_colour(xyY,
     | ``xyY``    | [0, 1]                | [0, 1]        |
     +------------+-----------------------+---------------+
 
+    -   The *Munsell Renotation System* inversion table is built on first use
+        which takes a few seconds. If the
+        *COLOUR_SCIENCE_MUNSELL_INVERSION_TABLE* environment variable defines
+        a path, the inversion table is saved to it and subsequently loaded
+        from it.
+    -   The *Munsell* colours computed with the *Munsell Renotation System*
+        inversion table are typically within 0.05 of the *Munsell* hue and
+        chroma of the *Munsell* colours converged with the iterative
+        algorithm.
+
     References
     ----------
     :cite:`Centorea`, :cite:`Centore2012a`
@@ -1162,11 +1568,28 @@ def xyY_to_munsell_colour(xyY,
     >>> # Doctests skip for Python 2.x compatibility.
     >>> xyY_to_munsell_colour(xyY)  # doctest: +SKIP
     '4.2YR 8.1/5.3'
+    >>> xyY_to_munsell_colour(xyY, use_inversion_table=True)
+    ... # doctest: +SKIP
+    '4.2YR 8.1/5.3'
     """
 
-    specification = xyY_to_munsell_specification(xyY)
-    return munsell_specification_to_munsell_colour(
-        specification, hue_decimals, value_decimals, chroma_decimals)
+    xyY = as_float_array(xyY)
+
+    specification = _xyY_to_munsell_specification(xyY, use_inversion_table)
+
+    if xyY.ndim == 1:
+        return munsell_specification_to_munsell_colour(
+            specification, hue_decimals, value_decimals, chroma_decimals)
+
+    specification = np.reshape(specification, (-1, 4))
+    munsell_colours = [
+        munsell_specification_to_munsell_colour(s[1] if np.isnan(s[0]) else s,
+                                                hue_decimals, value_decimals,
+                                                chroma_decimals)
+        for s in specification
+    ]
+
+    return np.reshape(np.array(munsell_colours), xyY.shape[:-1])
 
 
 def parse_munsell_colour(munsell_colour):
@@ -1375,12 +1798,12 @@ def xyY_from_renotation(specification):
 
     Parameters
     ----------
-    specification : numeric or tuple
+    specification : numeric or array_like, (..., 4)
         *Munsell* *Colorlab* specification.
 
     Returns
     -------
-    ndarray
+    ndarray, (..., 3)
         *CIE xyY* colourspace vector.
 
     Raises
@@ -1389,22 +1812,50 @@ def xyY_from_renotation(specification):
         If the given specification doesn't exist in *Munsell Renotation System*
         data.
 
+    Notes
+    -----
+    -   The *Munsell Renotation System* data is indexed by hue, value and
+        chroma in a dense grid, see
+        :func:`colour.notation.munsell._munsell_renotation_grid` definition.
+
     Examples
     --------
     >>> xyY_from_renotation((2.5, 0.2, 2.0, 4))  # doctest: +ELLIPSIS
     array([ 0.71...,  1.41...,  0.23...])
+    >>> xyY_from_renotation(np.array([[2.5, 0.2, 2.0, 4], [5.0, 0.2, 2.0, 4]]))
+    ... # doctest: +ELLIPSIS
+    array([[ 0.71...,  1.41...,  0.23...],
+           [ 0.44...,  1.14...,  0.23...]])
     """
 
-    specification = normalize_munsell_specification(specification)
+    specification = _munsell_specification_array(specification)
 
-    specifications = _munsell_specifications()
-    try:
-        return MUNSELL_COLOURS_ALL[specifications.index(specification)][1]
-    except ValueError:
-        # TODO: Should raise KeyError, need to check the tests.
-        raise ValueError(
-            ('"{0}" specification does not exists in '
-             '"Munsell Renotation System" data!').format(specification))
+    # Grey specifications are not in *Munsell Renotation System* data, their
+    # *nan* components are replaced with an invalid hue to avoid warnings.
+    hue, value, chroma, code = tsplit(
+        np.where(np.isnan(specification), -1, specification))
+
+    values, xyY, _maximum_chromas = _munsell_renotation_grid()
+
+    hue_indexes = np.clip(_munsell_renotation_hue_index(hue, code), 0, 39)
+    value_indexes = np.clip(np.searchsorted(values, value), 0, values.size - 1)
+    chroma_indexes = np.clip(as_int_array(np.around(chroma / 2)), 0, 25)
+
+    is_in_renotation = np.logical_and.reduce([
+        hue % 2.5 == 0, hue >= 0, hue <= 10, values[value_indexes] == value,
+        chroma_indexes * 2 == chroma
+    ])
+
+    xyY = np.where(is_in_renotation[..., np.newaxis],
+                   xyY[hue_indexes, value_indexes, chroma_indexes], np.nan)
+
+    is_missing = np.isnan(xyY[..., 0])
+    if np.any(is_missing):
+        raise ValueError(('"{0}" specification does not exists in '
+                          '"Munsell Renotation System" data!').format(
+                              specification[is_missing][0]))
+
+    return xyY
 
 
 def is_specification_in_renotation(specification):
@@ -1444,9 +1895,9 @@ def bounding_hues_from_renotation(hue, code):
 
     Parameters
     ----------
-    hue : numeric
+    hue : numeric or array_like
         *Munsell* *Colorlab* specification hue.
-    code : numeric
+    code : numeric or array_like
         *Munsell* *Colorlab* specification code.
 
     Returns
@@ -1464,31 +1915,25 @@ def bounding_hues_from_renotation(hue, code):
     ((2.5, 4), (5.0, 4))
     """
 
-    if hue % 2.5 == 0:
-        if hue == 0:
-            hue_cw = 10
-            code_cw = (code + 1) % 10
-        else:
-            hue_cw = hue
-            code_cw = code
-        hue_ccw = hue_cw
-        code_ccw = code_cw
-    else:
-        hue_cw = 2.5 * np.floor(hue / 2.5)
-        hue_ccw = (hue_cw + 2.5) % 10
-        if hue_ccw == 0:
-            hue_ccw = 10
-
-        if hue_cw == 0:
-            hue_cw = 10
-            code_cw = (code + 1) % 10
-            if code_cw == 0:
-                code_cw = 10
-        else:
-            code_cw = code
-        code_ccw = code
+    hue = as_float_array(hue)
+    code = as_float_array(code)
+
+    is_standard_hue = hue % 2.5 == 0
+
+    hue_cw = np.where(is_standard_hue, hue, 2.5 * np.floor(hue / 2.5))
+    hue_ccw = np.where(is_standard_hue, hue, (hue_cw + 2.5) % 10)
+    hue_ccw = np.where(hue_ccw == 0, 10, hue_ccw)
 
-    return (hue_cw, code_cw), (hue_ccw, code_ccw)
+    code_cw = np.where(hue_cw == 0, (code + 1) % 10, code)
+    code_cw = np.where(
+        np.logical_and(~is_standard_hue, code_cw == 0), 10, code_cw)
+    hue_cw = np.where(hue_cw == 0, 10, hue_cw)
+
+    hue_ccw = np.where(is_standard_hue, hue_cw, hue_ccw)
+    code_ccw = np.where(is_standard_hue, code_cw, code)
+
+    return ((as_float(hue_cw), as_int(code_cw)), (as_float(hue_ccw),
+                                                  as_int(code_ccw)))
 
 
 def hue_to_hue_angle(hue, code):
@@ -1498,14 +1943,14 @@ def hue_to_hue_angle(hue, code):
 
     Parameters
     ----------
-    hue : numeric
+    hue : numeric or array_like
         *Munsell* *Colorlab* specification hue.
-    code : numeric
+    code : numeric or array_like
         *Munsell* *Colorlab* specification code.
 
     Returns
     -------
-    numeric
+    numeric or ndarray
         Hue angle in degrees.
 
     References
@@ -1531,7 +1976,7 @@ def hue_angle_to_hue(hue_angle):
 
     Parameters
     ----------
-    hue_angle : numeric
+    hue_angle : numeric or array_like
         Hue angle in degrees.
 
     Returns
@@ -1553,33 +1998,14 @@ def hue_angle_to_hue(hue_angle):
     single_hue = LinearInterpolator((0, 45, 70, 135, 160, 225, 255, 315, 360),
                                     (0, 2, 3, 4, 5, 6, 8, 9, 10))(hue_angle)
 
-    if single_hue <= 0.5:
-        code = 7
-    elif single_hue <= 1.5:
-        code = 6
-    elif single_hue <= 2.5:
-        code = 5
-    elif single_hue <= 3.5:
-        code = 4
-    elif single_hue <= 4.5:
-        code = 3
-    elif single_hue <= 5.5:
-        code = 2
-    elif single_hue <= 6.5:
-        code = 1
-    elif single_hue <= 7.5:
-        code = 10
-    elif single_hue <= 8.5:
-        code = 9
-    elif single_hue <= 9.5:
-        code = 8
-    else:
-        code = 7
+    # Codes for "single_hue" in [0, 0.5], ]0.5, 1.5], ..., ]9.5, 10].
+    code = np.array([7, 6, 5, 4, 3, 2, 1, 10, 9, 8, 7])[np.searchsorted(
+        np.arange(0.5, 10, 1), single_hue)]
 
     hue = (10 * (single_hue % 1) + 5) % 10
-    if hue == 0:
-        hue = 10
-    return hue, code
+    hue = np.where(hue == 0, 10, hue)
+
+    return as_float(hue), as_int(code)
 
 
 def hue_to_ASTM_hue(hue, code):
@@ -1589,14 +2015,14 @@ def hue_to_ASTM_hue(hue, code):
 
     Parameters
     ----------
-    hue : numeric
+    hue : numeric or array_like
         *Munsell* *Colorlab* specification hue.
-    code : numeric
+    code : numeric or array_like
         *Munsell* *Colorlab* specification code.
 
     Returns
     -------
-    numeric
+    numeric or ndarray
         *ASTM* hue number.
 
     References
@@ -1609,9 +2035,9 @@ def hue_to_ASTM_hue(hue, code):
     33.2...
     """
 
-    ASTM_hue = 10 * ((7 - code) % 10) + hue
+    ASTM_hue = 10 * ((7 - as_float_array(code)) % 10) + hue
 
-    return 100 if ASTM_hue == 0 else ASTM_hue
+    return as_float(np.where(ASTM_hue == 0, 100, ASTM_hue))
 
 
 def interpolation_method_from_renotation_ovoid(specification):
@@ -1661,10 +2087,6 @@ def interpolation_method_from_renotation_ovoid(specification):
 
         value = round(value)
 
-        # Ideal white, no interpolation needed.
-        if value == 10:
-            interpolation_method = 0
-
         assert 2 <= chroma <= 50, (
             '"{0}" specification chroma must be normalised to domain '
             '[2, 50]!'.format(specification))
@@ -1675,218 +2097,9 @@ def interpolation_method_from_renotation_ovoid(specification):
 
         chroma = 2 * round(chroma / 2)
 
-        # Standard Munsell Renotation System hue, no interpolation needed.
-        if hue % 2.5 == 0:
-            interpolation_method = 0
-
-        ASTM_hue = hue_to_ASTM_hue(hue, code)
-
-        if value == 1:
-            if chroma == 2:
-                if 15 < ASTM_hue < 30 or 60 < ASTM_hue < 85:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 4:
-                if 12.5 < ASTM_hue < 27.5 or 57.5 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 6:
-                if 55 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 8:
-                if 67.5 < ASTM_hue < 77.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma >= 10:
-                if 72.5 < ASTM_hue < 77.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            else:
-                interpolation_method = 1
-        elif value == 2:
-            if chroma == 2:
-                if 15 < ASTM_hue < 27.5 or 77.5 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 4:
-                if 12.5 < ASTM_hue < 30 or 62.5 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 6:
-                if 7.5 < ASTM_hue < 22.5 or 62.5 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 8:
-                if 7.5 < ASTM_hue < 15 or 60 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma >= 10:
-                if 65 < ASTM_hue < 77.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            else:
-                interpolation_method = 1
-        elif value == 3:
-            if chroma == 2:
-                if 10 < ASTM_hue < 37.5 or 65 < ASTM_hue < 85:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 4:
-                if 5 < ASTM_hue < 37.5 or 55 < ASTM_hue < 72.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma in (6, 8, 10):
-                if 7.5 < ASTM_hue < 37.5 or 57.5 < ASTM_hue < 82.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma >= 12:
-                if 7.5 < ASTM_hue < 42.5 or 57.5 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            else:
-                interpolation_method = 1
-        elif value == 4:
-            if chroma in (2, 4):
-                if 7.5 < ASTM_hue < 42.5 or 57.5 < ASTM_hue < 85:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma in (6, 8):
-                if 7.5 < ASTM_hue < 40 or 57.5 < ASTM_hue < 82.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma >= 10:
-                if 7.5 < ASTM_hue < 40 or 57.5 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            else:
-                interpolation_method = 1
-        elif value == 5:
-            if chroma == 2:
-                if 5 < ASTM_hue < 37.5 or 55 < ASTM_hue < 85:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma in (4, 6, 8):
-                if 2.5 < ASTM_hue < 42.5 or 55 < ASTM_hue < 85:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma >= 10:
-                if 2.5 < ASTM_hue < 42.5 or 55 < ASTM_hue < 82.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            else:
-                interpolation_method = 1
-        elif value == 6:
-            if chroma in (2, 4):
-                if 5 < ASTM_hue < 37.5 or 55 < ASTM_hue < 87.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 6:
-                if 5 < ASTM_hue < 42.5 or 57.5 < ASTM_hue < 87.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma in (8, 10):
-                if 5 < ASTM_hue < 42.5 or 60 < ASTM_hue < 85:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma in (12, 14):
-                if 5 < ASTM_hue < 42.5 or 60 < ASTM_hue < 82.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma >= 16:
-                if 5 < ASTM_hue < 42.5 or 60 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            else:
-                interpolation_method = 1
-        elif value == 7:
-            if chroma in (2, 4, 6):
-                if 5 < ASTM_hue < 42.5 or 60 < ASTM_hue < 85:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 8:
-                if 5 < ASTM_hue < 42.5 or 60 < ASTM_hue < 82.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 10:
-                if (30 < ASTM_hue < 42.5 or 5 < ASTM_hue < 25 or
-                        60 < ASTM_hue < 82.5):
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma == 12:
-                if (30 < ASTM_hue < 42.5 or 7.5 < ASTM_hue < 27.5 or
-                        80 < ASTM_hue < 82.5):
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma >= 14:
-                if (32.5 < ASTM_hue < 40 or 7.5 < ASTM_hue < 15 or
-                        80 < ASTM_hue < 82.5):
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            else:
-                interpolation_method = 1
-        elif value == 8:
-            if chroma in (2, 4, 6, 8, 10, 12):
-                if 5 < ASTM_hue < 40 or 60 < ASTM_hue < 85:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma >= 14:
-                if (32.5 < ASTM_hue < 40 or 5 < ASTM_hue < 15 or
-                        60 < ASTM_hue < 85):
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            else:
-                interpolation_method = 1
-        elif value == 9:
-            if chroma in (2, 4):
-                if 5 < ASTM_hue < 40 or 55 < ASTM_hue < 80:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma in (6, 8, 10, 12, 14):
-                if 5 < ASTM_hue < 42.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            elif chroma >= 16:
-                if 35 < ASTM_hue < 42.5:
-                    interpolation_method = 2
-                else:
-                    interpolation_method = 1
-            else:
-                interpolation_method = 1
+        interpolation_method = as_int(
+            _interpolation_method_from_renotation_ovoid(
+                np.array([hue, value, chroma, code])))
 
     return interpolation_methods.get(interpolation_method)
 
@@ -1901,12 +2114,14 @@ def xy_from_renotation_ovoid(specification):
 
     Parameters
     ----------
-    specification : numeric or tuple
-        *Munsell* *Colorlab* specification.
+    specification : numeric or array_like, (..., 4)
+        *Munsell* *Colorlab* specification, grey specifications of
+        n-dimensional arrays have a *nan* hue, chroma and code, i.e.
+        ``[nan, value, nan, nan]``.
 
     Returns
     -------
-    ndarray
+    ndarray, (..., 2)
         *xy* chromaticity coordinates.
 
     Raises
@@ -1925,101 +2140,130 @@ def xy_from_renotation_ovoid(specification):
     array([ 0.4333...,  0.5602...])
     >>> xy_from_renotation_ovoid(8)  # doctest: +ELLIPSIS
     array([ 0.31006...,  0.31616...])
+    >>> xy_from_renotation_ovoid(
+    ...     np.array([[2.5, 5.0, 12.0, 4], [np.nan, 8.0, np.nan, np.nan]]))
+    ... # doctest: +ELLIPSIS
+    array([[ 0.4333...,  0.5602...],
+           [ 0.31006...,  0.31616...]])
     """
 
-    specification = normalize_munsell_specification(specification)
+    specification = _munsell_specification_array(specification)
 
-    if is_grey_munsell_colour(specification):
-        return MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
-    else:
-        hue, value, chroma, code = specification
+    shape = specification.shape
+    specification = np.reshape(specification, (-1, 4))
 
-        assert 1 <= value <= 9, (
-            '"{0}" specification value must be normalised to domain '
-            '[1, 9]!'.format(specification))
-        assert is_integer(value), (
-            '"{0}" specification value must be an integer!'.format(
-                specification))
+    xy = np.empty((specification.shape[0], 2))
+    xy[...] = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
 
-        value = round(value)
+    is_colour = np.logical_and(~np.isnan(specification[..., 2]),
+                               specification[..., 2] != 0)
+    hue, value, chroma, code = tsplit(specification[is_colour])
 
-        assert 2 <= chroma <= 50, (
-            '"{0}" specification chroma must be normalised to domain '
-            '[2, 50]!'.format(specification))
-        assert abs(2 *
-                   (chroma / 2 - round(chroma / 2))) <= INTEGER_THRESHOLD, ((
-                       '"{0}" specification chroma must be an integer and '
-                       'multiple of 2!').format(specification))
+    assert np.all(np.logical_and(value >= 1, value <= 9)), (
+        '"{0}" specification value must be normalised to domain '
+        '[1, 9]!'.format(specification))
+    assert np.all(np.abs(value - np.around(value)) <= INTEGER_THRESHOLD), (
+        '"{0}" specification value must be an integer!'.format(specification))
 
-        chroma = 2 * round(chroma / 2)
+    value = np.around(value)
 
-        # Checking if renotation data is available without interpolation using
-        # given threshold.
-        threshold = 1e-7
-        if (abs(hue) < threshold or abs(hue - 2.5) < threshold or
-                abs(hue - 5) < threshold or abs(hue - 7.5) < threshold or
-                abs(hue - 10) < threshold):
-            hue = 2.5 * round(hue / 2.5)
-            x, y, _Y = xyY_from_renotation((hue, value, chroma, code))
-            return np.array([x, y])
-
-        hue_cw, hue_ccw = bounding_hues_from_renotation(hue, code)
-        hue_minus, code_minus = hue_cw
-        hue_plus, code_plus = hue_ccw
-
-        x_grey, y_grey = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
-
-        specification_minus = (hue_minus, value, chroma, code_minus)
-        x_minus, y_minus, Y_minus = xyY_from_renotation(specification_minus)
-        rho_minus, phi_minus, _z_minus = cartesian_to_cylindrical(
-            (x_minus - x_grey, y_minus - y_grey, Y_minus))
-        phi_minus = np.degrees(phi_minus)
-
-        specification_plus = (hue_plus, value, chroma, code_plus)
-        x_plus, y_plus, Y_plus = xyY_from_renotation(specification_plus)
-        rho_plus, phi_plus, _z_plus = cartesian_to_cylindrical(
-            (x_plus - x_grey, y_plus - y_grey, Y_plus))
-        phi_plus = np.degrees(phi_plus)
-
-        lower_hue_angle = hue_to_hue_angle(hue_minus, code_minus)
-        hue_angle = hue_to_hue_angle(hue, code)
-        upper_hue_angle = hue_to_hue_angle(hue_plus, code_plus)
-
-        if phi_minus - phi_plus > 180:
-            phi_plus += 360
-
-        if lower_hue_angle == 0:
-            lower_hue_angle = 360
-
-        if lower_hue_angle > upper_hue_angle:
-            if lower_hue_angle > hue_angle:
-                lower_hue_angle -= 360
-            else:
-                lower_hue_angle -= 360
-                hue_angle -= 360
-
-        interpolation_method = interpolation_method_from_renotation_ovoid(
-            specification).lower()
-
-        if interpolation_method == 'linear':
-            x = LinearInterpolator((lower_hue_angle, upper_hue_angle),
-                                   (x_minus, x_plus))(hue_angle)
-            y = LinearInterpolator((lower_hue_angle, upper_hue_angle),
-                                   (y_minus, y_plus))(hue_angle)
-        elif interpolation_method == 'radial':
-            theta = LinearInterpolator((lower_hue_angle, upper_hue_angle),
-                                       (phi_minus, phi_plus))(hue_angle)
-            rho = LinearInterpolator((lower_hue_angle, upper_hue_angle),
-                                     (rho_minus, rho_plus))(hue_angle)
-
-            x, y = tsplit(
-                polar_to_cartesian((rho, np.radians(theta))) + as_float_array(
-                    (x_grey, y_grey)))
-        else:
-            raise ValueError('Invalid interpolation method: "{0}"'.format(
-                interpolation_method))
+    assert np.all(np.logical_and(chroma >= 2, chroma <= 50)), (
+        '"{0}" specification chroma must be normalised to domain '
+        '[2, 50]!'.format(specification))
+    assert np.all(
+        np.abs(2 *
+               (chroma / 2 - np.around(chroma / 2))) <= INTEGER_THRESHOLD), (
+                   '"{0}" specification chroma must be an integer and '
+                   'multiple of 2!'.format(specification))
+
+    chroma = 2 * np.around(chroma / 2)
+
+    xy_colour = np.empty((hue.size, 2))
+
+    # Checking if renotation data is available without interpolation using
+    # given threshold.
+    threshold = 1e-7
+    is_standard_hue = np.abs(hue - 2.5 * np.around(hue / 2.5)) < threshold
+
+    xy_colour[is_standard_hue] = xyY_from_renotation(
+        tstack([
+            2.5 * np.around(hue[is_standard_hue] / 2.5),
+            value[is_standard_hue], chroma[is_standard_hue],
+            code[is_standard_hue]
+        ]))[..., 0:2]
+
+    hue, value, chroma, code = [
+        a[~is_standard_hue] for a in (hue, value, chroma, code)
+    ]
+
+    hue_cw, hue_ccw = bounding_hues_from_renotation(hue, code)
+    hue_minus, code_minus, hue_plus, code_plus = [
+        np.ravel(a) for a in hue_cw + hue_ccw
+    ]
 
-        return np.array([x, y])
+    x_grey, y_grey = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+
+    # The bounding hues, and then the hue angles, are processed at once to
+    # reduce the per-call overhead for small arrays.
+    count = hue.size
+    xy_bounds = xyY_from_renotation(
+        tstack([
+            np.concatenate([hue_minus, hue_plus]),
+            np.tile(value, 2),
+            np.tile(chroma, 2),
+            np.concatenate([code_minus, code_plus])
+        ]))[..., 0:2]
+    rho_bounds, phi_bounds = tsplit(
+        cartesian_to_polar(xy_bounds - as_float_array((x_grey, y_grey))))
+    phi_bounds = np.degrees(phi_bounds)
+
+    x_minus, x_plus = xy_bounds[:count, 0], xy_bounds[count:, 0]
+    y_minus, y_plus = xy_bounds[:count, 1], xy_bounds[count:, 1]
+    rho_minus, rho_plus = rho_bounds[:count], rho_bounds[count:]
+    phi_minus, phi_plus = phi_bounds[:count], phi_bounds[count:]
+
+    lower_hue_angle, hue_angle, upper_hue_angle = np.split(
+        np.ravel(
+            hue_to_hue_angle(
+                np.concatenate([hue_minus, hue, hue_plus]),
+                np.concatenate([code_minus, code, code_plus]))), 3)
+
+    phi_plus = np.where(phi_minus - phi_plus > 180, phi_plus + 360, phi_plus)
+
+    lower_hue_angle = np.where(lower_hue_angle == 0, 360, lower_hue_angle)
+
+    is_wrapping = lower_hue_angle > upper_hue_angle
+    hue_angle = np.where(
+        np.logical_and(is_wrapping, lower_hue_angle <= hue_angle),
+        hue_angle - 360, hue_angle)
+    lower_hue_angle = np.where(is_wrapping, lower_hue_angle - 360,
+                               lower_hue_angle)
+
+    interpolation_method = _interpolation_method_from_renotation_ovoid(
+        tstack([hue, value, chroma, code]))
+
+    if np.any(interpolation_method == 0):
+        raise ValueError('Invalid interpolation method: "{0}"'.format(None))
+
+    x_linear, y_linear, theta, rho = tsplit(
+        _linear_interpolation_on_segment(
+            lower_hue_angle[..., np.newaxis], upper_hue_angle[..., np.newaxis],
+            tstack([x_minus, y_minus, phi_minus, rho_minus]),
+            tstack([x_plus, y_plus, phi_plus, rho_plus]),
+            hue_angle[..., np.newaxis]))
+    x_radial, y_radial = tsplit(
+        polar_to_cartesian(tstack([rho, np.radians(theta)])) +
+        as_float_array((x_grey, y_grey)))
+
+    is_linear = interpolation_method == 1
+    xy_colour[~is_standard_hue] = tstack([
+        np.where(is_linear, x_linear, x_radial),
+        np.where(is_linear, y_linear, y_radial)
+    ])
+
+    xy[is_colour] = xy_colour
+
+    return np.reshape(xy, shape[:-1] + (2, ))
 
 
 def LCHab_to_munsell_specification(LCHab):
@@ -2029,7 +2273,7 @@ def LCHab_to_munsell_specification(LCHab):
 
     Parameters
     ----------
-    LCHab : array_like, (3,)
+    LCHab : array_like, (..., 3)
         *CIE L\\*C\\*Hab* colourspace array.
 
     Returns
@@ -2048,39 +2292,20 @@ def LCHab_to_munsell_specification(LCHab):
     (8.0362412..., 10.0, 3.5013295..., 1)
     """
 
-    L, C, Hab = np.ravel(LCHab)
-
-    if Hab == 0:
-        code = 8
-    elif Hab <= 36:
-        code = 7
-    elif Hab <= 72:
-        code = 6
-    elif Hab <= 108:
-        code = 5
-    elif Hab <= 144:
-        code = 4
-    elif Hab <= 180:
-        code = 3
-    elif Hab <= 216:
-        code = 2
-    elif Hab <= 252:
-        code = 1
-    elif Hab <= 288:
-        code = 10
-    elif Hab <= 324:
-        code = 9
-    else:
-        code = 8
+    L, C, Hab = tsplit(LCHab)
+
+    # Codes for "Hab" in ]-inf, 36], ]36, 72], ..., ]324, inf[.
+    code = np.array([7, 6, 5, 4, 3, 2, 1, 10, 9, 8])[np.searchsorted(
+        np.arange(36, 360, 36), Hab)]
+    code = np.where(Hab == 0, 8, code)
 
     hue = LinearInterpolator((0, 36), (0, 10))(Hab % 36)
-    if hue == 0:
-        hue = 10
+    hue = np.where(hue == 0, 10, hue)
 
     value = L / 10
     chroma = C / 5
 
-    return hue, value, chroma, code
+    return as_float(hue), as_float(value), as_float(chroma), as_int(code)
 
 
 def maximum_chroma_from_renotation(hue, value, code):
@@ -2091,16 +2316,16 @@ def maximum_chroma_from_renotation(hue, value, code):
 
     Parameters
     ----------
-    hue : numeric
+    hue : numeric or array_like
         *Munsell* *Colorlab* specification hue.
-    value : numeric
+    value : numeric or array_like
         *Munsell* value code.
-    code : numeric
+    code : numeric or array_like
         *Munsell* *Colorlab* specification code.
 
     Returns
     -------
-    numeric
+    numeric or ndarray
         Maximum chroma.
 
     References
@@ -2113,48 +2338,54 @@ def maximum_chroma_from_renotation(hue, value, code):
     14.0
     """
 
+    hue = as_float_array(hue)
+    value = as_float_array(value)
+    code = as_float_array(code)
+
     # Ideal white, no chroma.
-    if value >= 9.99:
-        return 0
+    is_white = value >= 9.99
 
-    assert 1 <= value <= 10, (
+    assert np.all(np.logical_or(is_white, value >= 1)), (
         '"{0}" value must be normalised to domain [1, 10]!'.format(value))
 
-    if value % 1 == 0:
-        value_minus = value
-        value_plus = value
-    else:
-        value_minus = np.floor(value)
-        value_plus = value_minus + 1
+    is_integer_value = value % 1 == 0
+    value_minus = np.where(is_integer_value, value, np.floor(value))
+    value_plus = np.where(is_integer_value, value, value_minus + 1)
 
     hue_cw, hue_ccw = bounding_hues_from_renotation(hue, code)
     hue_cw, code_cw = hue_cw
     hue_ccw, code_ccw = hue_ccw
 
-    maximum_chromas = _munsell_maximum_chromas_from_renotation()
-    specification_for_indexes = [chroma[0] for chroma in maximum_chromas]
-
-    ma_limit_mcw = maximum_chromas[specification_for_indexes.index(
-        (hue_cw, value_minus, code_cw))][1]
-    ma_limit_mccw = maximum_chromas[specification_for_indexes.index(
-        (hue_ccw, value_minus, code_ccw))][1]
-
-    if value_plus <= 9:
-        ma_limit_pcw = maximum_chromas[specification_for_indexes.index(
-            (hue_cw, value_plus, code_cw))][1]
-        ma_limit_pccw = maximum_chromas[specification_for_indexes.index(
-            (hue_ccw, value_plus, code_ccw))][1]
-        max_chroma = min(ma_limit_mcw, ma_limit_mccw, ma_limit_pcw,
-                         ma_limit_pccw)
-    else:
+    values, _xyY, maximum_chromas = _munsell_renotation_grid()
+
+    hue_cw_indexes = _munsell_renotation_hue_index(hue_cw, code_cw)
+    hue_ccw_indexes = _munsell_renotation_hue_index(hue_ccw, code_ccw)
+    value_minus_indexes = np.clip(
+        np.searchsorted(values, value_minus), 0, values.size - 1)
+    value_plus_indexes = np.clip(
+        np.searchsorted(values, value_plus), 0, values.size - 1)
+
+    ma_limit_mcw = maximum_chromas[hue_cw_indexes, value_minus_indexes]
+    ma_limit_mccw = maximum_chromas[hue_ccw_indexes, value_minus_indexes]
+    ma_limit_pcw = maximum_chromas[hue_cw_indexes, value_plus_indexes]
+    ma_limit_pccw = maximum_chromas[hue_ccw_indexes, value_plus_indexes]
+
+    with domain_range_scale('ignore'):
         L = luminance_ASTMD153508(value)
         L9 = luminance_ASTMD153508(9)
         L10 = luminance_ASTMD153508(10)
 
-        max_chroma = min(
-            LinearInterpolator((L9, L10), (ma_limit_mcw, 0))(L),
-            LinearInterpolator((L9, L10), (ma_limit_mccw, 0))(L))
-    return max_chroma
+    max_chroma = np.where(
+        value_plus <= 9,
+        np.minimum(
+            np.minimum(ma_limit_mcw, ma_limit_mccw),
+            np.minimum(ma_limit_pcw, ma_limit_pccw)),
+        np.minimum(
+            _linear_interpolation_on_segment(L9, L10, ma_limit_mcw, 0, L),
+            _linear_interpolation_on_segment(L9, L10, ma_limit_mccw, 0, L)))
+    max_chroma = np.where(is_white, 0, max_chroma)
+
+    return as_float(max_chroma)
 
 
 def munsell_specification_to_xy(specification):
@@ -2164,12 +2395,14 @@ def munsell_specification_to_xy(specification):
 
     Parameters
     ----------
-    specification : numeric or tuple
-        *Munsell* *Colorlab* specification.
+    specification : numeric or array_like, (..., 4)
+        *Munsell* *Colorlab* specification with integer value, grey
+        specifications of n-dimensional arrays have a *nan* hue, chroma and
+        code, i.e. ``[nan, value, nan, nan]``.
 
     Returns
     -------
-    ndarray
+    ndarray, (..., 2)
         *xy* chromaticity coordinates.
 
     References
@@ -2183,47 +2416,324 @@ def munsell_specification_to_xy(specification):
     array([ 0.4400632...,  0.5522428...])
     >>> munsell_specification_to_xy(8)  # doctest: +ELLIPSIS
     array([ 0.31006...,  0.31616...])
+    >>> munsell_specification_to_xy(
+    ...     np.array([[2.1, 8.0, 17.9, 4], [np.nan, 8.0, np.nan, np.nan]]))
+    ... # doctest: +ELLIPSIS
+    array([[ 0.4400632...,  0.5522428...],
+           [ 0.31006...,  0.31616...]])
+    """
+
+    specification = _munsell_specification_array(specification)
+
+    shape = specification.shape
+    specification = np.reshape(specification, (-1, 4))
+
+    xy = np.empty((specification.shape[0], 2))
+    xy[...] = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+
+    is_colour = ~np.isnan(specification[..., 2])
+    hue, value, chroma, code = tsplit(specification[is_colour])
+
+    assert np.all(np.logical_and(value >= 0, value <= 10)), (
+        '"{0}" specification value must be normalised to domain '
+        '[0, 10]!'.format(specification))
+    assert np.all(np.abs(value - np.around(value)) <= INTEGER_THRESHOLD), (
+        '"{0}" specification value must be an integer!'.format(specification))
+
+    value = np.around(value)
+
+    is_even_chroma = chroma % 2 == 0
+    chroma_minus = np.where(is_even_chroma, chroma, 2 * np.floor(chroma / 2))
+    chroma_plus = np.where(is_even_chroma, chroma, chroma_minus + 2)
+
+    # Smallest chroma ovoid collapses to illuminant chromaticity coordinates,
+    # which is handled by a zero chroma. Both bounding chromas are processed
+    # at once.
+    count = hue.size
+    xy_bounds = xy_from_renotation_ovoid(
+        tstack([
+            np.tile(hue, 2),
+            np.tile(value, 2),
+            np.concatenate([chroma_minus, chroma_plus]),
+            np.tile(code, 2)
+        ]))
+    xy_minus, xy_plus = xy_bounds[:count], xy_bounds[count:]
+
+    is_interpolated = chroma_minus != chroma_plus
+    xy[is_colour] = np.where(
+        is_interpolated[..., np.newaxis],
+        _linear_interpolation_on_segment(
+            chroma_minus[..., np.newaxis], chroma_plus[..., np.newaxis],
+            xy_minus, xy_plus, chroma[..., np.newaxis]), xy_minus)
+
+    return np.reshape(xy, shape[:-1] + (2, ))
+
+
+def _munsell_specification_array(specification):
+    """
+    Converts given *Munsell* *Colorlab* specification to an array of shape
+    (..., 4), the single number form used for grey colours being converted to
+    a specification with a *nan* hue, chroma and code.
+
+    Parameters
+    ----------
+    specification : numeric or array_like, (..., 4)
+        *Munsell* *Colorlab* specification.
+
+    Returns
+    -------
+    ndarray, (..., 4)
+        *Munsell* *Colorlab* specification array.
+
+    Examples
+    --------
+    >>> _munsell_specification_array(8.9)
+    array([ nan,  8.9,  nan,  nan])
+    >>> _munsell_specification_array((2.1, 8.0, 17.9, 4))
+    array([  2.1,   8. ,  17.9,   4. ])
     """
 
     if is_grey_munsell_colour(specification):
-        return MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
-    else:
-        hue, value, chroma, code = specification
+        return np.array([np.nan, specification, np.nan, np.nan],
+                        DEFAULT_FLOAT_DTYPE)
 
-        assert 0 <= value <= 10, (
-            '"{0}" specification value must be normalised to domain '
-            '[0, 10]!'.format(specification))
-        assert is_integer(value), (
-            '"{0}" specification value must be an integer!'.format(
-                specification))
+    return as_float_array(specification)
 
-        value = round(value)
 
-        if chroma % 2 == 0:
-            chroma_minus = chroma_plus = chroma
-        else:
-            chroma_minus = 2 * np.floor(chroma / 2)
-            chroma_plus = chroma_minus + 2
-
-        if chroma_minus == 0:
-            # Smallest chroma ovoid collapses to illuminant chromaticity
-            # coordinates.
-            x_minus, y_minus = (
-                MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES)
-        else:
-            x_minus, y_minus = xy_from_renotation_ovoid((hue, value,
-                                                         chroma_minus, code))
+def _munsell_renotation_hue_index(hue, code):
+    """
+    Returns the index of given *Munsell Renotation System* standard hue in the
+    *Munsell Renotation System* grid.
 
-        x_plus, y_plus = xy_from_renotation_ovoid((hue, value, chroma_plus,
-                                                   code))
+    Parameters
+    ----------
+    hue : numeric or array_like
+        *Munsell* *Colorlab* specification hue, must be one of 0, 2.5, 5, 7.5
+        or 10.
+    code : numeric or array_like
+        *Munsell* *Colorlab* specification code.
 
-        if chroma_minus == chroma_plus:
-            x = x_minus
-            y = y_minus
-        else:
-            x = LinearInterpolator((chroma_minus, chroma_plus),
-                                   (x_minus, x_plus))(chroma)
-            y = LinearInterpolator((chroma_minus, chroma_plus),
-                                   (y_minus, y_plus))(chroma)
+    Returns
+    -------
+    numeric or ndarray
+        Hue index in domain [0, 39].
+
+    Examples
+    --------
+    >>> _munsell_renotation_hue_index(2.5, 4)
+    12
+    >>> _munsell_renotation_hue_index(0, 3)
+    15
+    """
+
+    hue = as_float_array(hue)
+    code = as_float_array(code)
+
+    # 0YR is equivalent to 10R.
+    is_zero_hue = hue == 0
+    hue = np.where(is_zero_hue, 10, hue)
+    code = np.where(is_zero_hue, code + 1, code)
+
+    return as_int(((code - 1) % 10) * 4 + np.around(hue / 2.5) - 1)
+
+
+def _ASTM_hue_to_hue(ASTM_hue):
+    """
+    Converts from the *ASTM* hue number to *Munsell* *Colorlab* specification
+    hue and code, i.e. the inverse of
+    :func:`colour.notation.munsell.hue_to_ASTM_hue` definition.
+
+    Parameters
+    ----------
+    ASTM_hue : array_like
+        *ASTM* hue number in domain [0, 100].
+
+    Returns
+    -------
+    tuple
+        *Munsell* *Colorlab* specification hue and code, the hue being in
+        domain ]0, 10].
+
+    Examples
+    --------
+    >>> _ASTM_hue_to_hue(np.array([0, 33.5, 100]))
+    (array([ 10. ,   3.5,  10. ]), array([ 8.,  4.,  8.]))
+    """
+
+    ASTM_hue = as_float_array(ASTM_hue)
+
+    ASTM_hue = np.where(ASTM_hue == 0, 100, ASTM_hue)
+    block = np.ceil(ASTM_hue / 10) - 1
+    hue = ASTM_hue - 10 * block
+    code = (7 - block) % 10
+    code = np.where(code == 0, 10, code)
+
+    return hue, code
+
+
+def _interpolation_method_from_renotation_ovoid(specification):
+    """
+    Returns whether to use linear or radial interpolation when drawing ovoids
+    through data points in the *Munsell Renotation System* data from given
+    specifications.
+
+    Parameters
+    ----------
+    specification : array_like, (..., 4)
+        *Munsell* *Colorlab* specifications with integer values and even
+        chromas, grey specifications have a *nan* chroma.
+
+    Returns
+    -------
+    ndarray
+        Interpolation methods: 0 for *None*, 1 for *Linear* and 2 for
+        *Radial*.
+
+    Notes
+    -----
+    -   The interpolation methods are looked up in the grid returned by
+        :func:`colour.notation.munsell._munsell_interpolation_methods_grid`
+        definition.
+
+    Examples
+    --------
+    >>> _interpolation_method_from_renotation_ovoid(
+    ...     np.array([[2.5, 5.0, 12.0, 4], [2.5, 9.0, 2.0, 3]]))
+    array([2, 1])
+    """
+
+    specification = as_float_array(specification)
+    hue, value, chroma, code = tsplit(
+        np.where(np.isnan(specification), 0, specification))
+
+    # Index of the "ASTM" hue on a 1.25 lattice: even indexes are multiples of
+    # 2.5 while odd indexes are strictly in-between two multiples of 2.5.
+    ASTM_hue = as_float_array(hue_to_ASTM_hue(hue, code))
+    ASTM_hue_indexes = np.where(ASTM_hue % 2.5 == 0, 2 * ASTM_hue / 2.5,
+                                2 * np.floor(ASTM_hue / 2.5) + 1)
+
+    methods = _munsell_interpolation_methods_grid(
+    )[as_int_array(np.clip(np.around(value), 0, 10)),
+      as_int_array(np.clip(np.around(chroma / 2), 0, 25)),
+      as_int_array(np.clip(ASTM_hue_indexes, 0, 80))]
+
+    return np.where(np.isnan(specification[..., 2]), 0, methods)
+
+
+def _linear_interpolation_on_segment(x_0, x_1, y_0, y_1, x):
+    """
+    Linearly interpolates, or extrapolates, element-wise the segments defined
+    by given :math:`(x_0, y_0)` and :math:`(x_1, y_1)` points at given
+    :math:`x` values.
+
+    This definition is the element-wise equivalent of a
+    :class:`colour.Extrapolator` class instance wrapping a
+    :class:`colour.LinearInterpolator` class instance defined by two points.
+
+    Parameters
+    ----------
+    x_0 : numeric or array_like
+        First point independent variable.
+    x_1 : numeric or array_like
+        Second point independent variable.
+    y_0 : numeric or array_like
+        First point dependent variable.
+    y_1 : numeric or array_like
+        Second point dependent variable.
+    x : numeric or array_like
+        Points to interpolate or extrapolate at.
+
+    Returns
+    -------
+    ndarray
+        Interpolated or extrapolated values.
+
+    Examples
+    --------
+    >>> _linear_interpolation_on_segment(0, 2, 0, 10, np.array([1, 4]))
+    array([  5.,  20.])
+    """
+
+    x_0, x_1, y_0, y_1, x = [
+        as_float_array(a) for a in (x_0, x_1, y_0, y_1, x)
+    ]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        y = y_0 + (x - x_0) * ((y_1 - y_0) / (x_1 - x_0))
+
+    # The points are returned exactly at the segment ends.
+    return np.where(x == x_0, y_0, np.where(x == x_1, y_1, y))
+
+
+def _munsell_specification_to_xyY(specification):
+    """
+    Converts given *Munsell* *Colorlab* specifications to *CIE xyY*
+    colourspace.
+
+    Parameters
+    ----------
+    specification : array_like, (..., 4)
+        *Munsell* *Colorlab* specifications, grey specifications have a *nan*
+        chroma.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        *CIE xyY* colourspace array.
+
+    Notes
+    -----
+    -   This definition does not support the domain-range scale, input and
+        output are expected to be in the *Reference* scale.
+
+    Examples
+    --------
+    >>> _munsell_specification_to_xyY(np.array([2.1, 8.0, 17.9, 4]))
+    ... # doctest: +ELLIPSIS
+    array([ 0.4400632...,  0.5522428...,  0.5761962...])
+    """
+
+    specification = as_float_array(specification)
+    shape = specification.shape
+    hue, value, chroma, code = tsplit(np.reshape(specification, (-1, 4)))
+
+    is_colour = ~np.isnan(chroma)
+    assert np.all(np.logical_and(hue[is_colour] >= 0, hue[is_colour] <= 10)), (
+        '"{0}" specification hue must be normalised to domain '
+        '[0, 10]!'.format(specification))
+    assert np.all(np.logical_and(value >= 0, value <= 10)), (
+        '"{0}" specification value must be normalised to domain '
+        '[0, 10]!'.format(specification))
+
+    with domain_range_scale('ignore'):
+        Y = luminance_ASTMD153508(value)
+
+    is_integer_value = np.abs(value - np.around(value)) <= INTEGER_THRESHOLD
+    value_minus = np.where(is_integer_value, np.around(value), np.floor(value))
+    value_plus = np.where(is_integer_value, value_minus, value_minus + 1)
+
+    # Both bounding values are processed at once to reduce the per-call
+    # overhead for small arrays.
+    count = value.size
+    value_bounds = np.concatenate([value_minus, value_plus])
+    xy_bounds = munsell_specification_to_xy(
+        tstack([
+            np.tile(hue, 2), value_bounds,
+            np.concatenate(
+                [chroma, np.where(value_plus == 10, np.nan, chroma)]),
+            np.tile(code, 2)
+        ]))
+    xy_minus, xy_plus = xy_bounds[:count], xy_bounds[count:]
+
+    with domain_range_scale('ignore'):
+        Y_bounds = luminance_ASTMD153508(value_bounds)
+
+    is_interpolated = value_minus != value_plus
+    xy = np.where(
+        is_interpolated[..., np.newaxis],
+        _linear_interpolation_on_segment(
+            Y_bounds[:count, np.newaxis], Y_bounds[count:, np.newaxis],
+            xy_minus, xy_plus, Y[..., np.newaxis]), xy_minus)
 
-        return np.array([x, y])
+    return np.reshape(tstack([xy[..., 0], xy[..., 1], Y / 100]),
+                      shape[:-1] + (3, ))
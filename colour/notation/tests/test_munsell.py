@@ -6,6 +6,9 @@ Defines unit tests for :mod:`colour.notation.munsell` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
+import shutil
+import tempfile
 import unittest
 
 from colour.notation.munsell import (parse_munsell_colour,
@@ -24,7 +27,8 @@ from colour.notation.munsell import LCHab_to_munsell_specification
 from colour.notation.munsell import maximum_chroma_from_renotation
 from colour.notation.munsell import munsell_specification_to_xy
 from colour.notation.munsell import (munsell_specification_to_xyY,
-                                     xyY_to_munsell_specification)
+                                     xyY_to_munsell_specification,
+                                     xyY_to_munsell_colour)
 from colour.notation import (munsell_value_Priest1920,
                              munsell_value_Munsell1933, munsell_value_Moon1943,
                              munsell_value_Saunderson1944,
@@ -1319,6 +1323,33 @@ class TestMunsellSpecification_to_xyY(unittest.TestCase):
             np.testing.assert_almost_equal(
                 munsell_specification_to_xyY(specification[0]), xyY, decimal=7)
 
+    def test_n_dimensional_munsell_specification_to_xyY(self):
+        """
+        Tests :func:`colour.notation.munsell.munsell_specification_to_xyY`
+        definition n-dimensional arrays support.
+        """
+
+        specification, xyY = MUNSELL_SPECIFICATIONS[0]
+        specification = np.tile(specification, (6, 1))
+        xyY = np.tile(xyY, (6, 1))
+        np.testing.assert_almost_equal(
+            munsell_specification_to_xyY(specification), xyY, decimal=7)
+
+        specification = np.reshape(specification, (2, 3, 4))
+        xyY = np.reshape(xyY, (2, 3, 3))
+        np.testing.assert_almost_equal(
+            munsell_specification_to_xyY(specification), xyY, decimal=7)
+
+        specification = np.vstack(
+            [specification for specification, _xyY in MUNSELL_SPECIFICATIONS] +
+            [[np.nan, specification[0], np.nan, np.nan]
+             for specification, _xyY in MUNSELL_GREYS_SPECIFICATIONS])
+        xyY = np.vstack(
+            [xyY for _specification, xyY in MUNSELL_SPECIFICATIONS] +
+            [xyY for _specification, xyY in MUNSELL_GREYS_SPECIFICATIONS])
+        np.testing.assert_almost_equal(
+            munsell_specification_to_xyY(specification), xyY, decimal=7)
+
     def test_domain_range_scale_munsell_specification_to_xyY(self):
         """
         Tests :func:`colour.notation.munsell.munsell_specification_to_xyY`
@@ -1385,6 +1416,42 @@ class TestxyY_to_munsell_specification(unittest.TestCase):
                 rtol=0.00001,
                 atol=0.00001)
 
+    def test_n_dimensional_xyY_to_munsell_specification(self):
+        """
+        Tests :func:`colour.notation.munsell.xyY_to_munsell_specification`
+        definition n-dimensional arrays support.
+        """
+
+        specification, xyY = MUNSELL_SPECIFICATIONS[0]
+        specification = np.tile(specification, (6, 1))
+        xyY = np.tile(xyY, (6, 1))
+        np.testing.assert_allclose(
+            xyY_to_munsell_specification(xyY),
+            specification,
+            rtol=0.00001,
+            atol=0.00001)
+
+        specification = np.reshape(specification, (2, 3, 4))
+        xyY = np.reshape(xyY, (2, 3, 3))
+        np.testing.assert_allclose(
+            xyY_to_munsell_specification(xyY),
+            specification,
+            rtol=0.00001,
+            atol=0.00001)
+
+        specification = np.vstack(
+            [specification for specification, _xyY in MUNSELL_SPECIFICATIONS] +
+            [[np.nan, specification[0], np.nan, np.nan]
+             for specification, _xyY in MUNSELL_GREYS_SPECIFICATIONS])
+        xyY = np.vstack(
+            [xyY for _specification, xyY in MUNSELL_SPECIFICATIONS] +
+            [xyY for _specification, xyY in MUNSELL_GREYS_SPECIFICATIONS])
+        np.testing.assert_allclose(
+            xyY_to_munsell_specification(xyY),
+            specification,
+            rtol=0.00001,
+            atol=0.00001)
+
     def test_domain_range_scale_munsell_specification_to_xyY(self):
         """
         Tests :func:`colour.notation.munsell.xyY_to_munsell_specification`
@@ -1419,10 +1486,81 @@ class TestxyY_to_munsell_colour(unittest.TestCase):
         Tests :func:`colour.notation.munsell.xyY_to_munsell_colour` definition.
         """
 
-        # TODO: This test is covered by the previous class,
-        # do we need a dedicated one?
+        self.assertEqual(
+            xyY_to_munsell_colour(
+                np.array([0.38736945, 0.35751656, 0.59362000])),
+            '4.2YR 8.1/5.3')
 
-        pass
+        self.assertEqual(
+            xyY_to_munsell_colour(
+                np.array([0.31006000, 0.31616000, 0.74613450])), 'N8.9')
+
+    def test_n_dimensional_xyY_to_munsell_colour(self):
+        """
+        Tests :func:`colour.notation.munsell.xyY_to_munsell_colour` definition
+        n-dimensional arrays support.
+        """
+
+        xyY = np.array([[0.38736945, 0.35751656, 0.59362000],
+                        [0.31006000, 0.31616000, 0.74613450]])
+        np.testing.assert_array_equal(
+            xyY_to_munsell_colour(xyY), np.array(['4.2YR 8.1/5.3', 'N8.9']))
+
+        xyY = np.reshape(np.tile(xyY, (3, 1)), (2, 3, 3))
+        np.testing.assert_array_equal(
+            xyY_to_munsell_colour(xyY),
+            np.reshape(np.array(['4.2YR 8.1/5.3', 'N8.9'] * 3), (2, 3)))
+
+    def test_xyY_to_munsell_colour_inversion_table(self):
+        """
+        Tests :func:`colour.notation.munsell.xyY_to_munsell_colour` definition
+        with the *Munsell Renotation System* inversion table.
+        """
+
+        import colour.notation.munsell
+
+        xyY = np.array([xyY for _specification, xyY in MUNSELL_SPECIFICATIONS])
+        specification = xyY_to_munsell_specification(xyY)
+
+        munsell_colours = xyY_to_munsell_colour(
+            xyY, hue_decimals=3, chroma_decimals=3, use_inversion_table=True)
+        specification_t = np.array([
+            parse_munsell_colour(munsell_colour)
+            for munsell_colour in munsell_colours
+        ])
+
+        np.testing.assert_allclose(
+            specification_t[..., 1:], specification[..., 1:], atol=0.1)
+        hue = specification_t[..., 0] - specification[..., 0]
+        np.testing.assert_allclose(
+            np.where(np.abs(hue) > 5, 10 - np.abs(hue), hue), 0, atol=0.1)
+
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'munsell_inversion_table.npz')
+        cache = colour.notation.munsell._MUNSELL_INVERSION_TABLE_CACHE
+        environment = os.environ.get('COLOUR_SCIENCE_MUNSELL_INVERSION_TABLE')
+        try:
+            os.environ['COLOUR_SCIENCE_MUNSELL_INVERSION_TABLE'] = path
+
+            colour.notation.munsell._MUNSELL_INVERSION_TABLE_CACHE = None
+            xyY_to_munsell_colour(xyY[0], use_inversion_table=True)
+            self.assertTrue(os.path.exists(path))
+
+            colour.notation.munsell._MUNSELL_INVERSION_TABLE_CACHE = None
+            np.testing.assert_array_equal(
+                xyY_to_munsell_colour(
+                    xyY,
+                    hue_decimals=3,
+                    chroma_decimals=3,
+                    use_inversion_table=True), munsell_colours)
+        finally:
+            colour.notation.munsell._MUNSELL_INVERSION_TABLE_CACHE = cache
+            if environment is None:
+                del os.environ['COLOUR_SCIENCE_MUNSELL_INVERSION_TABLE']
+            else:
+                os.environ['COLOUR_SCIENCE_MUNSELL_INVERSION_TABLE'] = (
+                    environment)
+            shutil.rmtree(directory)
 
 
 class TestParseMunsellColour(unittest.TestCase):
@@ -1572,6 +1710,25 @@ class Test_xyY_fromRenotation(unittest.TestCase):
             xyY_from_renotation((7.5, 0.2, 2.0, 4)),
             np.array([0.262, 0.837, 0.237]))
 
+    def test_n_dimensional_xyY_from_renotation(self):
+        """
+        Tests :func:`colour.notation.munsell.xyY_from_renotation` definition
+        n-dimensional arrays support.
+        """
+
+        specification = np.array([[2.5, 0.2, 2.0, 4], [5.0, 0.2, 2.0, 4],
+                                  [7.5, 0.2, 2.0, 4]])
+        xyY = np.array([[0.713, 1.414, 0.237], [0.449, 1.145, 0.237],
+                        [0.262, 0.837, 0.237]])
+        np.testing.assert_array_equal(xyY_from_renotation(specification), xyY)
+
+        specification = np.reshape(np.tile(specification, (2, 1)), (2, 3, 4))
+        xyY = np.reshape(np.tile(xyY, (2, 1)), (2, 3, 3))
+        np.testing.assert_array_equal(xyY_from_renotation(specification), xyY)
+
+        self.assertRaises(ValueError, xyY_from_renotation,
+                          np.array([[2.5, 0.2, 2.0, 4], [2.5, 0.2, 3.0, 4]]))
+
 
 class TestIsSpecificationInRenotation(unittest.TestCase):
     """
@@ -1693,6 +1850,28 @@ class Test_xy_fromRenotationOvoid(unittest.TestCase):
                     MUNSELL_XY_FROM_RENOTATION_OVOID[i],
                     decimal=7)
 
+    def test_n_dimensional_xy_from_renotation_ovoid(self):
+        """
+        Tests :func:`colour.notation.munsell.xy_from_renotation_ovoid`
+        definition n-dimensional arrays support.
+        """
+
+        specification = np.array([
+            specification
+            for specification, _xyY in MUNSELL_EVEN_SPECIFICATIONS
+        ] + [[np.nan, 8, np.nan, np.nan]])
+        xy = np.vstack([
+            xy_from_renotation_ovoid(tuple(specification))
+            for specification, _xyY in MUNSELL_EVEN_SPECIFICATIONS
+        ] + [xy_from_renotation_ovoid(8)])
+        np.testing.assert_almost_equal(
+            xy_from_renotation_ovoid(specification), xy, decimal=7)
+
+        specification = np.reshape(specification[:100], (10, 10, 4))
+        xy = np.reshape(xy[:100], (10, 10, 2))
+        np.testing.assert_almost_equal(
+            xy_from_renotation_ovoid(specification), xy, decimal=7)
+
 
 class TestLCHabToMunsellSpecification(unittest.TestCase):
     """
@@ -1769,6 +1948,28 @@ class TestMunsellSpecification_to_xy(unittest.TestCase):
                 xyY[0:2],
                 decimal=7)
 
+    def test_n_dimensional_munsell_specification_to_xy(self):
+        """
+        Tests :func:`colour.notation.munsell.munsell_specification_to_xy`
+        definition n-dimensional arrays support.
+        """
+
+        specification = np.vstack([
+            specification
+            for specification, _xyY in MUNSELL_EVEN_SPECIFICATIONS
+        ] + [[np.nan, specification[0], np.nan, np.nan]
+             for specification, _xyY in MUNSELL_GREYS_SPECIFICATIONS])
+        xy = np.vstack(
+            [xyY[0:2] for _specification, xyY in MUNSELL_EVEN_SPECIFICATIONS] +
+            [xyY[0:2] for _specification, xyY in MUNSELL_GREYS_SPECIFICATIONS])
+        np.testing.assert_almost_equal(
+            munsell_specification_to_xy(specification), xy, decimal=7)
+
+        specification = np.reshape(specification[:100], (10, 10, 4))
+        xy = np.reshape(xy[:100], (10, 10, 2))
+        np.testing.assert_almost_equal(
+            munsell_specification_to_xy(specification), xy, decimal=7)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -31,7 +31,7 @@ from collections import namedtuple
 from colour.algebra import euclidean_distance
 from colour.colorimetry import (
     ASTME30815_PRACTISE_SHAPE, sd_CIE_illuminant_D_series, ILLUMINANTS,
-    STANDARD_OBSERVERS_CMFS, sd_blackbody, sd_to_XYZ)
+    STANDARD_OBSERVERS_CMFS, reshape_sd, sd_blackbody, sd_to_XYZ)
 from colour.quality.dataset.vs import VS_INDEXES_TO_NAMES, VS_SDS
 from colour.models import (Lab_to_LCHab, UCS_to_uv, XYZ_to_Lab, XYZ_to_UCS,
                            XYZ_to_xy, xy_to_XYZ)
@@ -140,12 +140,13 @@ def colour_quality_scale(sd_test, additional_data=False):
     64.6863391...
     """
 
-    cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'].copy(
-    ).trim(ASTME30815_PRACTISE_SHAPE)
+    cmfs = reshape_sd(
+        STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        ASTME30815_PRACTISE_SHAPE, 'Trim')
 
     shape = cmfs.shape
     sd_test = sd_test.copy().align(shape)
-    vs_sds = {sd.name: sd.copy().align(shape) for sd in VS_SDS.values()}
+    vs_sds = {sd.name: reshape_sd(sd, shape) for sd in VS_SDS.values()}
 
     with domain_range_scale('1'):
         XYZ = sd_to_XYZ(sd_test, cmfs)
@@ -29,7 +29,7 @@ from collections import namedtuple
 from colour.algebra import euclidean_distance, spow
 from colour.colorimetry import (
     ASTME30815_PRACTISE_SHAPE, sd_CIE_illuminant_D_series,
-    STANDARD_OBSERVERS_CMFS, sd_blackbody, sd_to_XYZ)
+    STANDARD_OBSERVERS_CMFS, reshape_sd, sd_blackbody, sd_to_XYZ)
 from colour.quality.dataset.tcs import TCS_INDEXES_TO_NAMES, TCS_SDS
 from colour.models import UCS_to_uv, XYZ_to_UCS, XYZ_to_xyY
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Robertson1968
@@ -116,12 +116,13 @@ def colour_rendering_index(sd_test, additional_data=False):
     64.1515202...
     """
 
-    cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'].copy(
-    ).trim(ASTME30815_PRACTISE_SHAPE)
+    cmfs = reshape_sd(
+        STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        ASTME30815_PRACTISE_SHAPE, 'Trim')
 
     shape = cmfs.shape
     sd_test = sd_test.copy().align(shape)
-    tcs_sds = {sd.name: sd.copy().align(shape) for sd in TCS_SDS.values()}
+    tcs_sds = {sd.name: reshape_sd(sd, shape) for sd in TCS_SDS.values()}
 
     with domain_range_scale('1'):
         XYZ = sd_to_XYZ(sd_test, cmfs)
@@ -25,8 +25,11 @@ References
 
 from __future__ import division, unicode_literals
 
+from functools import partial
+
 from colour.colorimetry import SpectralDistribution
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import (CaseInsensitiveMapping,
+                              LazyCaseInsensitiveMapping)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -1445,8 +1448,8 @@ TCS_SDS_DATA = {
     }
 }
 
-TCS_SDS = CaseInsensitiveMapping(
-    dict((key, SpectralDistribution(value, name=key))
+TCS_SDS = LazyCaseInsensitiveMapping(
+    dict((key, partial(SpectralDistribution, value, name=key))
          for key, value in TCS_SDS_DATA.items()))
 """
 Test colour samples spectral distributions.
@@ -1455,5 +1458,5 @@ References
 ----------
 :cite:`Ohno2008a`
 
-TCS_SDS : CaseInsensitiveMapping
+TCS_SDS : LazyCaseInsensitiveMapping
 """
@@ -27,8 +27,11 @@ References
 
 from __future__ import division, unicode_literals
 
+from functools import partial
+
 from colour.colorimetry import SpectralDistribution
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import (CaseInsensitiveMapping,
+                              LazyCaseInsensitiveMapping)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -1483,8 +1486,8 @@ VS_SDS_DATA = {
     }
 }
 
-VS_SDS = CaseInsensitiveMapping(
-    dict((key, SpectralDistribution(value, name=key))
+VS_SDS = LazyCaseInsensitiveMapping(
+    dict((key, partial(SpectralDistribution, value, name=key))
          for key, value in VS_SDS_DATA.items()))
 """
 CQS test colour samples spectral distributions.
@@ -1493,5 +1496,5 @@ References
 ----------
 :cite:`Ohno2008a`
 
-VS_SDS : CaseInsensitiveMapping
+VS_SDS : LazyCaseInsensitiveMapping
 """
@@ -27,7 +27,8 @@ import numpy as np
 from scipy.optimize import minimize
 
 from colour.colorimetry import (STANDARD_OBSERVERS_CMFS, SpectralDistribution,
-                                SpectralShape, sd_ones, sd_to_XYZ_integration)
+                                SpectralShape, reshape_sd, sd_ones,
+                                sd_to_XYZ_integration)
 from colour.utilities import to_domain_1, from_range_100
 
 __author__ = 'Colour Developers'
@@ -155,7 +156,7 @@ def XYZ_to_sd_Meng2015(
 
     XYZ = to_domain_1(XYZ)
     shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, interval)
-    cmfs = cmfs.copy().align(shape)
+    cmfs = reshape_sd(cmfs, shape)
     illuminant = sd_ones(shape)
     sd = sd_ones(shape)
 
@@ -87,11 +87,12 @@ dng_temperature.cpp::dng_temperature::xy_coord. Retrieved from
 from __future__ import division, unicode_literals
 
 import numpy as np
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
+from scipy.spatial import cKDTree
 
 from colour.colorimetry import (ASTME30815_PRACTISE_SHAPE,
-                                STANDARD_OBSERVERS_CMFS, sd_blackbody,
-                                sd_to_XYZ)
+                                STANDARD_OBSERVERS_CMFS, planck_law,
+                                reshape_sd, sd_blackbody, sd_to_XYZ)
 from colour.models import UCS_to_uv, XYZ_to_UCS
 from colour.utilities import (CaseInsensitiveMapping, as_float_array, as_float,
                               filter_kwargs, runtime_warning, tsplit, tstack,
@@ -106,7 +107,8 @@ __status__ = 'Production'
 
 __all__ = [
     'PLANCKIAN_TABLE_TUVD', 'CCT_MINIMAL', 'CCT_MAXIMAL', 'CCT_SAMPLES',
-    'CCT_CALCULATION_ITERATIONS', 'ROBERTSON_ISOTEMPERATURE_LINES_DATA',
+    'CCT_CALCULATION_ITERATIONS', 'CCT_PLANCKIAN_LOCUS_SAMPLES',
+    'ROBERTSON_ISOTEMPERATURE_LINES_DATA',
     'ROBERTSON_ISOTEMPERATURE_LINES_RUVT', 'ROBERTSON_ISOTEMPERATURE_LINES',
     'planckian_table', 'planckian_table_minimal_distance_index',
     'uv_to_CCT_Ohno2013', 'CCT_to_uv_Ohno2013', 'uv_to_CCT_Robertson1968',
@@ -124,6 +126,15 @@ CCT_MAXIMAL = 100000
 CCT_SAMPLES = 10
 CCT_CALCULATION_ITERATIONS = 6
 
+CCT_PLANCKIAN_LOCUS_SAMPLES = 30000
+"""
+Temperatures count in the high resolution planckian locus used by
+:func:`colour.temperature.uv_to_CCT_Ohno2013` definition with batched
+*CIE UCS* colourspace *uv* chromaticity coordinates.
+
+CCT_PLANCKIAN_LOCUS_SAMPLES : int
+"""
+
 ROBERTSON_ISOTEMPERATURE_LINES_DATA = (
     (0, 0.18006, 0.26352, -0.24341),
     (10, 0.18066, 0.26589, -0.25479),
@@ -183,6 +194,11 @@ ROBERTSON_ISOTEMPERATURE_LINES = [
     for x in ROBERTSON_ISOTEMPERATURE_LINES_DATA
 ]
 
+_ROBERTSON_ISOTEMPERATURE_LINES_ARRAY = None
+
+_PLANCKIAN_LOCUS_CACHE = None
+_PLANCKIAN_LOCUS_CACHE_SIZE = 8
+
 
 def planckian_table(uv, cmfs, start, end, count):
     """
@@ -240,7 +256,7 @@ ui=0.4456351..., vi=0.3548306..., di=0.2514749...)]
 
     ux, vx = uv
 
-    cmfs = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
+    cmfs = reshape_sd(cmfs, ASTME30815_PRACTISE_SHAPE, 'Trim')
 
     shape = cmfs.shape
 
@@ -291,7 +307,7 @@ def uv_to_CCT_Ohno2013(
         cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
         start=CCT_MINIMAL,
         end=CCT_MAXIMAL,
-        count=CCT_SAMPLES,
+        count=None,
         iterations=CCT_CALCULATION_ITERATIONS):
     """
     Returns the correlated colour temperature :math:`T_{cp}` and
@@ -314,7 +330,11 @@ def uv_to_CCT_Ohno2013(
     end : numeric, optional
         Temperature range end in kelvins.
     count : int, optional
-        Temperatures count in the planckian tables.
+        Temperatures count in the planckian tables, default to
+        :attr:`colour.temperature.cct.CCT_SAMPLES` for a single *uv*
+        chromaticity coordinates pair and to
+        :attr:`colour.temperature.cct.CCT_PLANCKIAN_LOCUS_SAMPLES` for
+        batched *uv* chromaticity coordinates.
     iterations : int, optional
         Number of planckian tables to generate.
 
@@ -323,6 +343,20 @@ def uv_to_CCT_Ohno2013(
     ndarray
         Correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`.
 
+    Notes
+    -----
+    -   Batched *uv* chromaticity coordinates, i.e. an array with more than
+        one dimension, are solved against a single high resolution planckian
+        locus built for given colour matching functions, temperature range
+        and temperatures count instead of using cascade expansion, the
+        iterations parameter is thus ignored.
+    -   The high resolution planckian loci are cached in
+        :attr:`colour.temperature.cct._PLANCKIAN_LOCUS_CACHE` attribute with
+        least recently used eviction. Their identifier key is defined by the
+        colour matching functions
+        :attr:`colour.continuous.Signal.fingerprint` attribute along the
+        temperature range and temperatures count.
+
     References
     ----------
     :cite:`Ohno2014a`
@@ -334,8 +368,23 @@ def uv_to_CCT_Ohno2013(
     >>> uv = np.array([0.1978, 0.3122])
     >>> uv_to_CCT_Ohno2013(uv, cmfs)  # doctest: +ELLIPSIS
     array([  6.5074738...e+03,   3.2233461...e-03])
+    >>> uv = np.array([[0.1978, 0.3122], [0.4328, 0.2883]])
+    >>> uv_to_CCT_Ohno2013(uv, cmfs)  # doctest: +ELLIPSIS
+    array([[  6.5074...e+03,   3.2233...e-03],
+           [  1.0416...e+03,  -6.7378...e-02]])
     """
 
+    uv = as_float_array(uv)
+
+    if uv.ndim > 1:
+        if count is None:
+            count = CCT_PLANCKIAN_LOCUS_SAMPLES
+
+        return _uv_to_CCT_Ohno2013_planckian_locus(uv, cmfs, start, end, count)
+
+    if count is None:
+        count = CCT_SAMPLES
+
     # Ensuring we do at least one iteration to initialise variables.
     iterations = max(iterations, 1)
 
@@ -357,9 +406,167 @@ def uv_to_CCT_Ohno2013(
         start = table[index - 1].Ti
         end = table[index + 1].Ti
 
-    _ux, vx = uv
+    return _uv_to_CCT_Ohno2013_solution(uv, table[index - 1], table[index],
+                                        table[index + 1])
+
+
+def _planckian_locus(cmfs, start, end, count):
+    """
+    Returns the high resolution planckian locus, i.e. temperatures, *uv*
+    chromaticity coordinates and nearest neighbour lookup tree, for given
+    colour matching functions and temperature range.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    start : numeric
+        Temperature range start in kelvins.
+    end : numeric
+        Temperature range end in kelvins.
+    count : int
+        Temperatures count in the planckian locus.
+
+    Returns
+    -------
+    tuple
+        Temperatures, *uv* chromaticity coordinates and
+        :class:`scipy.spatial.cKDTree` class instance.
+    """
+
+    global _PLANCKIAN_LOCUS_CACHE
+
+    if _PLANCKIAN_LOCUS_CACHE is None:
+        _PLANCKIAN_LOCUS_CACHE = OrderedDict()
+
+    key = (cmfs.fingerprint, start, end, count)
+    if key in _PLANCKIAN_LOCUS_CACHE:
+        locus = _PLANCKIAN_LOCUS_CACHE.pop(key)
+        _PLANCKIAN_LOCUS_CACHE[key] = locus
+
+        return locus
+
+    T = np.linspace(start, end, count)
+    uv = _planckian_uv(T, cmfs)
+
+    locus = T, uv, cKDTree(uv)
+
+    _PLANCKIAN_LOCUS_CACHE[key] = locus
+    while len(_PLANCKIAN_LOCUS_CACHE) > _PLANCKIAN_LOCUS_CACHE_SIZE:
+        _PLANCKIAN_LOCUS_CACHE.popitem(last=False)
+
+    return locus
+
+
+def _planckian_uv(T, cmfs):
+    """
+    Returns the *CIE UCS* colourspace *uv* chromaticity coordinates of the
+    planckian radiators at given temperatures by integrating *Planck's law*
+    evaluated on a wavelength by temperature grid in a single matrix product.
+
+    Parameters
+    ----------
+    T : array_like
+        Temperatures in kelvins.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    ndarray
+        *CIE UCS* colourspace *uv* chromaticity coordinates.
+    """
+
+    T = as_float_array(T)
+
+    cmfs = reshape_sd(cmfs, ASTME30815_PRACTISE_SHAPE, 'Trim')
+
+    P = planck_law(cmfs.wavelengths[..., np.newaxis] * 1e-9, np.ravel(T))
+    XYZ = np.dot(np.transpose(P), cmfs.values)
+
+    return np.reshape(UCS_to_uv(XYZ_to_UCS(XYZ)), T.shape + (2, ))
+
+
+def _uv_to_CCT_Ohno2013_planckian_locus(uv, cmfs, start, end, count):
+    """
+    Returns the correlated colour temperature :math:`T_{cp}` and
+    :math:`\\Delta_{uv}` from given batched *CIE UCS* colourspace *uv*
+    chromaticity coordinates using a single high resolution planckian locus.
+
+    Parameters
+    ----------
+    uv : array_like
+        *CIE UCS* colourspace *uv* chromaticity coordinates.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    start : numeric
+        Temperature range start in kelvins.
+    end : numeric
+        Temperature range end in kelvins.
+    count : int
+        Temperatures count in the planckian locus.
+
+    Returns
+    -------
+    ndarray
+        Correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`.
+    """
+
+    uv = as_float_array(uv)
+
+    T, uv_l, tree = _planckian_locus(cmfs, start, end, count)
+
+    index = tree.query(np.reshape(uv, (-1, 2)))[1]
+    if np.any(index == 0):
+        runtime_warning(
+            ('Minimal distance index is on lowest planckian table bound, '
+             'unpredictable results may occur!'))
+    if np.any(index == count - 1):
+        runtime_warning(
+            ('Minimal distance index is on highest planckian table bound, '
+             'unpredictable results may occur!'))
+    index = np.reshape(np.clip(index, 1, count - 2), uv.shape[:-1])
+
+    def Tuvdi(i):
+        """
+        Returns the planckian table entry at given locus index.
+        """
+
+        ui, vi = tsplit(uv_l[i])
+        di = np.hypot(uv[..., 0] - ui, uv[..., 1] - vi)
+
+        return PLANCKIAN_TABLE_TUVD(T[i], ui, vi, di)
+
+    return _uv_to_CCT_Ohno2013_solution(uv, Tuvdi(index - 1), Tuvdi(index),
+                                        Tuvdi(index + 1))
+
+
+def _uv_to_CCT_Ohno2013_solution(uv, Tuvdip, Tuvdi, Tuvdin):
+    """
+    Returns the correlated colour temperature :math:`T_{cp}` and
+    :math:`\\Delta_{uv}` from given *CIE UCS* colourspace *uv* chromaticity
+    coordinates and bracketing planckian table entries using *Ohno (2013)*
+    combined triangular and parabolic solutions.
+
+    Parameters
+    ----------
+    uv : array_like
+        *CIE UCS* colourspace *uv* chromaticity coordinates.
+    Tuvdip : PlanckianTable_Tuvdi
+        Planckian table entry preceding the minimal distance entry.
+    Tuvdi : PlanckianTable_Tuvdi
+        Minimal distance planckian table entry.
+    Tuvdin : PlanckianTable_Tuvdi
+        Planckian table entry following the minimal distance entry.
+
+    Returns
+    -------
+    ndarray
+        Correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`.
+    """
+
+    _ux, vx = tsplit(uv)
 
-    Tuvdip, Tuvdi, Tuvdin = (table[index - 1], table[index], table[index + 1])
     Tip, uip, vip, dip = Tuvdip.Ti, Tuvdip.ui, Tuvdip.vi, Tuvdip.di
     Ti, di = Tuvdi.Ti, Tuvdi.di
     Tin, uin, vin, din = Tuvdin.Ti, Tuvdin.ui, Tuvdin.vi, Tuvdin.di
@@ -370,24 +577,25 @@ def uv_to_CCT_Ohno2013(
     T = Tip + (Tin - Tip) * (x / l)
 
     vtx = vip + (vin - vip) * (x / l)
-    sign = 1 if vx - vtx >= 0 else -1
+    sign = np.where(vx - vtx >= 0, 1, -1)
     D_uv = (dip ** 2 - x ** 2) ** (1 / 2) * sign
 
     # Parabolic solution.
-    if np.abs(D_uv) >= 0.002:
-        X = (Tin - Ti) * (Tip - Tin) * (Ti - Tip)
-        a = (Tip * (din - di) + Ti * (dip - din) + Tin * (di - dip)) * X ** -1
-        b = (-(Tip ** 2 * (din - di) + Ti ** 2 * (dip - din) + Tin ** 2 *
-               (di - dip)) * X ** -1)
-        c = (-(dip * (Tin - Ti) * Ti * Tin + di *
-               (Tip - Tin) * Tip * Tin + din *
-               (Ti - Tip) * Tip * Ti) * X ** -1)
+    X = (Tin - Ti) * (Tip - Tin) * (Ti - Tip)
+    a = (Tip * (din - di) + Ti * (dip - din) + Tin * (di - dip)) * X ** -1
+    b = (-(Tip ** 2 * (din - di) + Ti ** 2 * (dip - din) + Tin ** 2 *
+           (di - dip)) * X ** -1)
+    c = (-(dip * (Tin - Ti) * Ti * Tin + di * (Tip - Tin) * Tip * Tin + din *
+           (Ti - Tip) * Tip * Ti) * X ** -1)
 
-        T = -b / (2 * a)
+    T_p = -b / (2 * a)
+    D_uv_p = sign * (a * T_p ** 2 + b * T_p + c)
 
-        D_uv = sign * (a * T ** 2 + b * T + c)
+    parabolic = np.abs(D_uv) >= 0.002
+    T = np.where(parabolic, T_p, T)
+    D_uv = np.where(parabolic, D_uv_p, D_uv)
 
-    return np.array([T, D_uv])
+    return tstack([T, D_uv])
 
 
 def CCT_to_uv_Ohno2013(
@@ -401,9 +609,9 @@ def CCT_to_uv_Ohno2013(
 
     Parameters
     ----------
-    CCT : numeric
+    CCT : numeric or array_like
         Correlated colour temperature :math:`T_{cp}`.
-    D_uv : numeric, optional
+    D_uv : numeric or array_like, optional
         :math:`\\Delta_{uv}`.
     cmfs : XYZ_ColourMatchingFunctions, optional
         Standard observer colour matching functions.
@@ -413,6 +621,15 @@ def CCT_to_uv_Ohno2013(
     ndarray
         *CIE UCS* colourspace *uv* chromaticity coordinates.
 
+    Notes
+    -----
+    -   Batched correlated colour temperature :math:`T_{cp}` or
+        :math:`\\Delta_{uv}`, i.e. arrays with at least one dimension, are
+        converted by evaluating *Planck's law* on a wavelength by temperature
+        grid integrated against the colour matching functions in a single
+        matrix product instead of generating a blackbody spectral
+        distribution per temperature.
+
     References
     ----------
     :cite:`Ohno2014a`
@@ -425,9 +642,20 @@ def CCT_to_uv_Ohno2013(
     >>> D_uv = 0.003223690901513
     >>> CCT_to_uv_Ohno2013(CCT, D_uv, cmfs)  # doctest: +ELLIPSIS
     array([ 0.1977999...,  0.3122004...])
+    >>> CCT = np.array([6507.4738046, 1041.6831536])
+    >>> D_uv = np.array([0.00322335, -0.06737802])
+    >>> CCT_to_uv_Ohno2013(CCT, D_uv, cmfs)  # doctest: +ELLIPSIS
+    array([[ 0.1977...,  0.3121...],
+           [ 0.4327...,  0.2883...]])
     """
 
-    cmfs = cmfs.copy().trim(ASTME30815_PRACTISE_SHAPE)
+    CCT = as_float_array(CCT)
+    D_uv = as_float_array(D_uv)
+
+    if CCT.ndim > 0 or D_uv.ndim > 0:
+        return _CCT_to_uv_Ohno2013_planckian_locus(CCT, D_uv, cmfs)
+
+    cmfs = reshape_sd(cmfs, ASTME30815_PRACTISE_SHAPE, 'Trim')
 
     shape = cmfs.shape
 
@@ -457,6 +685,41 @@ def CCT_to_uv_Ohno2013(
         return np.array([u, v])
 
 
+def _CCT_to_uv_Ohno2013_planckian_locus(CCT, D_uv, cmfs):
+    """
+    Returns the *CIE UCS* colourspace *uv* chromaticity coordinates from given
+    batched correlated colour temperature :math:`T_{cp}`, :math:`\\Delta_{uv}`
+    and colour matching functions using *Ohno (2013)* method.
+
+    Parameters
+    ----------
+    CCT : array_like
+        Correlated colour temperature :math:`T_{cp}`.
+    D_uv : array_like
+        :math:`\\Delta_{uv}`.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    ndarray
+        *CIE UCS* colourspace *uv* chromaticity coordinates.
+    """
+
+    CCT, D_uv = np.broadcast_arrays(as_float_array(CCT), as_float_array(D_uv))
+
+    delta = 0.01
+
+    uv_0, uv_1 = _planckian_uv(np.array([CCT, CCT + delta]), cmfs)
+    u0, v0 = tsplit(uv_0)
+    du, dv = tsplit(uv_0 - uv_1)
+
+    u = u0 - D_uv * (dv / np.hypot(du, dv))
+    v = v0 + D_uv * (du / np.hypot(du, dv))
+
+    return tstack([u, v])
+
+
 def uv_to_CCT_Robertson1968(uv):
     """
     Returns the correlated colour temperature :math:`T_{cp}` and
@@ -482,59 +745,80 @@ def uv_to_CCT_Robertson1968(uv):
     >>> uv = np.array([0.193741375998230, 0.315221043940594])
     >>> uv_to_CCT_Robertson1968(uv)  # doctest: +ELLIPSIS
     array([  6.5000162...e+03,   8.3333289...e-03])
+    >>> uv_to_CCT_Robertson1968(np.tile(uv, (2, 1)))  # doctest: +ELLIPSIS
+    array([[  6.5000162...e+03,   8.3333289...e-03],
+           [  6.5000162...e+03,   8.3333289...e-03]])
     """
 
-    u, v = uv
+    uv = as_float_array(uv)
 
-    last_dt = last_dv = last_du = 0
+    r, u_l, v_l, du_l, dv_l = _robertson_isotemperature_lines_array()
 
-    for i in range(1, 31):
-        wr_ruvt = ROBERTSON_ISOTEMPERATURE_LINES[i]
-        wr_ruvt_previous = ROBERTSON_ISOTEMPERATURE_LINES[i - 1]
+    u, v = tsplit(uv[..., np.newaxis, :])
+
+    # Signed distances to the isotemperature lines, the first line beyond
+    # which the sample lies brackets it along with the previous line.
+    dt_l = -(u - u_l[1:]) * dv_l[1:] + (v - v_l[1:]) * du_l[1:]
+
+    crossing = dt_l <= 0
+    crossing[..., -1] = True
+    i = np.argmax(crossing, axis=-1) + 1
+    first = i == 1
 
-        du = 1
-        dv = wr_ruvt.t
+    u, v = tsplit(uv)
 
-        length = np.hypot(1, dv)
+    dt = -(u - u_l[i]) * dv_l[i] + (v - v_l[i]) * du_l[i]
+    dt = -np.where(dt > 0, 0, dt)
 
-        du /= length
-        dv /= length
+    last_dt = -(u - u_l[i - 1]) * dv_l[i - 1] + (v - v_l[i - 1]) * du_l[i - 1]
+    last_du = np.where(first, 0, du_l[i - 1])
+    last_dv = np.where(first, 0, dv_l[i - 1])
 
-        uu = u - wr_ruvt.u
-        vv = v - wr_ruvt.v
+    f = np.where(first, 0, dt / np.where(first, 1, last_dt + dt))
 
-        dt = -uu * dv + vv * du
+    T = 1.0e6 / (r[i - 1] * f + r[i] * (1 - f))
 
-        if dt <= 0 or i == 30:
-            if dt > 0:
-                dt = 0
+    uu = u - (u_l[i - 1] * f + u_l[i] * (1 - f))
+    vv = v - (v_l[i - 1] * f + v_l[i] * (1 - f))
 
-            dt = -dt
+    du = du_l[i] * (1 - f) + last_du * f
+    dv = dv_l[i] * (1 - f) + last_dv * f
 
-            f = 0 if i == 1 else dt / (last_dt + dt)
+    length = np.hypot(du, dv)
 
-            T = 1.0e6 / (wr_ruvt_previous.r * f + wr_ruvt.r * (1 - f))
+    du /= length
+    dv /= length
 
-            uu = u - (wr_ruvt_previous.u * f + wr_ruvt.u * (1 - f))
-            vv = v - (wr_ruvt_previous.v * f + wr_ruvt.v * (1 - f))
+    D_uv = uu * du + vv * dv
 
-            du = du * (1 - f) + last_du * f
-            dv = dv * (1 - f) + last_dv * f
+    return tstack([T, -D_uv])
 
-            length = np.hypot(du, dv)
 
-            du /= length
-            dv /= length
+def _robertson_isotemperature_lines_array():
+    """
+    Returns the *Roberston (1968)* isotemperature lines in array form, i.e.
+    reciprocal megakelvins, *uv* chromaticity coordinates and normalised
+    direction vector components.
+
+    Returns
+    -------
+    tuple
+        Reciprocal megakelvins :math:`r`, *uv* chromaticity coordinates and
+        isotemperature lines normalised direction :math:`du`, :math:`dv`.
+    """
+
+    global _ROBERTSON_ISOTEMPERATURE_LINES_ARRAY
 
-            D_uv = uu * du + vv * dv
+    if _ROBERTSON_ISOTEMPERATURE_LINES_ARRAY is None:
+        r, u, v, t = tsplit(
+            as_float_array(ROBERTSON_ISOTEMPERATURE_LINES_DATA))
 
-            break
+        length = np.hypot(1, t)
 
-        last_dt = dt
-        last_du = du
-        last_dv = dv
+        _ROBERTSON_ISOTEMPERATURE_LINES_ARRAY = (r, u, v, 1 / length,
+                                                 t / length)
 
-    return np.array([T, -D_uv])
+    return _ROBERTSON_ISOTEMPERATURE_LINES_ARRAY
 
 
 def CCT_to_uv_Robertson1968(CCT, D_uv=0):
@@ -14,7 +14,8 @@ from colour.temperature import (
     CCT_to_uv_Ohno2013, CCT_to_uv_Robertson1968, CCT_to_uv_Krystek1985,
     uv_to_CCT_Ohno2013, uv_to_CCT_Robertson1968, CCT_to_xy_Kang2002,
     CCT_to_xy_CIE_D, xy_to_CCT_McCamy1992, xy_to_CCT_Hernandez1999)
-from colour.temperature.cct import (planckian_table,
+from colour.temperature import cct
+from colour.temperature.cct import (CCT_MAXIMAL, CCT_MINIMAL, planckian_table,
                                     planckian_table_minimal_distance_index)
 from colour.utilities import ignore_numpy_errors
 
@@ -216,6 +217,77 @@ class Testuv_to_CCT_Ohno2013(unittest.TestCase):
             np.array([2452.15316417, -0.08437064]),
             decimal=7)
 
+    def test_n_dimensional_uv_to_CCT_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Ohno2013` definition
+        n-dimensional arrays support.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        uv = np.array([0.1978, 0.3122])
+        CCT_D_uv = uv_to_CCT_Ohno2013(uv, cmfs)
+
+        uv = np.tile(uv, (6, 1))
+        CCT_D_uv = np.tile(CCT_D_uv, (6, 1))
+        np.testing.assert_allclose(
+            uv_to_CCT_Ohno2013(uv, cmfs), CCT_D_uv, rtol=0.00005, atol=1e-6)
+
+        uv = np.reshape(uv, (2, 3, 2))
+        CCT_D_uv = np.reshape(CCT_D_uv, (2, 3, 2))
+        np.testing.assert_allclose(
+            uv_to_CCT_Ohno2013(uv, cmfs), CCT_D_uv, rtol=0.00005, atol=1e-6)
+
+    def test_planckian_locus_uv_to_CCT_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Ohno2013` definition
+        batched computations against the cascade expansion and high resolution
+        planckian locus caching.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        uv = np.array([
+            [0.1978, 0.3122],
+            [0.4328, 0.2883],
+            [0.2927, 0.2722],
+            [0.2500, 0.3400],
+            [0.1850, 0.2800],
+        ])
+
+        np.testing.assert_allclose(
+            uv_to_CCT_Ohno2013(uv, cmfs),
+            np.array([uv_to_CCT_Ohno2013(x, cmfs) for x in uv]),
+            rtol=0.00005,
+            atol=1e-6)
+
+        uv_to_CCT_Ohno2013(uv, cmfs, count=1000)
+        key = (cmfs.fingerprint, CCT_MINIMAL, CCT_MAXIMAL, 1000)
+        self.assertIn(key, cct._PLANCKIAN_LOCUS_CACHE)
+
+        for count in range(1001, 1001 + cct._PLANCKIAN_LOCUS_CACHE_SIZE):
+            uv_to_CCT_Ohno2013(uv, cmfs, count=count)
+
+        self.assertNotIn(key, cct._PLANCKIAN_LOCUS_CACHE)
+        self.assertLessEqual(
+            len(cct._PLANCKIAN_LOCUS_CACHE), cct._PLANCKIAN_LOCUS_CACHE_SIZE)
+
+        # Colour matching functions with the same name and shape but
+        # different spectral data must not share their planckian locus.
+        CCT_D_uv = uv_to_CCT_Ohno2013(uv, cmfs)
+
+        cmfs_m = cmfs.copy()
+        values = np.copy(cmfs_m.values)
+        values[..., 2] *= 2
+        cmfs_m.values = values
+        self.assertEqual(cmfs_m.name, cmfs.name)
+
+        CCT_D_uv_m = uv_to_CCT_Ohno2013(uv, cmfs_m)
+        self.assertFalse(np.allclose(CCT_D_uv_m, CCT_D_uv))
+        np.testing.assert_allclose(
+            CCT_D_uv_m,
+            np.array([uv_to_CCT_Ohno2013(x, cmfs_m) for x in uv]),
+            rtol=0.00005,
+            atol=1e-6)
+
 
 class TestCCT_to_uv_Ohno2013(unittest.TestCase):
     """
@@ -244,6 +316,33 @@ class TestCCT_to_uv_Ohno2013(unittest.TestCase):
             np.array([0.29247364, 0.27215157]),
             decimal=7)
 
+    def test_n_dimensional_CCT_to_uv_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.CCT_to_uv_Ohno2013` definition
+        n-dimensional arrays support.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        CCT = np.array([6507.47380460, 1041.68315360, 2452.15316417])
+        D_uv = np.array([0.00322335, -0.06737802, -0.08437064])
+        uv = np.array([
+            CCT_to_uv_Ohno2013(CCT_i, D_uv_i, cmfs)
+            for CCT_i, D_uv_i in zip(CCT, D_uv)
+        ])
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Ohno2013(CCT, D_uv, cmfs), uv, decimal=7)
+
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Ohno2013(CCT, 0, cmfs),
+            np.array([CCT_to_uv_Ohno2013(CCT_i, 0, cmfs) for CCT_i in CCT]),
+            decimal=7)
+
+        CCT = np.tile(CCT, (2, 1))
+        D_uv = np.tile(D_uv, (2, 1))
+        uv = np.tile(uv, (2, 1, 1))
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Ohno2013(CCT, D_uv, cmfs), uv, decimal=7)
+
 
 class Testuv_to_CCT_Robertson1968(unittest.TestCase):
     """
@@ -261,6 +360,32 @@ class Testuv_to_CCT_Robertson1968(unittest.TestCase):
             np.testing.assert_allclose(
                 uv_to_CCT_Robertson1968(value), key, atol=0.25)
 
+    def test_n_dimensional_uv_to_CCT_Robertson1968(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Robertson1968`
+        definition n-dimensional arrays support.
+        """
+
+        uv = np.array(list(TEMPERATURE_DUV_TO_UV.values()))
+        CCT_D_uv = np.array([uv_to_CCT_Robertson1968(x) for x in uv])
+        np.testing.assert_array_equal(uv_to_CCT_Robertson1968(uv), CCT_D_uv)
+
+        uv = np.reshape(uv[:6], (2, 3, 2))
+        CCT_D_uv = np.reshape(CCT_D_uv[:6], (2, 3, 2))
+        np.testing.assert_array_equal(uv_to_CCT_Robertson1968(uv), CCT_D_uv)
+
+    @ignore_numpy_errors
+    def test_nan_uv_to_CCT_Robertson1968(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Robertson1968`
+        definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=2))
+        for case in cases:
+            uv_to_CCT_Robertson1968(case)
+
 
 class TestCCT_to_uv_Robertson1968(unittest.TestCase):
     """
@@ -2,7 +2,8 @@
 
 from __future__ import absolute_import
 
-from .data_structures import Lookup, Structure, CaseInsensitiveMapping
+from .data_structures import (Lookup, Structure, CaseInsensitiveMapping,
+                              LazyCaseInsensitiveMapping, DatasetStore)
 from .common import (
     handle_numpy_errors, ignore_numpy_errors, raise_numpy_errors,
     print_numpy_errors, warn_numpy_errors, ignore_python_warnings, batch,
@@ -25,7 +26,10 @@ from .verbose import (ColourWarning, ColourUsageWarning, ColourRuntimeWarning,
                       ANCILLARY_RUNTIME_PACKAGES,
                       ANCILLARY_DEVELOPMENT_PACKAGES, describe_environment)
 
-__all__ = ['Lookup', 'Structure', 'CaseInsensitiveMapping']
+__all__ = [
+    'Lookup', 'Structure', 'CaseInsensitiveMapping',
+    'LazyCaseInsensitiveMapping', 'DatasetStore'
+]
 __all__ += [
     'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
     'print_numpy_errors', 'warn_numpy_errors', 'ignore_python_warnings',
@@ -11,6 +11,10 @@ Defines various data structures classes:
     retrieve keys by values.
 -   :class:`colour.utilities.CaseInsensitiveMapping`: A case insensitive
     mapping allowing values retrieving from keys while ignoring the key case.
+-   :class:`colour.utilities.LazyCaseInsensitiveMapping`: Another case
+    insensitive mapping evaluating its values lazily on first access.
+-   :class:`colour.utilities.DatasetStore`: A mapping over a binary,
+    memory-mapped, store of datasets.
 
 References
 ----------
@@ -27,7 +31,11 @@ structures.py#L37
 
 from __future__ import division, unicode_literals
 
-from collections import Mapping, MutableMapping
+import codecs
+import json
+import numpy as np
+from collections import Mapping, MutableMapping, OrderedDict
+from functools import partial
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -36,7 +44,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['Structure', 'Lookup', 'CaseInsensitiveMapping']
+__all__ = [
+    'Structure', 'Lookup', 'CaseInsensitiveMapping',
+    'LazyCaseInsensitiveMapping', 'DatasetStore'
+]
 
 
 class Structure(dict):
@@ -388,3 +399,395 @@ class CaseInsensitiveMapping(MutableMapping):
         """
 
         return ((item, value[1]) for (item, value) in self._data.items())
+
+
+class LazyCaseInsensitiveMapping(CaseInsensitiveMapping):
+    """
+    Implements a lazy case-insensitive mutable mapping / *dict* object.
+
+    The values are expected to be callables without arguments creating the
+    actual values: they are evaluated on first access and the mapping then
+    stores their return value in place.
+
+    Parameters
+    ----------
+    data : dict
+        *dict* of data to store into the mapping at initialisation.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Key / Value pairs to store into the mapping at initialisation.
+
+    Methods
+    -------
+    __getitem__
+    update
+    copy
+    lower_items
+
+    Warning
+    -------
+    Any callable value is evaluated on access, non-callable values are
+    returned as they are.
+
+    Examples
+    --------
+    >>> def callable_a():
+    ...     print(2)
+    ...     return 2
+    >>> methods = LazyCaseInsensitiveMapping(
+    ...     {'McCamy': 1, 'Hernandez': callable_a})
+    >>> methods['mccamy']
+    1
+    >>> methods['hernandez']
+    2
+    2
+    >>> methods['hernandez']
+    2
+    """
+
+    def __getitem__(self, item):
+        """
+        Returns the value of given item, evaluating it if it is still lazy.
+
+        Parameters
+        ----------
+        item : unicode
+            Item name.
+
+        Returns
+        -------
+        object
+            Item value.
+        """
+
+        name, value = self._data[item.lower()]
+
+        if callable(value):
+            value = value()
+            self._data[item.lower()] = (name, value)
+
+        return value
+
+    def update(self, *args, **kwargs):
+        """
+        Updates the mapping with given mapping or key / value pairs.
+
+        The lazy values of a given
+        :class:`colour.utilities.LazyCaseInsensitiveMapping` class instance
+        are not evaluated, they are deferred to it so that both mappings share
+        the same values once evaluated.
+
+        Parameters
+        ----------
+        \\*args : list, optional
+            Mapping or iterable of key / value pairs.
+
+        Other Parameters
+        ----------------
+        \\**kwargs : dict, optional
+            Key / Value pairs.
+        """
+
+        for data in args:
+            if isinstance(data, LazyCaseInsensitiveMapping):
+                data = [(name, partial(data.__getitem__, name)
+                         if callable(value) else value)
+                        for name, value in data.data.values()]
+
+            super(LazyCaseInsensitiveMapping, self).update(data)
+
+        super(LazyCaseInsensitiveMapping, self).update(**kwargs)
+
+    def copy(self):
+        """
+        Returns a copy of the mapping.
+
+        Returns
+        -------
+        LazyCaseInsensitiveMapping
+            Mapping copy.
+
+        Notes
+        -----
+        -   The :class:`colour.utilities.LazyCaseInsensitiveMapping` class copy
+            returned is a simple *copy* not a *deepcopy*, its lazy values are
+            deferred to the original mapping.
+        """
+
+        return LazyCaseInsensitiveMapping(self)
+
+    def lower_items(self):
+        """
+        Iterates over the lower items names, evaluating the lazy values.
+
+        Returns
+        -------
+        generator
+            Lower item names.
+        """
+
+        return ((item, self[item]) for item in list(self._data))
+
+
+class DatasetStore(MutableMapping):
+    """
+    Implements a mutable mapping / *dict* object over a binary store of
+    datasets.
+
+    The store is made of two files sharing the same path: a *.npy* file
+    holding the concatenated datasets as a flat *float64* array and a *.json*
+    index file describing each dataset name, offset and shape. Both files are
+    only read on first access and the *.npy* file is memory-mapped so that
+    only the accessed datasets are actually read from disk.
+
+    Each dataset is a 2D array whose first column holds the keys, e.g. the
+    wavelengths, and the remaining columns the values. The datasets are
+    returned as *dict* objects mapping the keys to the values, i.e. a single
+    value or a *tuple* of values per key, and as *ndarray* objects by the
+    :meth:`colour.utilities.DatasetStore.array` method.
+
+    The *dict* objects are built on first access and kept in an overlay along
+    the datasets set with the mapping, thus the datasets can be modified,
+    added or deleted as with a *dict* object while the store files are left
+    untouched.
+
+    Parameters
+    ----------
+    path : unicode
+        Store path without extension.
+
+    Attributes
+    ----------
+    path
+    index
+
+    Methods
+    -------
+    __setitem__
+    __getitem__
+    __delitem__
+    __iter__
+    __len__
+    __repr__
+    array
+    write
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'store')
+    >>> DatasetStore.write(path, {'a': [[1, 2], [3, 4]]})
+    >>> store = DatasetStore(path)
+    >>> list(store)
+    ['a']
+    >>> store['a']
+    {1.0: 2.0, 3.0: 4.0}
+    >>> store.array('a')
+    array([[ 1.,  2.],
+           [ 3.,  4.]])
+    >>> store['b'] = {5.0: 6.0}
+    >>> sorted(store)
+    ['a', 'b']
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._index = None
+        self._data = None
+        self._overlay = {}
+        self._deleted = set()
+
+    @property
+    def path(self):
+        """
+        Getter property for the store path.
+
+        Returns
+        -------
+        unicode
+            Store path.
+        """
+
+        return self._path
+
+    @property
+    def index(self):
+        """
+        Getter property for the store index, read on first access.
+
+        Returns
+        -------
+        OrderedDict
+            Datasets offset and shape, keyed by name.
+        """
+
+        if self._index is None:
+            with codecs.open(
+                    self._path + '.json', encoding='utf-8') as json_file:
+                self._index = OrderedDict(
+                    (name, (offset, tuple(shape)))
+                    for name, offset, shape in json.load(json_file))
+
+        return self._index
+
+    def __setitem__(self, item, value):
+        """
+        Sets given dataset in the overlay, the store files are not modified.
+
+        Parameters
+        ----------
+        item : unicode
+            Dataset name.
+        value : object
+            Dataset.
+        """
+
+        self._overlay[item] = value
+        self._deleted.discard(item)
+
+    def __getitem__(self, item):
+        """
+        Returns the dataset with given name as a *dict*, built from the store
+        on first access.
+
+        Parameters
+        ----------
+        item : unicode
+            Dataset name.
+
+        Returns
+        -------
+        dict
+            Dataset keys and values.
+        """
+
+        if item in self._overlay:
+            return self._overlay[item]
+
+        if item in self._deleted:
+            raise KeyError(item)
+
+        data = self.array(item)
+
+        keys = data[:, 0].tolist()
+        if data.shape[1] == 2:
+            values = data[:, 1].tolist()
+        else:
+            values = [tuple(value) for value in data[:, 1:].tolist()]
+
+        value = self._overlay[item] = dict(zip(keys, values))
+
+        return value
+
+    def __delitem__(self, item):
+        """
+        Deletes the dataset with given name, the store files are not
+        modified.
+
+        Parameters
+        ----------
+        item : unicode
+            Dataset name.
+        """
+
+        if item not in self:
+            raise KeyError(item)
+
+        self._overlay.pop(item, None)
+        if item in self.index:
+            self._deleted.add(item)
+
+    def __iter__(self):
+        """
+        Iterates over the datasets names in the store order followed by the
+        names of the datasets set with the mapping.
+
+        Returns
+        -------
+        generator
+            Datasets names iterator.
+        """
+
+        for item in self.index:
+            if item not in self._deleted:
+                yield item
+
+        for item in self._overlay:
+            if item not in self.index:
+                yield item
+
+    def __len__(self):
+        """
+        Returns the datasets count.
+
+        Returns
+        -------
+        int
+            Datasets count.
+        """
+
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        """
+        Returns the store representation.
+
+        Returns
+        -------
+        unicode
+            Store representation.
+        """
+
+        return '{0}({1!r})'.format(self.__class__.__name__, self._path)
+
+    def array(self, name):
+        """
+        Returns the stored dataset with given name as an *ndarray*, the
+        overlay being ignored.
+
+        Parameters
+        ----------
+        name : unicode
+            Dataset name.
+
+        Returns
+        -------
+        ndarray
+            Dataset, a copy of the memory-mapped store data.
+        """
+
+        offset, shape = self.index[name]
+
+        if self._data is None:
+            self._data = np.load(self._path + '.npy', mmap_mode='r')
+
+        return np.array(
+            self._data[offset:offset + int(np.prod(shape))]).reshape(shape)
+
+    @staticmethod
+    def write(path, data):
+        """
+        Writes given datasets to a binary store at given path.
+
+        Parameters
+        ----------
+        path : unicode
+            Store path without extension.
+        data : dict
+            Datasets to write, keyed by name, in the store order, each one
+            being a 2D array whose first column holds the keys.
+        """
+
+        index, arrays, offset = [], [], 0
+        for name, value in data.items():
+            value = np.asarray(value, dtype=np.float64)
+            index.append([name, offset, list(value.shape)])
+            arrays.append(np.ravel(value))
+            offset += value.size
+
+        np.save(path + '.npy', np.concatenate(arrays))
+        with codecs.open(path + '.json', 'w', encoding='utf-8') as json_file:
+            json.dump(index, json_file, indent=4, separators=(',', ': '))
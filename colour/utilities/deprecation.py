@@ -196,6 +196,12 @@ class ModuleAPI(object):
     ----------
     module : module
         Module to customise attributes access.
+    changes : dict, optional
+        Mapping of attribute names to their API changes.
+    lazy : dict, optional
+        Mapping of attribute names to the modules they are imported from on
+        first access. An attribute whose name matches the module name, e.g.
+        *appearance* for *colour.appearance*, resolves to the module itself.
 
     Methods
     -------
@@ -210,13 +216,15 @@ class ModuleAPI(object):
     ... # doctest: +SKIP
     """
 
-    def __init__(self, module, changes=None):
+    def __init__(self, module, changes=None, lazy=None):
         self._module = module
         self._changes = changes or {}
+        self._lazy = lazy or {}
 
     def __getattr__(self, attribute):
         """
-        Returns given attribute value while handling deprecation.
+        Returns given attribute value while handling deprecation and lazy
+        imports.
 
         Parameters
         ----------
@@ -242,12 +250,26 @@ class ModuleAPI(object):
             else:
                 raise AttributeError(str(change))
 
-        return getattr(self._module, attribute)
+        try:
+            return getattr(self._module, attribute)
+        except AttributeError:
+            if attribute not in self._lazy:
+                raise
+
+        module = import_module(self._lazy[attribute])
+        if module.__name__.split('.')[-1] == attribute:
+            value = module
+        else:
+            value = getattr(module, attribute)
+
+        setattr(self._module, attribute, value)
+
+        return value
 
     def __dir__(self):
         """
-        Returns list of names in the module local scope filtered according to
-        the changes.
+        Returns list of names in the module local scope, including the lazily
+        imported ones, filtered according to the changes.
 
         Returns
         -------
@@ -256,7 +278,8 @@ class ModuleAPI(object):
         """
 
         attributes = [
-            attribute for attribute in dir(self._module)
+            attribute
+            for attribute in set(dir(self._module)) | set(self._lazy)
             if attribute not in self._changes
         ]
 
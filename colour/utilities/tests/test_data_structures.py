@@ -6,10 +6,17 @@ Defines unit tests for :mod:`colour.utilities.data_structures` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
 import pickle
+import shutil
+import subprocess
+import sys
+import tempfile
 import unittest
+from collections import OrderedDict
 
-from colour.utilities import Structure, Lookup, CaseInsensitiveMapping
+from colour.utilities import (Structure, Lookup, CaseInsensitiveMapping,
+                              LazyCaseInsensitiveMapping, DatasetStore)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -18,7 +25,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestStructure', 'TestLookup', 'TestCaseInsensitiveMapping']
+__all__ = [
+    'TestStructure', 'TestLookup', 'TestCaseInsensitiveMapping',
+    'TestLazyCaseInsensitiveMapping', 'TestDatasetStore'
+]
 
 
 class TestStructure(unittest.TestCase):
@@ -277,5 +287,287 @@ CaseInsensitiveMapping.lower_items` method.
             [('jane', 'Doe'), ('john', 'Doe')])
 
 
+class TestLazyCaseInsensitiveMapping(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping` class unit tests methods.
+    """
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__getitem__', 'update', 'copy', 'lower_items')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LazyCaseInsensitiveMapping))
+
+    def test__getitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.__getitem__` method.
+        """
+
+        calls = []
+
+        def factory():
+            calls.append(None)
+
+            return 'Doe'
+
+        mapping = LazyCaseInsensitiveMapping(John=factory, Jane='Doe')
+
+        self.assertEqual(len(calls), 0)
+        self.assertEqual(mapping['John'], 'Doe')
+        self.assertEqual(mapping['john'], 'Doe')
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(mapping['Jane'], 'Doe')
+        self.assertListEqual(sorted(mapping), ['Jane', 'John'])
+
+    def test_update(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.update` method.
+        """
+
+        mapping1 = LazyCaseInsensitiveMapping(John=lambda: ['Doe'])
+        mapping2 = LazyCaseInsensitiveMapping(mapping1)
+        mapping2.update(Jane='Doe')
+
+        self.assertTrue(callable(mapping1.data['john'][1]))
+        self.assertIs(mapping2['John'], mapping1['John'])
+
+        mapping3 = mapping1.copy()
+        self.assertIsInstance(mapping3, LazyCaseInsensitiveMapping)
+        self.assertIs(mapping3['John'], mapping1['John'])
+
+    def test_lower_items(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.lower_items` method.
+        """
+
+        mapping = LazyCaseInsensitiveMapping(John=lambda: 'Doe', Jane='Doe')
+
+        self.assertListEqual(
+            sorted([item for item in mapping.lower_items()]),
+            [('jane', 'Doe'), ('john', 'Doe')])
+        self.assertEqual(mapping, {'JOHN': 'Doe', 'JANE': 'Doe'})
+
+    def test_datasets_import_budget(self):
+        """
+        Tests that importing *Colour* evaluates only a small fraction of the
+        :class:`colour.utilities.data_structures.LazyCaseInsensitiveMapping`
+        class instances spectral datasets.
+        """
+
+        code = """
+import colour
+from colour.colorimetry.dataset.cmfs import (LMS_CMFS, RGB_CMFS,
+                                             STANDARD_OBSERVERS_CMFS)
+from colour.colorimetry.dataset.illuminants.sds import ILLUMINANTS_SDS
+from colour.colorimetry.dataset.light_sources.sds import (
+    LIGHT_SOURCES_RIT_SDS, LIGHT_SOURCES_NIST_TRADITIONAL_SDS,
+    LIGHT_SOURCES_NIST_LED_SDS, LIGHT_SOURCES_NIST_PHILIPS_SDS,
+    LIGHT_SOURCES_PROJECTORS_SDS)
+from colour.quality.dataset.tcs import TCS_SDS
+from colour.quality.dataset.vs import VS_SDS
+
+values = [
+    value for mapping in (
+        LMS_CMFS, RGB_CMFS, STANDARD_OBSERVERS_CMFS, ILLUMINANTS_SDS,
+        LIGHT_SOURCES_RIT_SDS, LIGHT_SOURCES_NIST_TRADITIONAL_SDS,
+        LIGHT_SOURCES_NIST_LED_SDS, LIGHT_SOURCES_NIST_PHILIPS_SDS,
+        LIGHT_SOURCES_PROJECTORS_SDS, TCS_SDS, VS_SDS)
+    for _name, value in mapping.data.values()
+]
+print(len([value for value in values if not callable(value)]), len(values))
+"""
+
+        evaluated, count = [
+            int(value) for value in subprocess.check_output(
+                [sys.executable, '-c', code]).split()[-2:]
+        ]
+
+        self.assertLess(evaluated, count / 4)
+
+
+class TestDatasetStore(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.data_structures.DatasetStore` class unit
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+        self._path = os.path.join(self._temporary_directory, 'store')
+
+        self._data = OrderedDict((
+            ('John', np.array([[400, 0.1], [410, 0.2], [420, 0.3]])),
+            ('Jane', np.array([[400, 1, 2, 3], [410, 4, 5, 6]])),
+        ))
+        DatasetStore.write(self._path, self._data)
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('path', 'index')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(DatasetStore))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__setitem__', '__getitem__', '__delitem__',
+                            '__iter__', '__len__', '__repr__', 'array',
+                            'write')
+
+        for method in required_methods:
+            self.assertIn(method, dir(DatasetStore))
+
+    def test_index(self):
+        """
+        Tests :attr:`colour.utilities.data_structures.DatasetStore.index`
+        property.
+        """
+
+        store = DatasetStore(self._path)
+
+        self.assertListEqual(list(store.index), ['John', 'Jane'])
+        self.assertTupleEqual(store.index['John'], (0, (3, 2)))
+        self.assertTupleEqual(store.index['Jane'], (6, (2, 4)))
+
+    def test__getitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.DatasetStore.__getitem__`
+        method.
+        """
+
+        store = DatasetStore(self._path)
+
+        self.assertDictEqual(store['John'], {400: 0.1, 410: 0.2, 420: 0.3})
+        self.assertDictEqual(store['Jane'], {400: (1, 2, 3), 410: (4, 5, 6)})
+
+        # The datasets are modified in place as with a "dict" object.
+        store['John'][430] = 0.4
+        self.assertEqual(store['John'][430], 0.4)
+        np.testing.assert_equal(store.array('John'), self._data['John'])
+
+        self.assertRaises(KeyError, lambda: store['Unknown'])
+
+    def test__setitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.DatasetStore.__setitem__`
+        method.
+        """
+
+        store = DatasetStore(self._path)
+
+        store['Jack'] = {400: 0.5}
+        self.assertDictEqual(store['Jack'], {400: 0.5})
+        self.assertListEqual(list(store), ['John', 'Jane', 'Jack'])
+
+        store['John'] = {400: 0.5}
+        self.assertDictEqual(store['John'], {400: 0.5})
+        self.assertEqual(len(store), 3)
+
+        self.assertListEqual(list(DatasetStore(self._path)), ['John', 'Jane'])
+
+    def test__delitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.DatasetStore.__delitem__`
+        method.
+        """
+
+        store = DatasetStore(self._path)
+
+        del store['John']
+        self.assertNotIn('John', store)
+        self.assertListEqual(list(store), ['Jane'])
+        self.assertRaises(KeyError, lambda: store['John'])
+
+        store['John'] = {400: 0.5}
+        self.assertDictEqual(store['John'], {400: 0.5})
+
+        with self.assertRaises(KeyError):
+            del store['Unknown']
+
+    def test_array(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.DatasetStore.array`
+        method.
+        """
+
+        store = DatasetStore(self._path)
+
+        for name, value in self._data.items():
+            np.testing.assert_equal(store.array(name), value)
+
+        data = store.array('John')
+        data *= 2
+        np.testing.assert_equal(store.array('John'), self._data['John'])
+
+        self.assertRaises(KeyError, lambda: store.array('Unknown'))
+
+    def test__iter__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.DatasetStore.__iter__`
+        method.
+        """
+
+        self.assertListEqual(list(DatasetStore(self._path)), ['John', 'Jane'])
+
+    def test__len__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.DatasetStore.__len__`
+        method.
+        """
+
+        self.assertEqual(len(DatasetStore(self._path)), 2)
+
+    def test_bundled_datasets(self):
+        """
+        Tests the bundled dataset stores consistency.
+        """
+
+        from colour.colorimetry import ILLUMINANTS_SDS, STANDARD_OBSERVERS_CMFS
+        from colour.colorimetry.dataset.illuminants.sds import (
+            ILLUMINANTS_SDS_DATA)
+
+        from colour.colorimetry.dataset.cmfs import (
+            STANDARD_OBSERVERS_CMFS_DATA)
+
+        self.assertIn('D65', list(ILLUMINANTS_SDS_DATA))
+        self.assertAlmostEqual(ILLUMINANTS_SDS_DATA['D65'][560], 100.0)
+        self.assertAlmostEqual(ILLUMINANTS_SDS['D65'][560], 100.0, places=7)
+
+        np.testing.assert_almost_equal(
+            STANDARD_OBSERVERS_CMFS_DATA[
+                'CIE 1931 2 Degree Standard Observer'][555],
+            (0.5120501, 1.0000000, 0.0057500),
+            decimal=7)
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        np.testing.assert_almost_equal(
+            cmfs[555], np.array([0.5120501, 1.0000000, 0.0057500]), decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -5,9 +5,12 @@ Defines unit tests for :mod:`colour.utilities.deprecation` module.
 
 from __future__ import division, unicode_literals
 
+import subprocess
+import sys
 import unittest
+from types import ModuleType
 
-from colour.utilities.deprecation import get_attribute
+from colour.utilities.deprecation import ModuleAPI, Removed, get_attribute
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -16,7 +19,86 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestGetAttribute']
+__all__ = ['TestModuleAPI', 'TestGetAttribute']
+
+
+class TestModuleAPI(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.deprecation.ModuleAPI` class unit tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('_module', '_changes', '_lazy')
+
+        module_api = ModuleAPI(ModuleType('module'))
+        for attribute in required_attributes:
+            self.assertIn(attribute, module_api.__dict__)
+
+    def test__getattr__(self):
+        """
+        Tests :func:`colour.utilities.deprecation.ModuleAPI.__getattr__`
+        method.
+        """
+
+        from colour.utilities import array
+        from colour.utilities.array import as_numeric
+
+        module = ModuleType('module')
+        module.a = 1
+        module_api = ModuleAPI(
+            module, {'b': Removed('module.b')}, {
+                'as_numeric': 'colour.utilities.array',
+                'array': 'colour.utilities.array',
+            })
+
+        self.assertEqual(module_api.a, 1)
+        self.assertRaises(AttributeError, lambda: module_api.b)
+        self.assertRaises(AttributeError, lambda: module_api.c)
+
+        self.assertIs(module_api.as_numeric, as_numeric)
+        self.assertIs(module.as_numeric, as_numeric)
+        self.assertIs(module_api.array, array)
+
+    def test__dir__(self):
+        """
+        Tests :func:`colour.utilities.deprecation.ModuleAPI.__dir__` method.
+        """
+
+        module = ModuleType('module')
+        module.a = 1
+        module.b = 2
+        module_api = ModuleAPI(module, {'b': Removed('module.b')},
+                               {'as_numeric': 'colour.utilities.array'})
+
+        attributes = dir(module_api)
+        self.assertIn('a', attributes)
+        self.assertNotIn('b', attributes)
+        self.assertIn('as_numeric', attributes)
+
+    def test_colour_lazy_imports(self):
+        """
+        Tests that importing :mod:`colour` defers the import of its heavy
+        sub-packages until one of their objects is accessed.
+        """
+
+        code = '\n'.join([
+            'import sys',
+            'import colour',
+            'assert "colour.appearance" not in sys.modules',
+            'assert "colour.volume" not in sys.modules',
+            'assert "XYZ_to_CIECAM02" in dir(colour)',
+            'from colour import XYZ_to_CIECAM02',
+            'from colour.appearance import XYZ_to_CIECAM02 as function',
+            'assert XYZ_to_CIECAM02 is function',
+            'assert colour.volume is sys.modules["colour.volume"]',
+        ])
+
+        self.assertEqual(subprocess.call([sys.executable, '-c', code]), 0)
 
 
 class TestGetAttribute(unittest.TestCase):
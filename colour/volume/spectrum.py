@@ -194,7 +194,7 @@ def XYZ_outer_surface(
 
     """
 
-    key = (interval, hash(cmfs), hash(illuminant))
+    key = (interval, cmfs.fingerprint, illuminant.fingerprint)
     XYZ = _XYZ_OUTER_SURFACE_CACHE.get(key)
     if XYZ is None:
         wavelengths = SpectralShape(DEFAULT_SPECTRAL_SHAPE.start,
@@ -266,7 +266,7 @@ def is_within_visible_spectrum(
     array([ True, False], dtype=bool)
     """
 
-    key = (interval, hash(cmfs), hash(illuminant))
+    key = (interval, cmfs.fingerprint, illuminant.fingerprint)
     vertices = _XYZ_OUTER_SURFACE_POINTS_CACHE.get(key)
     if vertices is None:
         _XYZ_OUTER_SURFACE_POINTS_CACHE[key] = vertices = (XYZ_outer_surface(
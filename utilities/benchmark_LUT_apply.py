@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark LUT Apply
+===================
+
+Benchmarks the :meth:`colour.LUT3D.apply` and :meth:`colour.LUTSequence.apply`
+methods, processing the whole *RGB* colourspace array at once and by tiles
+with an increasing count of threads, on *HD* and *UHD* frames.
+
+The tiles being processed concurrently, the timings depend on the count of
+processors available, which is reported first.
+
+Usage::
+
+    python utilities/benchmark_LUT_apply.py [rows_per_tile]
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import multiprocessing
+import numpy as np
+import sys
+import timeit
+
+from colour.io import LUT1D, LUT3D, LUTSequence
+
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['SHAPES', 'thread_counts', 'benchmark_LUT_apply']
+
+SHAPES = ((256, 256), (1080, 1920), (2160, 3840))
+"""
+Frame shapes the *LUT* are applied onto.
+
+SHAPES : tuple
+"""
+
+
+def thread_counts():
+    """
+    Returns the thread counts to benchmark, i.e. the powers of 2 up to the
+    processors count and the processors count.
+
+    Returns
+    -------
+    list
+        Thread counts to benchmark.
+    """
+
+    processors = multiprocessing.cpu_count()
+
+    counts = [1]
+    while counts[-1] * 2 < processors:
+        counts.append(counts[-1] * 2)
+
+    if counts[-1] != processors:
+        counts.append(processors)
+
+    return counts
+
+
+def benchmark_LUT_apply(rows_per_tile=16, size=33, repeat=5):
+    """
+    Benchmarks the *LUT* application on the frame shapes with a table of given
+    size.
+
+    Parameters
+    ----------
+    rows_per_tile : int, optional
+        Count of frame rows per tile.
+    size : int, optional
+        :class:`colour.LUT3D` class instance table size.
+    repeat : int, optional
+        Execution count, the best timings are reported.
+    """
+
+    print('Processors: {0}'.format(multiprocessing.cpu_count()))
+
+    LUT = LUT3D(LUT3D.linear_table(size) ** (1 / 2.2))
+    LUT_sequence = LUTSequence(
+        LUT1D(LUT1D.linear_table(4096) ** 2.2), LUT,
+        LUT1D(LUT1D.linear_table(1024) * 0.75))
+
+    prng = np.random.RandomState(4)
+    for shape in SHAPES:
+        RGB = prng.random_sample(shape + (3, ))
+        tile_size = rows_per_tile * shape[1]
+
+        for name, apply in (('LUT3D', LUT.apply),
+                            ('LUTSequence', LUT_sequence.apply)):
+            print('{0} - {1}x{2} - {3} rows tiles'.format(
+                name, shape[1], shape[0], rows_per_tile))
+
+            timing = min(
+                timeit.repeat(lambda: apply(RGB), number=1, repeat=repeat))
+            print('\tWhole array: {0:.4f}s'.format(timing))
+
+            for threads in thread_counts():
+                timing = min(
+                    timeit.repeat(
+                        lambda: apply(RGB, tile_size=tile_size,
+                                      threads=threads),
+                        number=1,
+                        repeat=repeat))
+                print('\t{0} thread(s): {1:.4f}s'.format(threads, timing))
+
+
+if __name__ == '__main__':
+    benchmark_LUT_apply(*[int(argument) for argument in sys.argv[1:]])
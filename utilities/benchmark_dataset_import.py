@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark Dataset Import
+========================
+
+Benchmarks the import time and resident memory of :mod:`colour` and of its
+bundled spectral dataset modules, optionally comparing various source trees,
+e.g. a previous release checkout.
+
+Each measurement is performed in a new interpreter so that the modules are
+actually imported, the modules import times are given by the ``-X importtime``
+option thus *Python* 3.7 or above is required, and the resident memory is
+given by :mod:`resource` module thus a *Unix* platform is required.
+
+Usage::
+
+    python utilities/benchmark_dataset_import.py [source_tree ...]
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import json
+import os
+import subprocess
+import sys
+
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'DATASET_MODULES', 'IMPORT_STATEMENT', 'benchmark_import',
+    'benchmark_dataset_import'
+]
+
+DATASET_MODULES = (
+    'colour.colorimetry.dataset.cmfs',
+    'colour.colorimetry.dataset.illuminants.sds',
+    'colour.colorimetry.dataset.light_sources.sds',
+)
+"""
+Bundled spectral dataset modules whose import time is reported.
+
+DATASET_MODULES : tuple
+"""
+
+IMPORT_STATEMENT = """
+import json
+import resource
+import time
+
+start = time.time()
+import colour
+import_time = time.time() - start
+import_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+start = time.time()
+colour.CMFS['CIE 2012 10 Degree Standard Observer']
+colour.LIGHT_SOURCES_SDS['Cool White FL']
+access_time = time.time() - start
+
+print(json.dumps([import_time, import_rss, access_time]))
+"""
+"""
+Statement executed by the benchmarking interpreters, importing :mod:`colour`
+and accessing colour matching functions and a light source that are not
+already used at import time.
+
+IMPORT_STATEMENT : unicode
+"""
+
+
+def benchmark_import(source_tree):
+    """
+    Imports :mod:`colour` from given source tree in a new interpreter and
+    returns the import time, the maximum resident memory after import, the
+    bundled spectral dataset modules cumulative import time and the first
+    dataset access time.
+
+    Parameters
+    ----------
+    source_tree : unicode
+        Source tree containing the :mod:`colour` package.
+
+    Returns
+    -------
+    tuple
+        Import time in seconds, maximum resident memory in kibibytes, bundled
+        spectral dataset modules import time in seconds and first dataset
+        access time in seconds.
+    """
+
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(
+        [source_tree] + [path for path in (
+            environment.get('PYTHONPATH'), ) if path])
+
+    # The interpreter is started in the source tree as "-c" prepends the
+    # current directory to "sys.path".
+    process = subprocess.Popen(
+        [sys.executable, '-W', 'ignore', '-X', 'importtime', '-c',
+         IMPORT_STATEMENT],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=source_tree,
+        env=environment)
+    stdout, stderr = process.communicate()
+
+    assert process.returncode == 0, stderr.decode('utf-8')
+
+    import_time, import_rss, access_time = json.loads(stdout.decode('utf-8'))
+
+    # "-X importtime" lines are "import time: self [us] | cumulative | name".
+    datasets_time = 0
+    for line in stderr.decode('utf-8').splitlines():
+        fields = [field.strip() for field in line.split('|')]
+        if len(fields) == 3 and fields[2] in DATASET_MODULES:
+            datasets_time += int(fields[1]) / 1e6
+
+    return import_time, import_rss, datasets_time, access_time
+
+
+def benchmark_dataset_import(source_trees=None, repeat=5):
+    """
+    Benchmarks the import of :mod:`colour` from given source trees.
+
+    Parameters
+    ----------
+    source_trees : array_like, optional
+        Source trees containing the :mod:`colour` package, default to the
+        source tree containing this benchmark.
+    repeat : int, optional
+        Execution count, the best timings and memory are reported.
+    """
+
+    if not source_trees:
+        source_trees = [os.path.dirname(os.path.dirname(__file__)) or '..']
+
+    for source_tree in source_trees:
+        results = [benchmark_import(source_tree) for _ in range(repeat)]
+        import_time, import_rss, datasets_time, access_time = [
+            min(result) for result in zip(*results)
+        ]
+
+        print(os.path.abspath(source_tree))
+        print('\t"colour" import: {0:.3f}s, {1:.1f} MiB maximum RSS'.format(
+            import_time, import_rss / 1024))
+        print('\tDataset modules import: {0:.4f}s'.format(datasets_time))
+        print('\tFirst datasets access: {0:.4f}s'.format(access_time))
+
+
+if __name__ == '__main__':
+    benchmark_dataset_import(sys.argv[1:])
@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark Table Interpolation
+=============================
+
+Benchmarks the :func:`colour.algebra.table_interpolation_trilinear` and
+:func:`colour.algebra.table_interpolation_tetrahedral` definitions against
+their reference implementations gathering the 8 encompassing vertices of
+every :math:`V_{xyz}` value, on *UHD* frames.
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import numpy as np
+import timeit
+
+from colour.algebra import (table_interpolation_tetrahedral,
+                            table_interpolation_trilinear)
+from colour.algebra.interpolation import vertices_and_relative_coordinates
+from colour.io import LUT3D
+from colour.utilities import tsplit
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'table_interpolation_trilinear_reference',
+    'table_interpolation_tetrahedral_reference', 'benchmark',
+    'benchmark_table_interpolation'
+]
+
+
+def table_interpolation_trilinear_reference(V_xyz, table):
+    """
+    Performs trilinear interpolation of given :math:`V_{xyz}` values using
+    given interpolation table by weighting the 8 encompassing vertices.
+
+    Parameters
+    ----------
+    V_xyz : array_like
+        :math:`V_{xyz}` values to interpolate.
+    table : array_like
+        4-Dimensional (NxNxNx3) interpolation table.
+
+    Returns
+    -------
+    ndarray
+        Interpolated :math:`V_{xyz}` values.
+    """
+
+    V_xyz = np.asarray(V_xyz)
+
+    vertices, V_xyzr = vertices_and_relative_coordinates(V_xyz, table)
+
+    vertices = np.moveaxis(vertices, 0, 1)
+    x, y, z = [f[:, np.newaxis] for f in tsplit(V_xyzr)]
+
+    weights = np.moveaxis(
+        np.transpose([(1 - x) * (1 - y) * (1 - z), (1 - x) * (1 - y) * z,
+                      (1 - x) * y * (1 - z), (1 - x) * y * z, x * (1 - y) *
+                      (1 - z), x * (1 - y) * z, x * y * (1 - z), x * y * z]),
+        0, -1)
+
+    return np.reshape(np.sum(vertices * weights, 1), V_xyz.shape)
+
+
+def table_interpolation_tetrahedral_reference(V_xyz, table):
+    """
+    Performs tetrahedral interpolation of given :math:`V_{xyz}` values using
+    given interpolation table by evaluating the 6 tetrahedra.
+
+    Parameters
+    ----------
+    V_xyz : array_like
+        :math:`V_{xyz}` values to interpolate.
+    table : array_like
+        4-Dimensional (NxNxNx3) interpolation table.
+
+    Returns
+    -------
+    ndarray
+        Interpolated :math:`V_{xyz}` values.
+    """
+
+    V_xyz = np.asarray(V_xyz)
+
+    vertices, V_xyzr = vertices_and_relative_coordinates(V_xyz, table)
+
+    vertices = np.moveaxis(vertices, 0, -1)
+    V000, V001, V010, V011, V100, V101, V110, V111 = tsplit(vertices)
+    x, y, z = [r[:, np.newaxis] for r in tsplit(V_xyzr)]
+
+    xyz_o = np.select([
+        np.logical_and(x > y, y > z),
+        np.logical_and(x > y, x > z),
+        np.logical_and(x > y, np.logical_and(y <= z, x <= z)),
+        np.logical_and(x <= y, z > y),
+        np.logical_and(x <= y, z > x),
+        np.logical_and(x <= y, np.logical_and(z <= y, z <= x)),
+    ], [
+        (1 - x) * V000 + (x - y) * V100 + (y - z) * V110 + z * V111,
+        (1 - x) * V000 + (x - z) * V100 + (z - y) * V101 + y * V111,
+        (1 - z) * V000 + (z - x) * V001 + (x - y) * V101 + y * V111,
+        (1 - z) * V000 + (z - y) * V001 + (y - x) * V011 + x * V111,
+        (1 - y) * V000 + (y - z) * V010 + (z - x) * V011 + x * V111,
+        (1 - y) * V000 + (y - x) * V010 + (x - z) * V110 + z * V111,
+    ])
+
+    return np.reshape(xyz_o, V_xyz.shape)
+
+
+def benchmark(function, repeat=3):
+    """
+    Returns the best execution time in seconds of given function and its
+    peak traced memory allocation in bytes if :mod:`tracemalloc` is
+    available.
+
+    Parameters
+    ----------
+    function : callable
+        Function to benchmark.
+    repeat : int, optional
+        Execution count.
+
+    Returns
+    -------
+    tuple
+        Best execution time and peak traced memory allocation.
+    """
+
+    timing = min(timeit.repeat(function, number=1, repeat=repeat))
+
+    peak = None
+    if tracemalloc is not None:
+        tracemalloc.start()
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return timing, peak
+
+
+def benchmark_table_interpolation(size=33, shape=(2160, 3840), repeat=3):
+    """
+    Benchmarks the table interpolation definitions on given frame shape with
+    a table of given size.
+
+    Parameters
+    ----------
+    size : int, optional
+        Interpolation table size.
+    shape : tuple, optional
+        Frame shape.
+    repeat : int, optional
+        Execution count.
+    """
+
+    table = LUT3D.linear_table(size) ** (1 / 2.2)
+    prng = np.random.RandomState(4)
+    RGB = prng.random_sample(shape + (3, ))
+    RGB_32 = RGB.astype(np.float32)
+    out = np.empty_like(RGB_32)
+
+    for name, reference, function in (
+        ('Trilinear', table_interpolation_trilinear_reference,
+         table_interpolation_trilinear),
+        ('Tetrahedral', table_interpolation_tetrahedral_reference,
+         table_interpolation_tetrahedral),
+    ):
+        print('{0} - {1}x{2} - {3}^3 table'.format(
+            name, shape[1], shape[0], size))
+
+        error = np.max(
+            np.abs(reference(RGB, table) - function(RGB, table)))
+        print('\tMaximum absolute error: {0:.3e}'.format(error))
+
+        for label, callable_ in (
+            ('Reference', lambda: reference(RGB, table)),
+            ('Float64', lambda: function(RGB, table)),
+            ('Float32 - out',
+             lambda: function(RGB_32, table, dtype=np.float32, out=out)),
+        ):
+            timing, peak = benchmark(callable_, repeat)
+            print('\t{0}: {1:.3f}s{2}'.format(
+                label, timing, '' if peak is None else
+                ', {0:.0f} MiB peak'.format(peak / 1024 ** 2)))
+
+
+if __name__ == '__main__':
+    benchmark_table_interpolation()